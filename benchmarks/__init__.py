@@ -0,0 +1 @@
+# Performance benchmarks (run from the repo root: python -m benchmarks.<name>)
@@ -0,0 +1,141 @@
+"""
+Attempt Store Benchmark
+
+Drives infrastructure.attempt_store.AttemptStore with concurrent producer
+threads (like sessions submitting exams) against a fresh database in a
+temporary directory and reports, for batched writes and for one transaction
+per attempt (--compare-batch-size, default: 1):
+
+- submissions/s: attempts submitted until all of them are on disk, divided by
+  that wall time (sustained write throughput)
+- submit p50/p99: time a session spends in submit(), i.e. what a rerun waits
+- avg batch: attempts per transaction
+
+followed by the latency of the "latest attempt" lookups on the filled
+database.
+
+Usage (from the repo root):
+    python -m benchmarks.attempt_store [--attempts 20000] [--producers 8]
+        [--learners 1000] [--batch-size 500] [--compare-batch-size 1]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from typing import Dict, List
+
+from infrastructure.attempt_store import Attempt, AttemptStore
+
+EXAMS = ["mock1", "mock2", "pb_quiz"]
+
+
+def make_attempts(count: int, learners: int, seed: int = 1) -> List[Attempt]:
+    """Attempts with answers shaped like mock exam answer sheets (bitmasks)."""
+    rng = random.Random(seed)
+    return [
+        Attempt(
+            learner=f"learner-{rng.randrange(learners)}",
+            exam=rng.choice(EXAMS),
+            correct=rng.randrange(6),
+            total=5,
+            answers={qid: rng.randrange(1, 64) for qid in range(1, 6)},
+            exam_version="bench",
+        )
+        for _ in range(count)
+    ]
+
+
+def run_writes(store: AttemptStore, attempts: List[Attempt], producers: int) -> Dict[str, float]:
+    """Submit attempts from producer threads and wait until all are written."""
+    latencies: List[float] = []
+    lock = threading.Lock()
+    chunks = [attempts[i::producers] for i in range(producers)]
+
+    def produce(chunk: List[Attempt]):
+        own = []
+        for attempt in chunk:
+            start = time.perf_counter()
+            store.submit(attempt)
+            own.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(own)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=produce, args=(chunk,)) for chunk in chunks]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store.flush()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    stats = store.stats()
+    return {
+        "per_s": len(attempts) / elapsed,
+        "seconds": elapsed,
+        "submit_p50_us": statistics.median(latencies) * 1e6,
+        "submit_p99_us": latencies[int(0.99 * (len(latencies) - 1))] * 1e6,
+        "avg_batch": stats.get("avg_batch", 0.0),
+        "failed": stats["failed"],
+    }
+
+
+def time_queries(store: AttemptStore, learners: int, repeat: int = 200) -> Dict[str, float]:
+    """Median latency of the latest-attempt lookups in ms."""
+    rng = random.Random(2)
+    latest = []
+    for _ in range(repeat):
+        learner, exam = f"learner-{rng.randrange(learners)}", rng.choice(EXAMS)
+        start = time.perf_counter()
+        store.latest(learner, exam)
+        latest.append(time.perf_counter() - start)
+    per_learner = []
+    for exam in EXAMS:
+        start = time.perf_counter()
+        store.latest_per_learner(exam)
+        per_learner.append(time.perf_counter() - start)
+    return {
+        "latest_ms": statistics.median(latest) * 1000,
+        "latest_per_learner_ms": statistics.median(per_learner) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--attempts", type=int, default=20000, help="attempts submitted per run")
+    parser.add_argument("--producers", type=int, default=8, help="concurrent submitting threads")
+    parser.add_argument("--learners", type=int, default=1000, help="distinct learner ids")
+    parser.add_argument("--batch-size", type=int, default=500, help="max attempts per transaction")
+    parser.add_argument("--compare-batch-size", type=int, default=1,
+                        help="batch size of the comparison run (0 to skip)")
+    args = parser.parse_args()
+
+    attempts = make_attempts(args.attempts, args.learners)
+    runs = [("batched", args.batch_size)]
+    if args.compare_batch_size:
+        runs.append((f"batch size {args.compare_batch_size}", args.compare_batch_size))
+
+    print(f"{args.attempts} attempts from {args.producers} producers, {args.learners} learners\n")
+    print(f"{'mode':<16} {'subm/s':>9} {'total s':>8} {'submit p50 µs':>14} {'p99 µs':>8} {'avg batch':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = None
+        for name, batch_size in runs:
+            store = AttemptStore(os.path.join(tmp, f"{batch_size}.sqlite3"), batch_size=batch_size)
+            result = run_writes(store, attempts, args.producers)
+            print(f"{name:<16} {result['per_s']:>9.0f} {result['seconds']:>8.2f} "
+                  f"{result['submit_p50_us']:>14.1f} {result['submit_p99_us']:>8.1f} {result['avg_batch']:>10.1f}"
+                  + (f"  ({result['failed']} failed)" if result["failed"] else ""))
+
+        queries = time_queries(store, args.learners)
+        print(f"\nlatest attempt (learner, exam): {queries['latest_ms']:.3f} ms")
+        print(f"latest attempt per learner (one exam, {args.learners} learners): "
+              f"{queries['latest_per_learner_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
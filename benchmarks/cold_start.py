@@ -0,0 +1,102 @@
+"""
+Cold-Start Benchmark
+
+Starts a fresh interpreter with ``-X importtime``, renders the first page of
+app.py through Streamlit's AppTest harness and reports:
+
+- time-to-first-page: wall time of the first script run (app.py + page)
+- the import-time breakdown of the modules that run pulled in, by top-level
+  package (cumulative microseconds, as reported by ``-X importtime``)
+
+Streamlit itself is imported before the measurement starts, like in a running
+server. Pass --budget-ms to fail (exit code 1) when the first page is slower.
+
+Usage (from the repo root):
+    python -m benchmarks.cold_start [--page chapter-02] [--top 15] [--budget-ms 1500]
+"""
+
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from benchmarks.harness import REPO_ROOT, page_entry_script
+
+# Marker written to stderr between "server start" and the first script run
+_SENTINEL = "--- first page run ---"
+
+_PROBE = """
+import importlib, sys, time
+from streamlit.testing.v1 import AppTest
+
+# app.py loads page modules with importlib.import_module, which bypasses the
+# C import path that -X importtime instruments; __import__ goes through it.
+importlib.import_module = lambda name, package=None: __import__(name, fromlist=["_"])
+
+# Entry script that runs app.py with the page opened like a deep-link would
+at = AppTest.from_string({entry!r}, default_timeout=120)
+print({sentinel!r}, file=sys.stderr, flush=True)
+start = time.perf_counter()
+at.run()
+elapsed = time.perf_counter() - start
+if at.exception:
+    raise SystemExit(at.exception[0].message)
+print(f"TTFP {{elapsed * 1000:.1f}}")
+"""
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int]]:
+    """
+    Sum the cumulative import time per top-level package for imports that
+    happened after the sentinel.
+
+    Returns:
+        List of (package, cumulative_us), slowest first
+    """
+    lines = stderr.split(_SENTINEL, 1)[-1].splitlines()
+    totals: Dict[str, int] = defaultdict(int)
+    for line in lines:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Only count outermost imports, nested ones are part of their parent
+        if name.startswith("  "):
+            continue
+        totals[name.strip().split(".")[0]] += int(cumulative)
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def measure(page: str) -> Tuple[float, List[Tuple[str, int]]]:
+    probe = _PROBE.format(entry=page_entry_script(page), sentinel=_SENTINEL)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=False,
+    )
+    ttfp = [line for line in result.stdout.splitlines() if line.startswith("TTFP ")]
+    if result.returncode != 0 or not ttfp:
+        raise RuntimeError(f"probe failed:\n{result.stderr[-2000:]}")
+    return float(ttfp[-1].split()[1]), parse_importtime(result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page", default="", help="url path of the page to open first (default: home)")
+    parser.add_argument("--top", type=int, default=15, help="number of packages to list")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if time-to-first-page exceeds this")
+    args = parser.parse_args()
+
+    ttfp_ms, packages = measure(args.page)
+
+    print(f"Time to first page ({args.page or 'home'}): {ttfp_ms:.1f} ms")
+    print(f"\n{'package':<30} {'import ms':>10}")
+    for name, cumulative_us in packages[:args.top]:
+        print(f"{name:<30} {cumulative_us / 1000:>10.1f}")
+
+    if args.budget_ms is not None and ttfp_ms > args.budget_ms:
+        print(f"\n❌ Cold-start budget exceeded: {ttfp_ms:.1f} ms > {args.budget_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Fragment Rerun Benchmark
+
+Compares the cost of one widget interaction in each interactive exploration:
+
+- before: the interaction triggers a full rerun of the chapter's run()
+- after:  the interaction reruns only the block wrapped by interactive_fragment
+
+Both sides are measured against a real Streamlit server (one per chapter,
+running a two-line entry script for the chapter) over the websocket, like
+benchmarks.load_test: the widget change is sent once as a full-script rerun
+and once with the widget's fragment id, which is what the browser sends for
+a widget inside a fragment. Times run from sending the rerun to the
+ScriptFinished message; deltas are the elements and blocks the run sends
+to the browser.
+
+Usage (from the repo root):
+    python -m benchmarks.fragment_reruns [--repeat 5] [--port 8598]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.load_test import BrowserSession, start_server, stop_server
+
+# (chapter module, tab state key, tab label, fragment name, widget kind,
+#  widget key, widget label, new value)
+INTERACTIONS: List[Tuple[str, str, str, str, str, Optional[str], Optional[str], Any]] = [
+    ("python_basics", "pb_tabs", "🎤 I/O", "fstring_builder", "slider", "io_score", None, 42),
+    ("python_basics", "pb_tabs", "❓ If-Else", "grade_calculator", "slider", "grade_points", None, 55),
+    ("python_basics", "pb_tabs", "🔁 Schleifen", "sum_calculator", "slider", "loop_n", None, 12),
+    ("python_basics", "pb_tabs", "🎲 Zufall", "random_simulator", "slider", "coin_flips", None, 500),
+    ("computing_basics", "cb_tabs", "💡 Bits & Bytes", "rgb_mixer", "slider", None, "Rot", 10),
+    ("computing_basics", "cb_tabs", "🔢 Zahlensysteme", "binary_abacus", "checkbox", "bit_0", None, True),
+    ("computing_basics", "cb_tabs", "➕ Addierer", "adder_calculator", "number_input", "add1", None, 9),
+]
+
+
+class ChapterSession(BrowserSession):
+    """Browser session that also finds unkeyed widgets, as ``label:<label>``."""
+
+    def _track(self, delta):
+        super()._track(delta)
+        if delta.WhichOneof("type") != "new_element":
+            return
+        kind = delta.new_element.WhichOneof("type")
+        proto = getattr(delta.new_element, kind)
+        widget_id = getattr(proto, "id", "")
+        if widget_id.startswith("$$ID-") and getattr(proto, "label", ""):
+            self._widgets[f"label:{proto.label}"] = (kind, widget_id, delta.fragment_id, proto)
+
+    def initial_value(self, widget: str) -> Any:
+        kind, _, _, proto = self._widgets[widget]
+        return proto.default[0] if kind == "slider" else proto.default
+
+    async def change(self, widget: str, value: Any, fragment: bool) -> Tuple[float, int]:
+        """Send one widget change as a full or a fragment rerun; return its time and deltas."""
+        self.deltas = 0
+        reruns = len(self.latencies)
+        fragment_id = self._stage(widget, value)
+        await self._rerun(fragment_id if fragment else "")
+        if self.errors or len(self.latencies) == reruns:
+            raise RuntimeError(self.errors[0] if self.errors else f"{widget}: rerun failed")
+        return self.latencies[-1], self.deltas
+
+
+async def _measure_chapter(url: str, interactions: List[Tuple], repeat: int) -> List[Dict[str, Any]]:
+    session = ChapterSession(url)
+    await session.connect()
+    rows = []
+    try:
+        await session.run_journey([("open", "home")], 0)
+        for module, tab_key, tab_label, name, kind, key, label, value in interactions:
+            await session.run_journey([("set", tab_key, tab_label)], 0)
+            widget = key or f"label:{label}"
+            if not session._widgets[widget][2]:
+                raise RuntimeError(f"{widget} is not inside a fragment")
+            initial = session.initial_value(widget)
+            before, after = [], []
+            for _ in range(repeat):
+                # Change the value and back, so every rerun sees a new value
+                for new_value in (value, initial):
+                    before.append(await session.change(widget, new_value, fragment=False))
+                for new_value in (value, initial):
+                    after.append(await session.change(widget, new_value, fragment=True))
+            rows.append({
+                "interaction": f"{module}.{name} ({key or label})",
+                "before_ms": statistics.median(t for t, _ in before) * 1000,
+                "before_deltas": before[-1][1],
+                "after_ms": statistics.median(t for t, _ in after) * 1000,
+                "after_deltas": after[-1][1],
+            })
+    finally:
+        await session.close()
+    return rows
+
+
+def measure(repeat: int, port: int) -> List[Dict[str, Any]]:
+    rows = []
+    modules = list(dict.fromkeys(interaction[0] for interaction in INTERACTIONS))
+    with tempfile.TemporaryDirectory() as tmp:
+        for module in modules:
+            script = os.path.join(tmp, f"{module}_page.py")
+            with open(script, "w", encoding="utf-8") as f:
+                f.write(f"from chapters import {module}\n{module}.run()\n")
+            server = start_server(port, os.path.join(tmp, "attempts.sqlite3"), script)
+            try:
+                interactions = [interaction for interaction in INTERACTIONS if interaction[0] == module]
+                rows += asyncio.run(_measure_chapter(f"ws://localhost:{port}/_stcore/stream", interactions, repeat))
+            finally:
+                stop_server(server)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="value changes per interaction and side (median is reported)")
+    parser.add_argument("--port", type=int, default=8598, help="port for the local streamlit server")
+    args = parser.parse_args()
+
+    rows = measure(args.repeat, args.port)
+    print(f"{'interaction':<55} {'before ms':>10} {'deltas':>7} {'after ms':>10} {'deltas':>7}")
+    for row in rows:
+        print(f"{row['interaction']:<55} {row['before_ms']:>10.1f} {row['before_deltas']:>7} "
+              f"{row['after_ms']:>10.1f} {row['after_deltas']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Shared helpers for driving app.py headlessly with Streamlit's AppTest harness.
+"""
+
+import logging
+import os
+
+from streamlit.testing.v1 import AppTest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, "app.py")
+
+TIMEOUT = 60
+
+# Presetting session state and widget values happens between script runs,
+# which Streamlit warns about on every access
+logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").addFilter(
+    lambda record: "missing ScriptRunContext" not in record.getMessage()
+)
+
+
+def count_deltas(node) -> int:
+    """Count the elements and blocks below (and including) a tree node."""
+    children = getattr(node, "children", None)
+    if not children:
+        return 1
+    return 1 + sum(count_deltas(child) for child in children.values())
+
+
+def payload_bytes(node) -> int:
+    """Serialised size of the elements and blocks below (and including) a tree node."""
+    proto = getattr(node, "proto", None)
+    size = proto.ByteSize() if proto is not None else 0
+    children = getattr(node, "children", None) or {}
+    return size + sum(payload_bytes(child) for child in children.values())
+
+
+def page_entry_script(page_id: str = "") -> str:
+    """
+    Source of an entry script that runs app.py with ``page_id`` (a registry
+    id / url path, empty for home) as the start page, so the first run opens
+    it like a deep-link would. app.py is executed afresh on every run, as
+    Streamlit does with a main script.
+    """
+    return (f"import runpy\n"
+            f"runpy.run_path({APP_PATH!r})['main'](start_page={page_id or 'home'!r})\n")
+
+
+def app_for_page(page_id: str = "") -> AppTest:
+    """Return an AppTest for app.py that opens ``page_id`` on its first run (see page_entry_script)."""
+    return AppTest.from_string(page_entry_script(page_id), default_timeout=TIMEOUT)
+
+
+def find_widget(at: AppTest, kind: str, key: str = None, label: str = None):
+    """Find a widget of the given kind by key, or by label for unkeyed widgets."""
+    for widget in at.get(kind):
+        if (key is not None and widget.key == key) or (key is None and widget.label == label):
+            return widget
+    raise LookupError(f"{kind} key={key!r} label={label!r} not found")
@@ -0,0 +1,338 @@
+"""
+Multi-Session Load Test
+
+Starts app.py with ``streamlit run`` and drives N concurrent sessions over the
+real websocket protocol (the same BackMsg/ForwardMsg protobufs a browser
+sends), each following scripted learner journeys:
+
+- python_basics: open Python Basics, switch tabs, move the exploration sliders
+- mock_exam:     open Mock Exam 1, answer each question page, go back home
+
+For every session count the server is started fresh and the tool reports
+rerun latency (p50/p95/p99, from sending a BackMsg to the ScriptFinished
+message), throughput (reruns per second), server RSS growth per session and
+the error rate (exceptions in the page, failed or timed-out reruns). Latency
+that grows faster than the session count marks the saturation point.
+
+Widgets inside a fragment are rerun with their fragment id, and widgets inside
+a form are only staged locally (sent with the next rerun), like in a browser.
+The demo exam cannot be submitted, so the mock exam journey ends after
+answering.
+
+Usage (from the repo root):
+    python -m benchmarks.load_test [--sessions 1,5,10,25] [--repeat 3]
+        [--think-ms 100] [--port 8599]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from typing import Any, Dict, List, Optional, Tuple
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+from benchmarks.harness import APP_PATH, REPO_ROOT
+
+RERUN_TIMEOUT = 30
+STARTUP_TIMEOUT = 60
+
+# Steps: ("open", page_id), ("set", widget key, value) sends a rerun,
+# ("stage", widget key, value) only records the value (form widgets).
+# Radio/selectbox values given as int pick the option at that index.
+JOURNEYS: Dict[str, List[Tuple]] = {
+    "python_basics": [
+        ("open", "chapter-02"),
+        ("set", "pb_tabs", "🔁 Schleifen"),
+        ("set", "loop_n", 8),
+        ("set", "loop_n", 15),
+        ("set", "loop_n", 20),
+        ("set", "pb_tabs", "❓ If-Else"),
+        ("set", "grade_points", 55),
+        ("set", "grade_points", 92),
+        ("set", "pb_tabs", "🎲 Zufall"),
+        ("set", "coin_flips", 500),
+    ],
+    "mock_exam": [
+        ("open", "mock1"),
+        ("set", "mock1_1_0", True),
+        ("set", "mock1_page", 1),
+        ("set", "mock1_2_1", True),
+        ("set", "mock1_page", 2),
+        ("set", "mock1_3_0", True),
+        ("set", "mock1_page", 3),
+        ("set", "mock1_4", 1),
+        ("set", "mock1_page", 4),
+        ("set", "mock1_5_2", True),
+        ("open", "home"),
+    ],
+}
+
+_FINISHED = ForwardMsg.DESCRIPTOR.fields_by_name["script_finished"].enum_type.values_by_name
+_FINISHED_EARLY = _FINISHED["FINISHED_EARLY_FOR_RERUN"].number
+_FINISHED_OK = {_FINISHED["FINISHED_SUCCESSFULLY"].number, _FINISHED["FINISHED_FRAGMENT_RUN_SUCCESSFULLY"].number}
+
+
+# ============================================================================
+# SERVER
+# ============================================================================
+
+def start_server(port: int, attempt_db: str, script: str = APP_PATH) -> subprocess.Popen:
+    """Start ``script`` (default: app.py) headless on ``port`` and wait until it is healthy."""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", script,
+         "--server.headless=true", f"--server.port={port}",
+         "--browser.gatherUsageStats=false", "--server.fileWatcherType=none"],
+        cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        env=dict(os.environ, LERNAPP_ATTEMPT_DB=attempt_db),
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://localhost:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError(f"streamlit did not become healthy on port {port}")
+
+
+def stop_server(server: subprocess.Popen):
+    server.terminate()
+    try:
+        server.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        server.kill()
+
+
+def rss_kb(pid: int) -> Optional[int]:
+    """Resident set size of a process in kB (Linux only, else None)."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+# ============================================================================
+# SIMULATED BROWSER SESSION
+# ============================================================================
+
+class BrowserSession:
+    """One websocket session that replays journeys and records rerun latency."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.ws = None
+        self.latencies: List[float] = []
+        self.errors: List[str] = []
+        self.deltas = 0  # elements and blocks received
+        # widget key -> (element type, widget id, fragment id, element proto)
+        self._widgets: Dict[str, Tuple[str, str, str, Any]] = {}
+        self._states: Dict[str, WidgetState] = {}
+        self._page = "home"
+
+    async def connect(self):
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    async def run_journey(self, steps: List[Tuple], think_s: float):
+        for step in steps:
+            if step[0] == "open":
+                self._page = step[1]
+                self._widgets.clear()
+                self._states.clear()
+                await self._rerun()
+            else:
+                _, key, value = step
+                fragment_id = self._stage(key, value)
+                if step[0] == "set":
+                    await self._rerun(fragment_id)
+            if think_s:
+                await asyncio.sleep(think_s)
+
+    def _stage(self, key: str, value: Any) -> str:
+        """Record a new widget value and return the widget's fragment id."""
+        if key not in self._widgets:
+            raise LookupError(f"widget {key!r} not on page {self._page!r}")
+        kind, widget_id, fragment_id, element = self._widgets[key]
+        state = WidgetState(id=widget_id)
+        if kind == "slider":
+            state.double_array_value.data.append(value)
+        elif kind == "checkbox":
+            state.bool_value = value
+        elif kind == "number_input":
+            state.double_value = value
+        elif kind in ("radio", "selectbox") and isinstance(value, int):
+            state.string_value = element.options[value]
+        else:
+            state.string_value = value
+        self._states[widget_id] = state
+        return fragment_id
+
+    async def _rerun(self, fragment_id: str = ""):
+        msg = BackMsg()
+        client_state = msg.rerun_script
+        client_state.query_string = ""
+        client_state.page_name = "" if self._page == "home" else self._page
+        client_state.fragment_id = fragment_id
+        client_state.widget_states.widgets.extend(self._states.values())
+
+        start = time.perf_counter()
+        try:
+            await self.ws.send(msg.SerializeToString())
+            status = await asyncio.wait_for(self._receive_until_finished(), RERUN_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.errors.append(f"{self._page}: rerun timed out")
+            return
+        except websockets.ConnectionClosed as exc:
+            self.errors.append(f"{self._page}: connection closed ({exc.code})")
+            raise
+        self.latencies.append(time.perf_counter() - start)
+        if status not in _FINISHED_OK:
+            self.errors.append(f"{self._page}: script finished with status {status}")
+
+    async def _receive_until_finished(self) -> int:
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await self.ws.recv())
+            kind = fwd.WhichOneof("type")
+            if kind == "delta":
+                self.deltas += 1
+                self._track(fwd.delta)
+            elif kind == "page_not_found":
+                self.errors.append(f"{self._page}: page not found")
+            elif kind == "script_finished" and fwd.script_finished != _FINISHED_EARLY:
+                return fwd.script_finished
+
+    def _track(self, delta):
+        """Remember widget ids (which end in their user key) and report exceptions."""
+        if delta.WhichOneof("type") == "add_block":
+            block = delta.add_block
+            if block.WhichOneof("type") == "tab_container":
+                widget_id = block.tab_container.id
+                self._widgets[widget_id.rsplit("-", 1)[-1]] = ("tab_container", widget_id, delta.fragment_id, None)
+            return
+        if delta.WhichOneof("type") != "new_element":
+            return
+        element = delta.new_element
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            self.errors.append(f"{self._page}: {element.exception.type}: {element.exception.message}")
+            return
+        proto = getattr(element, kind)
+        widget_id = getattr(proto, "id", "")
+        if widget_id.startswith("$$ID-"):
+            self._widgets[widget_id.split("-", 2)[-1]] = (kind, widget_id, delta.fragment_id, proto)
+
+
+# ============================================================================
+# LOAD LEVELS
+# ============================================================================
+
+async def _session_task(url: str, repeat: int, think_s: float,
+                        finished: asyncio.Event, release: asyncio.Event) -> BrowserSession:
+    session = BrowserSession(url)
+    try:
+        await session.connect()
+        for _ in range(repeat):
+            for steps in JOURNEYS.values():
+                await session.run_journey(steps, think_s)
+    except (OSError, LookupError, websockets.WebSocketException) as exc:
+        session.errors.append(f"{type(exc).__name__}: {exc}")
+    finished.set()
+    # Keep the session open until all sessions are done so RSS includes it
+    await release.wait()
+    return session
+
+
+async def _run_level(url: str, sessions: int, repeat: int, think_s: float, server_pid: int) -> Dict[str, Any]:
+    rss_before = rss_kb(server_pid)
+    finished = [asyncio.Event() for _ in range(sessions)]
+    release = asyncio.Event()
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(_session_task(url, repeat, think_s, event, release)) for event in finished]
+
+    await asyncio.gather(*(event.wait() for event in finished))
+    elapsed = time.perf_counter() - start
+    rss_after = rss_kb(server_pid)
+    release.set()
+    results = await asyncio.gather(*tasks)
+    for session in results:
+        await session.close()
+
+    latencies = sorted(lat for session in results for lat in session.latencies)
+    errors = [err for session in results for err in session.errors]
+    attempts = len(latencies) + len(errors)
+    rss_per_session = None
+    if rss_before is not None and rss_after is not None:
+        rss_per_session = (rss_after - rss_before) / sessions
+    return {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "p50": _percentile(latencies, 50),
+        "p95": _percentile(latencies, 95),
+        "p99": _percentile(latencies, 99),
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "rss_per_session_kb": rss_per_session,
+        "error_rate": len(errors) / attempts if attempts else 0.0,
+        "errors": errors,
+    }
+
+
+def _percentile(values: List[float], pct: int) -> float:
+    if not values:
+        return float("nan")
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", default="1,5,10,25", help="comma-separated concurrent session counts")
+    parser.add_argument("--repeat", type=int, default=3, help="times each session replays all journeys")
+    parser.add_argument("--think-ms", type=float, default=100, help="pause between journey steps")
+    parser.add_argument("--port", type=int, default=8599, help="port for the local streamlit server")
+    args = parser.parse_args()
+
+    url = f"ws://localhost:{args.port}/_stcore/stream"
+    print(f"{'sessions':>8} {'reruns':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'reruns/s':>9} {'RSS/session kB':>15} {'errors':>7}")
+    all_errors = []
+    for sessions in (int(n) for n in args.sessions.split(",")):
+        with tempfile.TemporaryDirectory() as tmp:
+            server = start_server(args.port, os.path.join(tmp, "attempts.sqlite3"))
+            try:
+                level = asyncio.run(_run_level(url, sessions, args.repeat, args.think_ms / 1000, server.pid))
+            finally:
+                stop_server(server)
+        rss = level["rss_per_session_kb"]
+        print(f"{sessions:>8} {level['reruns']:>7} {level['p50'] * 1000:>8.1f} {level['p95'] * 1000:>8.1f} "
+              f"{level['p99'] * 1000:>8.1f} {level['throughput']:>9.1f} "
+              f"{'-' if rss is None else f'{rss:.0f}':>15} {level['error_rate']:>7.1%}")
+        all_errors += level["errors"]
+
+    if all_errors:
+        print("\nFirst errors:")
+        for error in all_errors[:10]:
+            print(f"  {error}")
+
+
+if __name__ == "__main__":
+    main()
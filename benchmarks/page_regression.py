@@ -0,0 +1,248 @@
+"""
+Page Regression Benchmark
+
+Drives every routable page of app.py headlessly with Streamlit's AppTest
+harness (home, each Python Basics tab, Quick Reference, Mock Exam 1 and the
+locked previews) plus a few representative widget interactions, and records
+per scenario:
+
+- ms:       best wall time of a rerun of the page (or of the rerun the
+            interaction triggers) over --repeat runs, with the garbage
+            collector paused like timeit does
+- elements: number of elements and blocks sent to the browser
+- payload_kb: serialised size of those elements and blocks
+- peak_kb:  peak Python memory allocated during the run (tracemalloc)
+
+The results are compared against the committed baseline (page_baseline.json).
+A scenario regresses when a metric grows by more than its tolerance, e.g. with
+the defaults a page that becomes 30% slower or renders twice as many elements
+fails the run (exit code 1). Slowdowns below --time-floor-ms are treated as
+noise; on busy machines raise --repeat as well. Timings depend on the machine,
+so refresh the baseline with --update-baseline when switching machines or
+after an intended change.
+
+Usage (from the repo root):
+    python -m benchmarks.page_regression [--repeat 7] [--only chapter-02]
+        [--time-tolerance 0.3] [--time-floor-ms 10] [--elements-tolerance 0.25]
+        [--memory-tolerance 0.5] [--payload-tolerance 0.25] [--update-baseline]
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.harness import app_for_page, count_deltas, find_widget, payload_bytes
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "page_baseline.json")
+
+PB_TABS = [
+    "🐍 Warum Python?", "📦 Variablen", "📥 Datentypen", "➕ Arithmetik", "🎤 I/O",
+    "❓ If-Else", "🔁 Schleifen", "🎲 Zufall", "💻 Übungen", "📝 Quiz & Zusammenfassung",
+]
+
+# Half right: Q1 and Q4 correct, Q2 and Q5 wrong, Q3 open
+MOCK1_ANSWERS = {1: 0b100101, 2: 0b1, 4: 0b10000, 5: 0b1}
+
+LOCKED_PAGES = ["chapter-01"] + [f"chapter-{i:02d}" for i in range(3, 12)] + ["mock2"]
+
+# Widget change applied after the first run: (kind, key, label, new value)
+Interaction = Tuple[str, Optional[str], Optional[str], Any]
+
+
+class Scenario:
+    """One page (with preset session state) and an optional widget interaction."""
+
+    def __init__(self, name: str, page_id: str, state: Dict[str, Any] = None,
+                 interaction: Optional[Interaction] = None):
+        self.name = name
+        self.page_id = page_id
+        self.state = state or {}
+        self.interaction = interaction
+
+    def prepare(self) -> AppTest:
+        """
+        Return an AppTest that is ready for the measured run: the page has
+        been opened once (so session setup is not measured) and the
+        interaction, if any, has been applied.
+        """
+        at = app_for_page(self.page_id)
+        for key, value in self.state.items():
+            at.session_state[key] = value
+        _run(at)
+        if self.interaction:
+            kind, key, label, value = self.interaction
+            find_widget(at, kind, key, label).set_value(value)
+        return at
+
+
+def build_scenarios() -> List[Scenario]:
+    scenarios = [Scenario("home", "")]
+    scenarios += [Scenario(f"chapter-02 / {tab}", "chapter-02", {"pb_tabs": tab}) for tab in PB_TABS]
+    scenarios += [
+        Scenario("chapter-12", "chapter-12"),
+        Scenario("chapter-12 / locked tab", "chapter-12", {"qr_tabs": "🧠 Mental Models 🔒"}),
+        Scenario("mock1", "mock1"),
+        Scenario("mock1 / results", "mock1", {"mock1_submitted": True, "mock1_answers": MOCK1_ANSWERS}),
+    ]
+    scenarios += [Scenario(page_id, page_id) for page_id in LOCKED_PAGES]
+    scenarios += [
+        Scenario("chapter-02 / 📦 Variablen: name check", "chapter-02",
+                 {"pb_tabs": "📦 Variablen"}, ("text_input", "var_check", None, "2fast")),
+        Scenario("chapter-02 / ➕ Arithmetik: operator", "chapter-02",
+                 {"pb_tabs": "➕ Arithmetik"}, ("selectbox", "arith_op", None, "**")),
+        Scenario("chapter-02 / 🔁 Schleifen: loop_n", "chapter-02",
+                 {"pb_tabs": "🔁 Schleifen"}, ("slider", "loop_n", None, 12)),
+        Scenario("chapter-02 / 💻 Übungen: converter", "chapter-02",
+                 {"pb_tabs": "💻 Übungen", "pb_ex_tabs": "3️⃣ Rechner"}, ("radio", "ex3_dir", None, "F → C")),
+        Scenario("mock1: pick answer", "mock1", interaction=("checkbox", "mock1_1_0", None, True)),
+        Scenario("mock1: next question", "mock1", interaction=("radio", "mock1_page", None, 3)),
+    ]
+    return scenarios
+
+
+def _run(at: AppTest):
+    # st.echo examples print to stdout, keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+
+def measure(scenario: Scenario, repeat: int) -> Dict[str, float]:
+    # Warm-up: first-time imports and process-wide caches are not per-page cost
+    _run(scenario.prepare())
+
+    times = []
+    for _ in range(repeat):
+        at = scenario.prepare()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            _run(at)
+            times.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    elements = count_deltas(at.main)
+    payload = payload_bytes(at.main)
+
+    # Separate run for memory, tracemalloc slows the script down
+    at = scenario.prepare()
+    tracemalloc.start()
+    try:
+        _run(at)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "ms": round(min(times) * 1000, 2),
+        "elements": elements,
+        "payload_kb": round(payload / 1024, 1),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerances: Dict[str, float],
+            time_floor_ms: float = 0.0) -> List[str]:
+    """
+    Compare results against the baseline.
+
+    Args:
+        results: {scenario: metrics} of this run
+        baseline: {scenario: metrics} of the committed baseline
+        tolerances: {metric: allowed relative growth}
+        time_floor_ms: Slowdowns smaller than this many ms are ignored
+
+    Returns:
+        List of human-readable regression messages (empty if none)
+    """
+    regressions = []
+    for name, metrics in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for metric, tolerance in tolerances.items():
+            if metric not in base:
+                continue
+            limit = base[metric] * (1 + tolerance)
+            if metric == "ms" and metrics[metric] - base[metric] < time_floor_ms:
+                continue
+            if metrics[metric] > limit:
+                regressions.append(
+                    f"{name}: {metric} {metrics[metric]} > {base[metric]} (+{tolerance:.0%})"
+                )
+    return regressions
+
+
+def _load_baseline() -> Dict[str, Dict]:
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=7, help="timed runs per scenario (best is reported)")
+    parser.add_argument("--only", default=None, help="only run scenarios whose name contains this text")
+    parser.add_argument("--time-tolerance", type=float, default=0.3, help="allowed relative slowdown")
+    parser.add_argument("--time-floor-ms", type=float, default=10.0, help="ignore slowdowns below this many ms")
+    parser.add_argument("--elements-tolerance", type=float, default=0.25, help="allowed relative element growth")
+    parser.add_argument("--memory-tolerance", type=float, default=0.5, help="allowed relative peak memory growth")
+    parser.add_argument("--payload-tolerance", type=float, default=0.25, help="allowed relative payload growth")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    args = parser.parse_args()
+
+    scenarios = [s for s in build_scenarios() if args.only is None or args.only in s.name]
+    baseline = _load_baseline()
+
+    results = {}
+    print(f"{'scenario':<45} {'ms':>8} {'base':>8} {'elements':>9} {'base':>6} "
+          f"{'payload kB':>11} {'base':>8} {'peak kB':>9} {'base':>9}")
+    for scenario in scenarios:
+        metrics = measure(scenario, args.repeat)
+        results[scenario.name] = metrics
+        base = baseline.get(scenario.name, {})
+        print(f"{scenario.name:<45} {metrics['ms']:>8.1f} {base.get('ms', '-'):>8} "
+              f"{metrics['elements']:>9} {base.get('elements', '-'):>6} "
+              f"{metrics['payload_kb']:>11.1f} {base.get('payload_kb', '-'):>8} "
+              f"{metrics['peak_kb']:>9.1f} {base.get('peak_kb', '-'):>9}")
+
+    if args.update_baseline:
+        baseline.update(results)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, ensure_ascii=False, sort_keys=True)
+            f.write("\n")
+        print(f"\nBaseline written to {BASELINE_PATH}")
+        return
+
+    missing = [name for name in results if name not in baseline]
+    if missing:
+        print(f"\nNo baseline for: {', '.join(missing)}")
+
+    regressions = compare(results, baseline, {
+        "ms": args.time_tolerance,
+        "elements": args.elements_tolerance,
+        "peak_kb": args.memory_tolerance,
+        "payload_kb": args.payload_tolerance,
+    }, args.time_floor_ms)
+    if regressions:
+        print("\n❌ Regressions:")
+        for message in regressions:
+            print(f"  {message}")
+        sys.exit(1)
+    print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,20 @@
 import streamlit as st
-import plotly.graph_objects as go
 import math
-import numpy as np
-from infrastructure import render_diagram
+from infrastructure import HIGHLIGHT_EDGE, HIGHLIGHT_NODE, interactive_fragment, lazy_import, render_diagram, render_lazy_tabs
+
+# plotly is only needed by the Big O and Pi charts in the exercises tab
+go = lazy_import("plotly.graph_objects")
 
 TITLE = "01. Computing Basics"
 
+# Fetch-Decode-Execute: Schritt -> hervorgehobene Kante (von, nach)
+CPU_CYCLE_STEPS = {
+    "1. FETCH": ("RAM", "CPU"),
+    "2. DECODE": ("CPU", "CU"),
+    "3. EXECUTE": ("CU", "ALU"),
+    "4. STORE": ("ALU", "RAM"),
+}
+
 def run():
     st.header("1. Informatik & Computing Basics")
 
@@ -31,21 +40,11 @@ def run():
     um zu verstehen, wie aus Elektrizität Intelligenz wird.
     """)
 
-    # Definition der Tabs
-    tabs = st.tabs([
-        "🎓 Was ist Informatik?", 
-        "💡 Bits & Bytes", 
-        "🔢 Zahlensysteme", 
-        "🧠 Logik", 
-        "🔌 Transistoren", 
-        "➕ Addierer", 
-        "⚙️ CPU", 
-        "💻 Übungen", 
-        "📝 Quiz"
-    ])
+    # Tab bodies are defined below and rendered lazily at the end of run():
+    # only the active tab executes on a rerun.
 
     # --- TAB 1: WAS IST INFORMATIK? ---
-    with tabs[0]:
+    def tab_informatics():
         st.subheader("Computer Science = Effiziente Automatisierung")
 
         # 1. Connection
@@ -79,13 +78,17 @@ def run():
 
         # 4. Diagram
         render_diagram("""
-            graph TD;
-                CS[Informatik 🎓] --> TI[Technische Inf.<br/>(Hardware) 🔌];
-                CS --> PI[Praktische Inf.<br/>(Software) 💾];
-                CS --> AI[Angewandte Inf.<br/>(Einsatz) 🌍];
-                CS --> TH[Theoretische Inf.<br/>(Mathe) 📐];
-                
-                style CS fill:#4a90e2,color:white
+            rankdir=TB;
+            CS [label="Informatik 🎓", fillcolor="#4a90e2", fontcolor="white"];
+            TI [label="Technische Inf.\\n(Hardware) 🔌"];
+            PI [label="Praktische Inf.\\n(Software) 💾"];
+            AI [label="Angewandte Inf.\\n(Einsatz) 🌍"];
+            TH [label="Theoretische Inf.\\n(Mathe) 📐"];
+
+            CS -> TI;
+            CS -> PI;
+            CS -> AI;
+            CS -> TH;
         """, height=250)
 
         # 5. Live Demo
@@ -121,21 +124,25 @@ def run():
                 print("Bitte gültige Zahlen eingeben!")
 
         # 6. Interactive Exploration
-        st.markdown("### 🎮 Interaktiv: Abstraktions-Ebenen")
-        level = st.select_slider("Zoome in den Computer:", 
-                               options=["Anwendung", "Hochsprache", "Maschinencode", "Hardware", "Physik"])
+        @interactive_fragment
+        def abstraction_zoom():
+            st.markdown("### 🎮 Interaktiv: Abstraktions-Ebenen")
+            level = st.select_slider("Zoome in den Computer:", 
+                                   options=["Anwendung", "Hochsprache", "Maschinencode", "Hardware", "Physik"])
+        
+            if level == "Anwendung":
+                st.success("📱 **App:** Du drückst einen Button 'Foto senden'.")
+            elif level == "Hochsprache":
+                st.code("send_photo(image_data)", language="python")
+            elif level == "Maschinencode":
+                st.code("00101101 11000101 00010010", language="text")
+            elif level == "Hardware":
+                st.warning("🔌 **Chip:** Logikgatter schalten Stromkreise.")
+            elif level == "Physik":
+                st.error("⚡ **Elektronen:** Teilchen bewegen sich durch Silizium.")
+
+        abstraction_zoom()
         
-        if level == "Anwendung":
-            st.success("📱 **App:** Du drückst einen Button 'Foto senden'.")
-        elif level == "Hochsprache":
-            st.code("send_photo(image_data)", language="python")
-        elif level == "Maschinencode":
-            st.code("00101101 11000101 00010010", language="text")
-        elif level == "Hardware":
-            st.warning("🔌 **Chip:** Logikgatter schalten Stromkreise.")
-        elif level == "Physik":
-            st.error("⚡ **Elektronen:** Teilchen bewegen sich durch Silizium.")
-
         # 7. Error Prevention
         with st.expander("⚠️ Häufige Missverständnisse", expanded=False):
             st.markdown("""
@@ -155,7 +162,7 @@ def run():
         st.caption("👉 *Weiter in Tab 2: Woraus besteht diese 'Software' eigentlich? (Bits & Bytes)*")
 
     # --- TAB 2: BITS & BYTES ---
-    with tabs[1]:
+    def tab_bits():
         st.subheader("Die Atome der Information")
 
         # 1. Connection
@@ -192,15 +199,15 @@ def run():
 
         # 4. Diagram
         render_diagram("""
-            graph LR;
-                Bit[Bit (0/1)] --> Byte[Byte (8 Bits)];
-                Byte --> KB[Kilobyte (1024 Bytes)];
-                KB --> MB[Megabyte (1024 KB)];
-                MB --> GB[Gigabyte (1024 MB)];
-                GB --> TB[Terabyte (1024 GB)];
-                
-                style Bit fill:#fff9c4
-                style Byte fill:#ffe0b2
+            rankdir=LR;
+            Bit [label="Bit\\n(0/1)", fillcolor="#fff9c4"];
+            Byte [label="Byte\\n(8 Bits)", fillcolor="#ffe0b2"];
+            KB [label="Kilobyte\\n(1024 Bytes)"];
+            MB [label="Megabyte\\n(1024 KB)"];
+            GB [label="Gigabyte\\n(1024 MB)"];
+            TB [label="Terabyte\\n(1024 GB)"];
+
+            Bit -> Byte -> KB -> MB -> GB -> TB;
         """, height=200)
 
         # 5. Live Demo
@@ -230,20 +237,24 @@ def run():
                 print(line)  # Zeige "H: 01001000" etc.
 
         # 6. Interactive Exploration
-        st.markdown("### 🎮 Interaktiv: Das Binär-Pixel")
-        st.write("Jedes Pixel auf deinem Schirm ist nur eine Zahl (Rot, Grün, Blau).")
+        @interactive_fragment
+        def rgb_mixer():
+            st.markdown("### 🎮 Interaktiv: Das Binär-Pixel")
+            st.write("Jedes Pixel auf deinem Schirm ist nur eine Zahl (Rot, Grün, Blau).")
         
-        r = st.slider("Rot", 0, 255, 100)
-        g = st.slider("Grün", 0, 255, 50)
-        b = st.slider("Blau", 0, 255, 200)
+            r = st.slider("Rot", 0, 255, 100)
+            g = st.slider("Grün", 0, 255, 50)
+            b = st.slider("Blau", 0, 255, 200)
         
-        color_hex = f"#{r:02x}{g:02x}{b:02x}"
-        st.markdown(f"""
-        <div style='background-color: {color_hex}; width: 100px; height: 100px; border-radius: 10px;'></div>
-        """, unsafe_allow_html=True)
+            color_hex = f"#{r:02x}{g:02x}{b:02x}"
+            st.markdown(f"""
+            <div style='background-color: {color_hex}; width: 100px; height: 100px; border-radius: 10px;'></div>
+            """, unsafe_allow_html=True)
         
-        st.code(f"RGB({r}, {g}, {b}) = Binär: {format(r,'08b')} {format(g,'08b')} {format(b,'08b')}")
+            st.code(f"RGB({r}, {g}, {b}) = Binär: {format(r,'08b')} {format(g,'08b')} {format(b,'08b')}")
 
+        rgb_mixer()
+        
         # 7. Error Prevention
         with st.expander("⚠️ Häufige Fehler", expanded=False):
             st.markdown("""
@@ -265,7 +276,7 @@ def run():
         st.caption("👉 *Weiter in Tab 3: Wie zählen wir mit Nullen und Einsen? (Zahlensysteme)*")
 
     # --- TAB 3: NUMBER SYSTEMS ---
-    with tabs[2]:
+    def tab_number_systems():
         st.subheader("Die Sprache der Zahlen: Binär, Dezimal, Hex")
 
         # 1. Connection
@@ -301,14 +312,15 @@ def run():
 
         # 4. Diagram
         render_diagram("""
-            graph TD;
-                DEC[Dezimal 42] --- BIN[Binär 101010];
-                DEC --- HEX[Hex 2A];
-                BIN --- HEX;
-                
-                style DEC fill:#e3f2fd
-                style BIN fill:#fff3e0
-                style HEX fill:#e8f5e9
+            rankdir=TB;
+            DEC [label="Dezimal\\n42", fillcolor="#e3f2fd"];
+            BIN [label="Binär\\n101010", fillcolor="#fff3e0"];
+            HEX [label="Hex\\n2A", fillcolor="#e8f5e9"];
+
+            edge [dir=none];
+            DEC -> BIN;
+            DEC -> HEX;
+            BIN -> HEX;
         """, height=200)
 
         # 5. Live Demo
@@ -337,27 +349,31 @@ def run():
             print(f"Hex:     {h} (Raw: {h_raw})")  # 0x2a (mit Präfix) und 2A (rein)
 
         # 6. Interactive Exploration
-        st.markdown("### 🎮 Interaktiv: Der Binär-Abakus")
-        st.write("Klicke die Bits an, um die Zahl zu bauen:")
+        @interactive_fragment
+        def binary_abacus():
+            st.markdown("### 🎮 Interaktiv: Der Binär-Abakus")
+            st.write("Klicke die Bits an, um die Zahl zu bauen:")
         
-        # 8 Checkboxes for 8 bits
-        b_cols = st.columns(8)
-        binary_val = 0
-        bits_str = ""
+            # 8 Checkboxes for 8 bits
+            b_cols = st.columns(8)
+            binary_val = 0
+            bits_str = ""
         
-        for i in range(8):
-            power = 7 - i
-            with b_cols[i]:
-                is_on = st.checkbox(f"{2**power}", key=f"bit_{i}")
-                if is_on:
-                    binary_val += 2**power
-                    bits_str += "1"
-                else:
-                    bits_str += "0"
+            for i in range(8):
+                power = 7 - i
+                with b_cols[i]:
+                    is_on = st.checkbox(f"{2**power}", key=f"bit_{i}")
+                    if is_on:
+                        binary_val += 2**power
+                        bits_str += "1"
+                    else:
+                        bits_str += "0"
         
-        st.metric("Ergebnis (Dezimal)", binary_val)
-        st.metric("Ergebnis (Hex)", hex(binary_val)[2:].upper())
+            st.metric("Ergebnis (Dezimal)", binary_val)
+            st.metric("Ergebnis (Hex)", hex(binary_val)[2:].upper())
 
+        binary_abacus()
+        
         # 7. Error Prevention
         with st.expander("⚠️ Häufige Fehler", expanded=False):
             st.markdown("""
@@ -376,7 +392,7 @@ def run():
         st.caption("👉 *Weiter in Tab 4: Wie rechnet der Computer damit? (Logik)*")
 
     # --- TAB 4: LOGIC GATES ---
-    with tabs[3]:
+    def tab_logic():
         st.subheader("Boolesche Logik: Das Denken des Computers")
 
         # 1. Connection
@@ -408,21 +424,24 @@ def run():
 
         # 4. Diagram
         render_diagram("""
-            graph LR;
-                A[A] --> AND(AND);
-                B[B] --> AND;
-                AND --> Out[A & B];
-                
-                C[C] --> OR(OR);
-                D[D] --> OR;
-                OR --> Out2[C | D];
-                
-                E[E] --> NOT(NOT);
-                NOT --> Out3[!E];
-                
-                style AND fill:#c8e6c9
-                style OR fill:#ffe0b2
-                style NOT fill:#ffcdd2
+            rankdir=LR;
+            AND [label="AND", shape=ellipse, fillcolor="#c8e6c9"];
+            OR [label="OR", shape=ellipse, fillcolor="#ffe0b2"];
+            NOT [label="NOT", shape=ellipse, fillcolor="#ffcdd2"];
+            Out [label="A & B"];
+            Out2 [label="C | D"];
+            Out3 [label="!E"];
+
+            A -> AND;
+            B -> AND;
+            AND -> Out;
+
+            C -> OR;
+            D -> OR;
+            OR -> Out2;
+
+            E -> NOT;
+            NOT -> Out3;
         """, height=200)
 
         # 5. Live Demo
@@ -451,27 +470,31 @@ def run():
             print(f"Bleibe ich trocken? {stay_dry}")  # True = ja, False = nein
 
         # 6. Interactive Exploration
-        st.markdown("### 🎮 Interaktiv: Der Logik-Simulator")
-        op = st.selectbox("Wähle Gatter:", ["AND", "OR", "XOR"], key="tab4_op")
+        @interactive_fragment
+        def gate_simulator():
+            st.markdown("### 🎮 Interaktiv: Der Logik-Simulator")
+            op = st.selectbox("Wähle Gatter:", ["AND", "OR", "XOR"], key="tab4_op")
         
-        col1, col2, col3 = st.columns([1,1,2])
-        with col1:
-            in1 = st.toggle("Eingang 1", key="in1")
-        with col2:
-            in2 = st.toggle("Eingang 2", key="in2")
+            col1, col2, col3 = st.columns([1,1,2])
+            with col1:
+                in1 = st.toggle("Eingang 1", key="in1")
+            with col2:
+                in2 = st.toggle("Eingang 2", key="in2")
         
-        with col3:
-            if op == "AND":
-                res = in1 and in2
-            elif op == "OR":
-                res = in1 or in2
-            else: # XOR
-                res = in1 != in2
+            with col3:
+                if op == "AND":
+                    res = in1 and in2
+                elif op == "OR":
+                    res = in1 or in2
+                else: # XOR
+                    res = in1 != in2
             
-            # Visualisierung als "Licht"
-            light = "🟡 AN" if res else "⚫️ AUS"
-            st.metric(f"Ausgang ({op})", light)
+                # Visualisierung als "Licht"
+                light = "🟡 AN" if res else "⚫️ AUS"
+                st.metric(f"Ausgang ({op})", light)
 
+        gate_simulator()
+        
         # 7. Error Prevention
         with st.expander("⚠️ Häufige Fehler", expanded=False):
             st.markdown("""
@@ -492,7 +515,7 @@ def run():
         st.caption("👉 *Weiter in Tab 5: Wie bauen wir diese Logik physikalisch? (Transistoren)*")
 
     # --- TAB 5: TRANSISTORS ---
-    with tabs[4]:
+    def tab_transistors():
         st.subheader("Transistoren: Die Hardware-Basis")
 
         # 1. Connection
@@ -523,12 +546,15 @@ def run():
 
         # 4. Diagram
         render_diagram("""
-            graph TD;
-                G[Gate (Steuerung)] --> T{Transistor};
-                S[Source (Eingang)] --> T;
-                T --> D[Drain (Ausgang)];
-                
-                style T fill:#b3e5fc
+            rankdir=TB;
+            G [label="Gate\\n(Steuerung)"];
+            S [label="Source\\n(Eingang)"];
+            T [label="Transistor", shape=diamond, fillcolor="#b3e5fc"];
+            D [label="Drain\\n(Ausgang)"];
+
+            G -> T;
+            S -> T;
+            T -> D;
         """, height=200)
 
         # 5. Live Demo - NAND Construction
@@ -557,25 +583,29 @@ def run():
             print(f"NOT(1) = {not_gate(1)}")  # Sollte 0 sein (Umkehrung von 1)
             
         # 6. Interactive Exploration
-        st.markdown("### 🎮 Interaktiv: Moore's Law")
-        st.write("Wie viele Transistoren passen auf einen Chip?")
+        @interactive_fragment
+        def moore_explorer():
+            st.markdown("### 🎮 Interaktiv: Moore's Law")
+            st.write("Wie viele Transistoren passen auf einen Chip?")
         
-        year = st.slider("Jahr:", 1970, 2030, 2020)
+            year = st.slider("Jahr:", 1970, 2030, 2020)
         
-        # Vereinfachtes Moore's Law: Verdopplung alle 2 Jahre
-        # 1970 start bei ~2000
-        transistors = 2300 * (2 ** ((year - 1971) / 2))
+            # Vereinfachtes Moore's Law: Verdopplung alle 2 Jahre
+            # 1970 start bei ~2000
+            transistors = 2300 * (2 ** ((year - 1971) / 2))
         
-        def format_number(n):
-            if n > 1e9: return f"{n/1e9:.1f} Milliarden"
-            if n > 1e6: return f"{n/1e6:.1f} Millionen"
-            return f"{int(n)}"
+            def format_number(n):
+                if n > 1e9: return f"{n/1e9:.1f} Milliarden"
+                if n > 1e6: return f"{n/1e6:.1f} Millionen"
+                return f"{int(n)}"
             
-        st.metric("Anzahl Transistoren", format_number(transistors))
+            st.metric("Anzahl Transistoren", format_number(transistors))
         
-        if year > 2020:
-            st.caption("⚠️ Physikalische Grenze: Atome sind nicht unendlich klein!")
+            if year > 2020:
+                st.caption("⚠️ Physikalische Grenze: Atome sind nicht unendlich klein!")
 
+        moore_explorer()
+        
         # 7. Error Prevention
         st.info("Transistoren sind analoge Bauteile, die digital genutzt werden. Wenn sie zu heiß werden, machen sie Fehler!")
 
@@ -588,7 +618,7 @@ def run():
         st.caption("👉 *Weiter in Tab 6: Und jetzt rechnen wir! (Addierer)*")
 
     # --- TAB 6: ADDERS ---
-    with tabs[5]:
+    def tab_adders():
         st.subheader("Rechnen mit Strom: Der Addierer")
 
         # 1. Connection
@@ -629,17 +659,20 @@ def run():
 
         # 4. Diagram
         render_diagram("""
-            graph LR;
-                A[Input A] --> XOR;
-                B[Input B] --> XOR;
-                A --> AND;
-                B --> AND;
-                
-                XOR[XOR Gatter] --> S[Summe];
-                AND[AND Gatter] --> C[Carry];
-                
-                style XOR fill:#ffe0b2
-                style AND fill:#c8e6c9
+            rankdir=LR;
+            A [label="Input A"];
+            B [label="Input B"];
+            XOR [label="XOR Gatter", fillcolor="#ffe0b2"];
+            AND [label="AND Gatter", fillcolor="#c8e6c9"];
+            S [label="Summe"];
+            C [label="Carry"];
+
+            A -> XOR;
+            B -> XOR;
+            A -> AND;
+            B -> AND;
+            XOR -> S;
+            AND -> C;
         """, height=250)
 
         # 5. Live Demo
@@ -666,26 +699,30 @@ def run():
             print(f"1 + 1 = {c}{s} (Binär für 2)")  # "10" binär = 2 dezimal
 
         # 6. Interactive Exploration
-        st.markdown("### 🎮 Interaktiv: 4-Bit Rechner")
+        @interactive_fragment
+        def adder_calculator():
+            st.markdown("### 🎮 Interaktiv: 4-Bit Rechner")
         
-        c1, c2 = st.columns(2)
-        val1 = c1.number_input("Zahl 1 (0-15)", 0, 15, 3, key="add1")
-        val2 = c2.number_input("Zahl 2 (0-15)", 0, 15, 5, key="add2")
+            c1, c2 = st.columns(2)
+            val1 = c1.number_input("Zahl 1 (0-15)", 0, 15, 3, key="add1")
+            val2 = c2.number_input("Zahl 2 (0-15)", 0, 15, 5, key="add2")
         
-        res = val1 + val2
+            res = val1 + val2
         
-        st.write("---")
-        # Visualisierung der Binär-Addition
-        def to_bin(n): return format(n, '04b')
+            st.write("---")
+            # Visualisierung der Binär-Addition
+            def to_bin(n): return format(n, '04b')
         
-        st.text(f"  {to_bin(val1)} ({val1})")
-        st.text(f"+ {to_bin(val2)} ({val2})")
-        st.text(f"------")
-        st.text(f"  {to_bin(res)} ({res})")
+            st.text(f"  {to_bin(val1)} ({val1})")
+            st.text(f"+ {to_bin(val2)} ({val2})")
+            st.text(f"------")
+            st.text(f"  {to_bin(res)} ({res})")
         
-        if res > 15:
-            st.warning("Overflow! (Wenn wir nur 4 Bits hätten, wäre das Ergebnis falsch)")
+            if res > 15:
+                st.warning("Overflow! (Wenn wir nur 4 Bits hätten, wäre das Ergebnis falsch)")
 
+        adder_calculator()
+        
         # 7. Error Prevention
         with st.expander("⚠️ Häufige Fehler", expanded=False):
             st.markdown("""
@@ -703,7 +740,7 @@ def run():
         st.caption("👉 *Weiter in Tab 7: Wer steuert diese ganzen Addierer? (CPU)*")
 
     # --- TAB 7: CPU ---
-    with tabs[6]:
+    def tab_cpu():
         st.subheader("Das Herz des Computers: Die CPU")
 
         # 1. Connection
@@ -736,15 +773,23 @@ def run():
             """)
 
         # 4. Diagram
-        render_diagram("""
-            graph TD;
-                RAM[RAM<br/>(Rezept)] -- 1. FETCH --> CPU[CPU<br/>(Koch)];
-                CPU -- 2. DECODE --> CU[Control Unit];
-                CU -- 3. EXECUTE --> ALU[ALU<br/>(Mathe & Logik)];
-                ALU -- 4. STORE --> RAM;
-                
-                style CPU fill:#fff9c4
-        """, height=250)
+        @interactive_fragment
+        def cycle_diagram():
+            step = st.radio("Schritt im Zyklus:", list(CPU_CYCLE_STEPS), horizontal=True, key="cpu_cycle_step")
+            source, target = CPU_CYCLE_STEPS[step]
+            render_diagram("""
+                RAM [label="RAM\\n(Rezept)"];
+                CPU [label="CPU\\n(Koch)", fillcolor="#fff9c4"];
+                CU [label="Control Unit"];
+                ALU [label="ALU\\n(Mathe & Logik)"];
+
+                RAM -> CPU [label="1. FETCH"];
+                CPU -> CU [label="2. DECODE"];
+                CU -> ALU [label="3. EXECUTE"];
+                ALU -> RAM [label="4. STORE"];
+            """, height=250, styles={f"{source}->{target}": HIGHLIGHT_EDGE, target: HIGHLIGHT_NODE})
+
+        cycle_diagram()
 
         # 5. Live Demo
         st.markdown("### 🛠 Live-Demo: Ein Mini-CPU Simulator")
@@ -782,18 +827,22 @@ def run():
                     print(f"FETCH: STORE -> Resultat {accumulator} gespeichert.")
 
         # 6. Interactive Exploration
-        st.markdown("### 🎮 Interaktiv: Taktfrequenz")
-        ghz = st.slider("CPU Takt in GHz:", 0.1, 5.0, 1.0)
+        @interactive_fragment
+        def clock_explorer():
+            st.markdown("### 🎮 Interaktiv: Taktfrequenz")
+            ghz = st.slider("CPU Takt in GHz:", 0.1, 5.0, 1.0)
         
-        cycles_per_sec = ghz * 1_000_000_000
-        time_per_op = 1 / cycles_per_sec
-        light_travel = 299792458 * time_per_op * 100 # cm
+            cycles_per_sec = ghz * 1_000_000_000
+            time_per_op = 1 / cycles_per_sec
+            light_travel = 299792458 * time_per_op * 100 # cm
         
-        st.metric("Operationen pro Sekunde", f"{cycles_per_sec:,.0f}")
-        st.write(f"In einem Taktzyklus kommt Licht nur **{light_travel:.1f} cm** weit!")
-        if light_travel < 5:
-            st.warning("⚠️ Das Licht ist zu langsam für deinen Chip! (Deshalb werden CPUs nicht mehr viel schneller)")
+            st.metric("Operationen pro Sekunde", f"{cycles_per_sec:,.0f}")
+            st.write(f"In einem Taktzyklus kommt Licht nur **{light_travel:.1f} cm** weit!")
+            if light_travel < 5:
+                st.warning("⚠️ Das Licht ist zu langsam für deinen Chip! (Deshalb werden CPUs nicht mehr viel schneller)")
 
+        clock_explorer()
+        
         # 7. Error Prevention
         st.info("Programmierer denken oft 'Mein Code läuft sofort'. Aber für die CPU sind das Millionen von winzigen Schritten.")
 
@@ -806,15 +855,12 @@ def run():
         st.caption("👉 *Weiter in Tab 8: Das waren viele Infos. Jetzt üben wir! (Übungen)*")
 
     # --- TAB 8: EXERCISES ---
-    with tabs[7]:
+    def tab_exercises():
         st.subheader("💻 Praktische Übungen")
         st.markdown("Hier wendest du dein Wissen an. Von der Theorie (Big O) bis zur Praxis (Variablen & Debugging).")
         
-        # Expanded Tabs to include original content
-        ex_tabs = st.tabs(["1️⃣ Binär & Logik", "2️⃣ Komplexität (Big O)", "3️⃣ Algorithmen (Pi)", "4️⃣ Debugging", "5️⃣ Assignment 1 (Basis)", "6️⃣ Komplexes Rechnen", "7️⃣ Chatbot Logic"])
-        
         # --- EX SUBTAB 1: Binary & Logic (New from V2) ---
-        with ex_tabs[0]:
+        def ex_binary_logic():
             st.markdown("### 🔢 Binär & Logik Grundlagen")
             
             col1, col2 = st.columns(2)
@@ -843,7 +889,7 @@ for bit in data:
                 st.success("Er zählt die Anzahl der gesetzten Bits (Population Count). Ergebnis: 2")
 
         # --- EX SUBTAB 2: Big O (Restored) ---
-        with ex_tabs[1]:
+        def ex_big_o():
             st.markdown("### 🚀 Algorithmus-Geschwindigkeit (Big O)")
             st.markdown("""
             Ein Computer ist schnell, aber nicht unendlich schnell. 
@@ -876,7 +922,7 @@ for bit in data:
             """)
 
         # --- EX SUBTAB 3: Pi Approximation (Restored) ---
-        with ex_tabs[2]:
+        def ex_pi():
             st.markdown("### 🥧 Die Leibniz-Reihe für Pi")
             st.markdown(r"$$ \pi = 4 \times (1 - \frac{1}{3} + \frac{1}{5} - \frac{1}{7} + ...) $$")
             
@@ -905,7 +951,7 @@ for bit in data:
                 st.plotly_chart(fig, use_container_width=True, key="fig_pi_conv")
 
         # --- EX SUBTAB 4: Debugging (Restored) ---
-        with ex_tabs[3]:
+        def ex_debugging():
             st.markdown("### 🕵️‍♀️ Bug Hunter Quiz")
             st.write("Finde den Fehler im Code!")
             
@@ -964,7 +1010,7 @@ for bit in data:
                  st.error("Falsch. Schau welche Variablen definiert wurden.")
 
         # --- EX SUBTAB 5: Assignment 1 (Restored) ---
-        with ex_tabs[4]:
+        def ex_assignment():
             st.markdown("### 🏗 Assignment 1: Programming Basics")
             st.info("Das ist dein erstes echtes Coding-Assignment. Setze es in deiner IDE um!")
             
@@ -1045,7 +1091,7 @@ for bit in data:
 
 
         # --- EX SUBTAB 6: Complex Arithmetic (New from Raw Task 1.3/1.4) ---
-        with ex_tabs[5]:
+        def ex_complex():
             st.markdown("### 🧮 Komplexes Rechnen")
             st.info("Hier kombinieren wir viele Operationen. Wenn dein Ergebnis stimmt, hast du die Reihenfolge (Operator Precedence) verstanden!")
 
@@ -1091,7 +1137,7 @@ for bit in data:
                     print(f"Ergebnis r: {round(r, 2)}")
 
         # --- EX SUBTAB 7: Chatbot Logic (New from Raw 'first_steps.py') ---
-        with ex_tabs[6]:
+        def ex_chatbot():
             st.markdown("### 🤖 Dein erster Chatbot")
             st.write("Programmiere eine Begrüßungs-Logik, die auf Namen reagiert.")
             
@@ -1119,8 +1165,18 @@ for bit in data:
             st.markdown("---")
             st.success(f"Output: {greeting}")
 
+        render_lazy_tabs([
+            ("1️⃣ Binär & Logik", ex_binary_logic),
+            ("2️⃣ Komplexität (Big O)", ex_big_o),
+            ("3️⃣ Algorithmen (Pi)", ex_pi),
+            ("4️⃣ Debugging", ex_debugging),
+            ("5️⃣ Assignment 1 (Basis)", ex_assignment),
+            ("6️⃣ Komplexes Rechnen", ex_complex),
+            ("7️⃣ Chatbot Logic", ex_chatbot)
+        ], key="cb_ex_tabs")
+
     # --- TAB 9: QUIZ ---
-    with tabs[8]:
+    def tab_quiz():
         st.subheader("📝 Abschluss-Quiz")
         
         questions = [
@@ -1183,5 +1239,17 @@ for bit in data:
         | **CPU** | "Der Herzschlag (Fetch-Decode-Execute)." |
         """)
 
+    render_lazy_tabs([
+        ("🎓 Was ist Informatik?", tab_informatics),
+        ("💡 Bits & Bytes", tab_bits),
+        ("🔢 Zahlensysteme", tab_number_systems),
+        ("🧠 Logik", tab_logic),
+        ("🔌 Transistoren", tab_transistors),
+        ("➕ Addierer", tab_adders),
+        ("⚙️ CPU", tab_cpu),
+        ("💻 Übungen", tab_exercises),
+        ("📝 Quiz", tab_quiz)
+    ], key="cb_tabs")
+
 if __name__ == "__main__":
     run()
@@ -2,11 +2,14 @@ import streamlit as st
 from typing import List, Dict, Tuple
 
 # Import the shared helper module
+from infrastructure.attempt_store import latest_attempt, record_attempt
+from infrastructure.content_cache import exam_content
 from infrastructure.mock_exam_helper import (
-    render_question,
-    check_answer,
+    ExamClock,
+    render_paginated_exam,
+    grade_exam,
     render_results_header,
-    render_question_result,
+    render_results_review,
     render_exam_intro,
     render_exam_complete
 )
@@ -663,28 +666,42 @@ def run():
     # Session state keys specific to this exam
     STATE_SUBMITTED = 'mock1_submitted'
     STATE_ANSWERS = 'mock1_answers'
+    STATE_CLOCK = 'mock1_clock'
+    STATE_RESTORED = 'mock1_restored'
+    STATE_RECORDED = 'mock1_recorded'
     
     # Initialize session state
     if STATE_SUBMITTED not in st.session_state:
         st.session_state[STATE_SUBMITTED] = False
     if STATE_ANSWERS not in st.session_state:
         st.session_state[STATE_ANSWERS] = {}
+    if STATE_CLOCK not in st.session_state:
+        st.session_state[STATE_CLOCK] = ExamClock()
+    
+    # Questions come from the process-wide cache, shared by all sessions
+    exam = exam_content(__name__)
+    questions = exam['questions']
+    
+    # Once per session: show the learner's last submitted attempt again (survives refresh and restarts)
+    if STATE_RESTORED not in st.session_state:
+        st.session_state[STATE_RESTORED] = True
+        latest = latest_attempt('mock1')
+        if latest is not None and latest.exam_version == exam['version']:
+            # The time per question is not stored, so a restored attempt has no clock
+            st.session_state.update({STATE_SUBMITTED: True, STATE_ANSWERS: dict(latest.answers), STATE_RECORDED: True,
+                                     STATE_CLOCK: None})
     
     # Exam intro
-    render_exam_intro(TITLE, SECTIONS, len(QUESTIONS))
+    render_exam_intro(exam['title'], exam['sections'], len(questions))
     
     if not st.session_state[STATE_SUBMITTED]:
         # ================== EXAM MODE ==================
-        with st.form('mock1_exam_form'):
-            answers = {}
-            
-            for q in QUESTIONS:
-                selected, valid = render_question(q, 'mock1')
-                if valid:
-                    answers[q['id']] = selected
-                st.markdown('---')
-            
-            # Demo end message - shown after all 5 demo questions
+        # One question per page, answers are kept in session state
+        answers = st.session_state[STATE_ANSWERS]
+        page = render_paginated_exam(questions, 'mock1', answers, st.session_state[STATE_CLOCK])
+
+        if page == len(questions) - 1:
+            # Demo end message - shown with the last of the 5 demo questions
             st.markdown("""
             <div style="
                 background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -705,7 +722,7 @@ def run():
             """, unsafe_allow_html=True)
             
             # Show disabled submit button
-            submitted = st.form_submit_button(
+            st.button(
                 '🔒 Submit Exam (Vollversion)',
                 type='secondary',
                 use_container_width=True,
@@ -716,29 +733,35 @@ def run():
         # ================== RESULTS MODE ==================
         answers = st.session_state[STATE_ANSWERS]
         
-        # Calculate score
-        correct_count = sum(1 for q in QUESTIONS if check_answer(q, answers.get(q['id'])))
+        # Grade once, every results view renders from this
+        result = grade_exam(exam, answers)
+        
+        # Persist the submission once (queued, written in the background)
+        if not st.session_state.get(STATE_RECORDED):
+            record_attempt('mock1', result.correct_count, result.total_count, answers, exam['version'])
+            st.session_state[STATE_RECORDED] = True
         
         # Render completion message
         render_exam_complete(
             retake_key='mock1_retake',
             on_retake=lambda: (
-                st.session_state.update({STATE_SUBMITTED: False, STATE_ANSWERS: {}})
+                st.session_state.update({STATE_SUBMITTED: False, STATE_ANSWERS: {}, STATE_CLOCK: ExamClock(),
+                                         STATE_RECORDED: False})
             )
         )
         
         st.divider()
         
         # Render results header with scores
-        render_results_header(correct_count, len(QUESTIONS), SECTIONS, QUESTIONS, answers)
+        render_results_header(result)
         
         st.divider()
         
-        # Render individual question results
+        # Summary table, details only for the selected question
         st.subheader('📋 Question-by-Question Review')
         
-        for q in QUESTIONS:
-            render_question_result(q, answers.get(q['id']))
+        clock = st.session_state[STATE_CLOCK]
+        render_results_review(exam, result, answers, clock.spent if clock else None, key_prefix='mock1_result')
 
 
 if __name__ == '__main__':
@@ -1,11 +1,14 @@
 import streamlit as st
-import numpy as np
-from infrastructure import render_diagram
+from infrastructure import HIGHLIGHT_EDGE, HIGHLIGHT_NODE, interactive_fragment, render_diagram, render_lazy_tabs
+from infrastructure.attempt_store import latest_attempt, record_attempt
 import math
 import random
 
 TITLE = "02. Python Basics"
 
+# Notenrechner: (Schwelle, Note, nächste Prüfung) der if-elif-Kette
+GRADE_CHAIN = [(90, "A", "P80"), (80, "B", "P70"), (70, "C", "P60"), (60, "D", "F")]
+
 def run():
     st.header("2. Python Grundlagen")
     
@@ -41,23 +44,13 @@ def run():
     und kombinierst sie zu **Logik** (if/else, Schleifen). Am Ende schreibst du deine ersten eigenen Programme!
     """)
     
-    tabs = st.tabs([
-        "🐍 Warum Python?",
-        "📦 Variablen",
-        "📥 Datentypen",
-        "➕ Arithmetik",
-        "🎤 I/O",
-        "❓ If-Else",
-        "🔁 Schleifen",
-        "🎲 Zufall",
-        "💻 Übungen",
-        "📝 Quiz & Zusammenfassung"
-    ])
+    # Tab bodies are defined below and rendered lazily at the end of run():
+    # only the active tab executes on a rerun.
 
     # ═══════════════════════════════════════════════════════════════════════════
     # TAB 1: WARUM PYTHON?
     # ═══════════════════════════════════════════════════════════════════════════
-    with tabs[0]:
+    def tab_why_python():
         st.subheader("Warum Python?")
         
         # 📍 CONNECTION
@@ -136,29 +129,33 @@ def run():
             print(f"Ist Python großartig? {is_awesome}")  # Ist Python großartig? True
         
         # 🎮 INTERACTIVE EXPLORATION
-        st.markdown("### 🎮 Interaktiv: Vergleich")
+        @interactive_fragment
+        def language_compare():
+            st.markdown("### 🎮 Interaktiv: Vergleich")
         
-        lang_type = st.radio("Vergleiche:", ["Kompiliert (C, Java)", "Interpretiert (Python)"], key="lang_compare")
+            lang_type = st.radio("Vergleiche:", ["Kompiliert (C, Java)", "Interpretiert (Python)"], key="lang_compare")
         
-        if lang_type == "Kompiliert (C, Java)":
-            st.markdown("""
-            **Ablauf:**
-            1. Code schreiben (.c, .java)
-            2. **Compiler** übersetzt in Maschinencode
-            3. Binärdatei erstellen (.exe)
-            4. Ausführen
+            if lang_type == "Kompiliert (C, Java)":
+                st.markdown("""
+                **Ablauf:**
+                1. Code schreiben (.c, .java)
+                2. **Compiler** übersetzt in Maschinencode
+                3. Binärdatei erstellen (.exe)
+                4. Ausführen
             
-            ✅ Schnelle Ausführung | ❌ Langsame Kompilierung | ❌ Plattform-spezifisch
-            """)
-        else:
-            st.markdown("""
-            **Ablauf:**
-            1. Code schreiben (.py)
-            2. **Interpreter** übersetzt Zeile für Zeile
-            3. Direkt ausführen
+                ✅ Schnelle Ausführung | ❌ Langsame Kompilierung | ❌ Plattform-spezifisch
+                """)
+            else:
+                st.markdown("""
+                **Ablauf:**
+                1. Code schreiben (.py)
+                2. **Interpreter** übersetzt Zeile für Zeile
+                3. Direkt ausführen
             
-            ✅ Schnelle Entwicklung | ✅ Plattform-unabhängig | ❌ Langsamere Ausführung
-            """)
+                ✅ Schnelle Entwicklung | ✅ Plattform-unabhängig | ❌ Langsamere Ausführung
+                """)
+
+        language_compare()
         
         # ⚠️ ERROR PREVENTION
         with st.expander("⚠️ Häufige Missverständnisse", expanded=False):
@@ -189,7 +186,7 @@ def run():
     # ═══════════════════════════════════════════════════════════════════════════
     # TAB 2: VARIABLEN
     # ═══════════════════════════════════════════════════════════════════════════
-    with tabs[1]:
+    def tab_variables():
         st.subheader("Variablen und Zuweisungen")
         
         # 📍 CONNECTION
@@ -291,33 +288,37 @@ def run():
             # Andere Kurzformen: +=, -=, /=, //=, %=, **=
         
         # 🎮 INTERACTIVE EXPLORATION
-        st.markdown("### 🎮 Interaktiv: Variablen-Namens-Checker")
-        
-        var_name = st.text_input("Teste einen Variablennamen:", "my_variable", key="var_check")
-        
-        is_valid = True
-        reasons = []
-        
-        if not var_name:
-            is_valid = False
-            reasons.append("Name darf nicht leer sein")
-        elif var_name[0].isdigit():
-            is_valid = False
-            reasons.append("Darf nicht mit Zahl beginnen")
-        elif "-" in var_name:
-            is_valid = False
-            reasons.append("Bindestriche nicht erlaubt (nutze _)")
-        elif " " in var_name:
-            is_valid = False
-            reasons.append("Leerzeichen nicht erlaubt")
-        elif var_name in ["if", "for", "while", "class", "def", "return", "import"]:
-            is_valid = False
-            reasons.append("Reserviertes Python-Keyword")
-        
-        if is_valid:
-            st.success(f"✅ `{var_name}` ist ein gültiger Variablenname!")
-        else:
-            st.error(f"❌ `{var_name}` ist ungültig: {', '.join(reasons)}")
+        @interactive_fragment
+        def name_checker():
+            st.markdown("### 🎮 Interaktiv: Variablen-Namens-Checker")
+        
+            var_name = st.text_input("Teste einen Variablennamen:", "my_variable", key="var_check")
+        
+            is_valid = True
+            reasons = []
+        
+            if not var_name:
+                is_valid = False
+                reasons.append("Name darf nicht leer sein")
+            elif var_name[0].isdigit():
+                is_valid = False
+                reasons.append("Darf nicht mit Zahl beginnen")
+            elif "-" in var_name:
+                is_valid = False
+                reasons.append("Bindestriche nicht erlaubt (nutze _)")
+            elif " " in var_name:
+                is_valid = False
+                reasons.append("Leerzeichen nicht erlaubt")
+            elif var_name in ["if", "for", "while", "class", "def", "return", "import"]:
+                is_valid = False
+                reasons.append("Reserviertes Python-Keyword")
+        
+            if is_valid:
+                st.success(f"✅ `{var_name}` ist ein gültiger Variablenname!")
+            else:
+                st.error(f"❌ `{var_name}` ist ungültig: {', '.join(reasons)}")
+
+        name_checker()
         
         # ⚠️ ERROR PREVENTION
         with st.expander("⚠️ Häufige Fehler", expanded=False):
@@ -367,7 +368,7 @@ def run():
     # ═══════════════════════════════════════════════════════════════════════════
     # TAB 3: DATENTYPEN
     # ═══════════════════════════════════════════════════════════════════════════
-    with tabs[2]:
+    def tab_types():
         st.subheader("Datentypen – Die Basics")
         
         # 📍 CONNECTION
@@ -491,40 +492,44 @@ def run():
             print(f"bool('text') = {bool('text')}")  # Nicht-leerer String ist True
         
         # 🎮 INTERACTIVE EXPLORATION
-        st.markdown("### 🎮 Interaktiv: Typ-Explorer")
+        @interactive_fragment
+        def type_explorer():
+            st.markdown("### 🎮 Interaktiv: Typ-Explorer")
         
-        user_val = st.text_input("Gib einen Wert ein:", "42", key="type_explorer")
+            user_val = st.text_input("Gib einen Wert ein:", "42", key="type_explorer")
         
-        with st.echo():
-            # Schritt 1: Eingabewert übernehmen
-            test_val = user_val  # Wert aus dem Textfeld
+            with st.echo():
+                # Schritt 1: Eingabewert übernehmen
+                test_val = user_val  # Wert aus dem Textfeld
+
+                # Schritt 2: Verschiedene Typ-Konversionen versuchen
+                results = []  # Liste für die Ergebnisse
 
-            # Schritt 2: Verschiedene Typ-Konversionen versuchen
-            results = []  # Liste für die Ergebnisse
+                # int() versuchen - funktioniert nur bei "ganzzahligen" Strings
+                try:
+                    as_int = int(test_val)  # "42" -> 42, "3.14" -> Fehler
+                    results.append(f"int: {as_int}")  # Erfolg
+                except:
+                    results.append("int: ❌ nicht möglich")  # Fehler
 
-            # int() versuchen - funktioniert nur bei "ganzzahligen" Strings
-            try:
-                as_int = int(test_val)  # "42" -> 42, "3.14" -> Fehler
-                results.append(f"int: {as_int}")  # Erfolg
-            except:
-                results.append("int: ❌ nicht möglich")  # Fehler
+                # float() versuchen - funktioniert bei Dezimalzahlen
+                try:
+                    as_float = float(test_val)  # "3.14" -> 3.14, "42" -> 42.0
+                    results.append(f"float: {as_float}")  # Erfolg
+                except:
+                    results.append("float: ❌ nicht möglich")  # Fehler
 
-            # float() versuchen - funktioniert bei Dezimalzahlen
-            try:
-                as_float = float(test_val)  # "3.14" -> 3.14, "42" -> 42.0
-                results.append(f"float: {as_float}")  # Erfolg
-            except:
-                results.append("float: ❌ nicht möglich")  # Fehler
+                # str() geht immer - macht alles zum String
+                results.append(f"str: '{test_val}'")  # Immer möglich
 
-            # str() geht immer - macht alles zum String
-            results.append(f"str: '{test_val}'")  # Immer möglich
+                # bool() geht immer - konvertiert zu True/False
+                results.append(f"bool: {bool(test_val)}")  # Immer möglich
 
-            # bool() geht immer - konvertiert zu True/False
-            results.append(f"bool: {bool(test_val)}")  # Immer möglich
+                # Schritt 3: Alle Ergebnisse ausgeben
+                for r in results:
+                    print(r)  # Jedes Ergebnis in neuer Zeile
 
-            # Schritt 3: Alle Ergebnisse ausgeben
-            for r in results:
-                print(r)  # Jedes Ergebnis in neuer Zeile
+        type_explorer()
         
         # ⚠️ ERROR PREVENTION
         with st.expander("⚠️ Häufige Fehler", expanded=False):
@@ -573,7 +578,7 @@ def run():
     # ═══════════════════════════════════════════════════════════════════════════
     # TAB 4: ARITHMETIK
     # ═══════════════════════════════════════════════════════════════════════════
-    with tabs[3]:
+    def tab_arithmetic():
         st.subheader("Arithmetik – Rechnen mit Python")
         
         # 📍 CONNECTION
@@ -647,39 +652,43 @@ def run():
             print(f"abs(-10) = {abs(-10)}")        # Betrag (absoluter Wert)
         
         # 🎮 INTERACTIVE EXPLORATION
-        st.markdown("### 🎮 Interaktiv: Rechner")
+        @interactive_fragment
+        def calculator():
+            st.markdown("### 🎮 Interaktiv: Rechner")
         
-        c1, c2, c3 = st.columns(3)
-        calc_a = c1.number_input("a =", value=10, key="arith_a")
-        calc_op = c2.selectbox("Operator:", ["+", "-", "*", "/", "//", "%", "**"], key="arith_op")
-        calc_b = c3.number_input("b =", value=3, key="arith_b")
+            c1, c2, c3 = st.columns(3)
+            calc_a = c1.number_input("a =", value=10, key="arith_a")
+            calc_op = c2.selectbox("Operator:", ["+", "-", "*", "/", "//", "%", "**"], key="arith_op")
+            calc_b = c3.number_input("b =", value=3, key="arith_b")
         
-        with st.echo():
-            # Schritt 1: Variablen aus der Benutzereingabe
-            result = None  # Variable für das Ergebnis
-
-            # Schritt 2: Operator mit if-elif-else prüfen
-            if calc_op == "+":  # Addition
-                result = calc_a + calc_b
-            elif calc_op == "-":  # Subtraktion
-                result = calc_a - calc_b
-            elif calc_op == "*":  # Multiplikation
-                result = calc_a * calc_b
-            elif calc_op == "/" and calc_b != 0:  # Division (mit Null-Prüfung)
-                result = calc_a / calc_b
-            elif calc_op == "//" and calc_b != 0:  # Ganzzahl-Division
-                result = calc_a // calc_b
-            elif calc_op == "%" and calc_b != 0:  # Modulo
-                result = calc_a % calc_b
-            elif calc_op == "**":  # Potenz
-                result = calc_a ** calc_b
-            else:  # Fehlerfall (Division durch 0)
-                result = "Error: Division durch 0!"
+            with st.echo():
+                # Schritt 1: Variablen aus der Benutzereingabe
+                result = None  # Variable für das Ergebnis
 
-            # Schritt 3: Ergebnis ausgeben
-            print(f"{calc_a} {calc_op} {calc_b} = {result}")
+                # Schritt 2: Operator mit if-elif-else prüfen
+                if calc_op == "+":  # Addition
+                    result = calc_a + calc_b
+                elif calc_op == "-":  # Subtraktion
+                    result = calc_a - calc_b
+                elif calc_op == "*":  # Multiplikation
+                    result = calc_a * calc_b
+                elif calc_op == "/" and calc_b != 0:  # Division (mit Null-Prüfung)
+                    result = calc_a / calc_b
+                elif calc_op == "//" and calc_b != 0:  # Ganzzahl-Division
+                    result = calc_a // calc_b
+                elif calc_op == "%" and calc_b != 0:  # Modulo
+                    result = calc_a % calc_b
+                elif calc_op == "**":  # Potenz
+                    result = calc_a ** calc_b
+                else:  # Fehlerfall (Division durch 0)
+                    result = "Error: Division durch 0!"
+
+                # Schritt 3: Ergebnis ausgeben
+                print(f"{calc_a} {calc_op} {calc_b} = {result}")
         
-        st.metric("Ergebnis", str(result))
+            st.metric("Ergebnis", str(result))
+
+        calculator()
         
         # ⚠️ ERROR PREVENTION
         with st.expander("⚠️ Häufige Fehler", expanded=False):
@@ -720,7 +729,7 @@ def run():
     # ═══════════════════════════════════════════════════════════════════════════
     # TAB 5: INPUT/OUTPUT
     # ═══════════════════════════════════════════════════════════════════════════
-    with tabs[4]:
+    def tab_io():
         st.subheader("Input und Output")
         
         # 📍 CONNECTION
@@ -801,12 +810,14 @@ print(f"GPA auf 1 Stelle: {gpa:.1f}")  # :.1f = 1 Dezimalstelle
         print(f"GPA auf 1 Stelle: {gpa:.1f}")   # 3.8 (auf 1 Stelle gerundet)
         
         # 🎮 INTERACTIVE EXPLORATION
-        st.markdown("### 🎮 Interaktiv: F-String Builder")
+        @interactive_fragment
+        def fstring_builder():
+            st.markdown("### 🎮 Interaktiv: F-String Builder")
         
-        user_name = st.text_input("Dein Name:", "Student", key="io_name")
-        user_score = st.slider("Deine Punktzahl:", 0, 100, 85, key="io_score")
+            user_name = st.text_input("Dein Name:", "Student", key="io_name")
+            user_score = st.slider("Deine Punktzahl:", 0, 100, 85, key="io_score")
         
-        st.code(f"""
+            st.code(f"""
 formatted = f"Hallo {{user_name}}! Du hast {{user_score}} Punkte."
 print(formatted)
 
@@ -816,14 +827,16 @@ formatted2 = f"Das sind {{percentage:.1%}} der moeglichen Punkte."
 print(formatted2)
 """, language="python")
 
-        formatted = f"Hallo {user_name}! Du hast {user_score} Punkte."
-        print(formatted)
+            formatted = f"Hallo {user_name}! Du hast {user_score} Punkte."
+            print(formatted)
         
-        percentage = user_score / 100
-        formatted2 = f"Das sind {percentage:.1%} der möglichen Punkte."
-        print(formatted2)
+            percentage = user_score / 100
+            formatted2 = f"Das sind {percentage:.1%} der möglichen Punkte."
+            print(formatted2)
         
-        st.success(f"Hallo {user_name}! Du hast {user_score} Punkte ({user_score}%).")
+            st.success(f"Hallo {user_name}! Du hast {user_score} Punkte ({user_score}%).")
+
+        fstring_builder()
         
         # ⚠️ ERROR PREVENTION
         with st.expander("⚠️ Häufige Fehler", expanded=False):
@@ -862,7 +875,7 @@ print(formatted2)
     # ═══════════════════════════════════════════════════════════════════════════
     # TAB 6: IF-ELSE
     # ═══════════════════════════════════════════════════════════════════════════
-    with tabs[5]:
+    def tab_if_else():
         st.subheader("Entscheidungen mit If-Else")
         
         # 📍 CONNECTION
@@ -951,31 +964,62 @@ print(formatted2)
         col2.metric("Wahlberechtigt", "✅" if can_vote else "❌")
         
         # 🎮 INTERACTIVE EXPLORATION
-        st.markdown("### 🎮 Interaktiv: Notenrechner")
+        @interactive_fragment
+        def grade_calculator():
+            st.markdown("### 🎮 Interaktiv: Notenrechner")
         
-        points = st.slider("Punkte:", 0, 100, 75, key="grade_points")
+            points = st.slider("Punkte:", 0, 100, 75, key="grade_points")
         
-        with st.echo():
-            # Schritt 1: Punkte aus Slider übernehmen
-            p = points  # Punkte von 0-100
-
-            # Schritt 2: Notenberechnung mit if-elif-Kette
-            # Python prüft von oben nach unten und führt nur den ersten passenden Block aus
-            if p >= 90:      # Wenn 90 oder mehr Punkte
-                grade = "A"  # Dann: Beste Note
-            elif p >= 80:    # Wenn nicht 90+, aber 80+
-                grade = "B"  # Dann: Gut
-            elif p >= 70:    # Wenn nicht 80+, aber 70+
-                grade = "C"  # Dann: Befriedigend
-            elif p >= 60:    # Wenn nicht 70+, aber 60+
-                grade = "D"  # Dann: Ausreichend
-            else:            # In allen anderen Fällen (unter 60)
-                grade = "F"  # Dann: Nicht bestanden
+            with st.echo():
+                # Schritt 1: Punkte aus Slider übernehmen
+                p = points  # Punkte von 0-100
 
-            # Schritt 3: Ergebnis ausgeben
-            print(f"{p} Punkte = Note {grade}")  # z.B. "85 Punkte = Note B"
+                # Schritt 2: Notenberechnung mit if-elif-Kette
+                # Python prüft von oben nach unten und führt nur den ersten passenden Block aus
+                if p >= 90:      # Wenn 90 oder mehr Punkte
+                    grade = "A"  # Dann: Beste Note
+                elif p >= 80:    # Wenn nicht 90+, aber 80+
+                    grade = "B"  # Dann: Gut
+                elif p >= 70:    # Wenn nicht 80+, aber 70+
+                    grade = "C"  # Dann: Befriedigend
+                elif p >= 60:    # Wenn nicht 70+, aber 60+
+                    grade = "D"  # Dann: Ausreichend
+                else:            # In allen anderen Fällen (unter 60)
+                    grade = "F"  # Dann: Nicht bestanden
+
+                # Schritt 3: Ergebnis ausgeben
+                print(f"{p} Punkte = Note {grade}")  # z.B. "85 Punkte = Note B"
         
-        st.metric("Note", grade)
+            st.metric("Note", grade)
+
+            # Aktiven Pfad durch die if-elif-Kette hervorheben
+            styles = {}
+            for threshold, letter, next_node in GRADE_CHAIN:
+                node = f"P{threshold}"
+                styles[node] = HIGHLIGHT_NODE
+                if points >= threshold:
+                    styles[f"{node}->{letter}"] = HIGHLIGHT_EDGE
+                    break
+                styles[f"{node}->{next_node}"] = HIGHLIGHT_EDGE
+            styles[grade] = HIGHLIGHT_NODE
+            render_diagram("""
+                P90 [label="p >= 90?", shape=diamond, fillcolor="#b3e5fc"];
+                P80 [label="p >= 80?", shape=diamond, fillcolor="#b3e5fc"];
+                P70 [label="p >= 70?", shape=diamond, fillcolor="#b3e5fc"];
+                P60 [label="p >= 60?", shape=diamond, fillcolor="#b3e5fc"];
+                A [label="A"]; B [label="B"]; C [label="C"]; D [label="D"]; F [label="F"];
+
+                P90 -> A [label="Ja"];
+                P90 -> P80 [label="Nein"];
+                P80 -> B [label="Ja"];
+                P80 -> P70 [label="Nein"];
+                P70 -> C [label="Ja"];
+                P70 -> P60 [label="Nein"];
+                P60 -> D [label="Ja"];
+                P60 -> F [label="Nein"];
+            """, height=320, styles=styles)
+
+        grade_calculator()
         
         # ⚠️ ERROR PREVENTION
         with st.expander("⚠️ Häufige Fehler", expanded=False):
@@ -1068,7 +1112,7 @@ print(formatted2)
     # ═══════════════════════════════════════════════════════════════════════════
     # TAB 7: SCHLEIFEN
     # ═══════════════════════════════════════════════════════════════════════════
-    with tabs[6]:
+    def tab_loops():
         st.subheader("Schleifen – Wiederholungen")
         
         # 📍 CONNECTION
@@ -1180,20 +1224,24 @@ print("Fertig!")
         st.write("Fertig!")
         
         # 🎮 INTERACTIVE EXPLORATION
-        st.markdown("### 🎮 Interaktiv: Summe berechnen")
+        @interactive_fragment
+        def sum_calculator():
+            st.markdown("### 🎮 Interaktiv: Summe berechnen")
         
-        n = st.slider("Summe von 1 bis n:", 1, 20, 5, key="loop_n")
+            n = st.slider("Summe von 1 bis n:", 1, 20, 5, key="loop_n")
         
-        with st.echo():
-            total = 0
-            for i in range(1, n + 1):
-                total = total + i
-            print(f"Summe von 1 bis {n} = {total}")
-        
-        # Zeige Formel
-        expected = n * (n + 1) // 2
-        st.metric("Summe", total)
-        st.caption(f"Formel: n*(n+1)/2 = {expected}")
+            with st.echo():
+                total = 0
+                for i in range(1, n + 1):
+                    total = total + i
+                print(f"Summe von 1 bis {n} = {total}")
+        
+            # Zeige Formel
+            expected = n * (n + 1) // 2
+            st.metric("Summe", total)
+            st.caption(f"Formel: n*(n+1)/2 = {expected}")
+
+        sum_calculator()
         
         # ⚠️ ERROR PREVENTION
         with st.expander("⚠️ Häufige Fehler", expanded=False):
@@ -1249,7 +1297,7 @@ print("Fertig!")
     # ═══════════════════════════════════════════════════════════════════════════
     # TAB 8: ZUFALL
     # ═══════════════════════════════════════════════════════════════════════════
-    with tabs[7]:
+    def tab_random():
         st.subheader("Zufall mit dem random-Modul")
         
         # 📍 CONNECTION
@@ -1325,30 +1373,32 @@ print("Fertig!")
             print(f"Zufällige Farbe: {pick}")  # z.B. "Rot" oder "Grün" oder "Blau"
         
         # 🎮 INTERACTIVE EXPLORATION
-        st.markdown("### 🎮 Interaktiv: Würfeln")
+        @interactive_fragment
+        def random_simulator():
+            st.markdown("### 🎮 Interaktiv: Würfeln")
         
-        if st.button("🎲 Würfeln!", key="dice_roll"):
-            dice_result = random.randint(1, 6)
-            st.metric("Ergebnis", f"🎲 {dice_result}")
+            if st.button("🎲 Würfeln!", key="dice_roll"):
+                dice_result = random.randint(1, 6)
+                st.metric("Ergebnis", f"🎲 {dice_result}")
         
-        st.markdown("### 🎮 Münzwurf-Simulation")
+            st.markdown("### 🎮 Münzwurf-Simulation")
         
-        num_flips = st.slider("Anzahl Würfe:", 10, 1000, 100, key="coin_flips")
+            num_flips = st.slider("Anzahl Würfe:", 10, 1000, 100, key="coin_flips")
         
-        if st.button("Münzen werfen", key="coin_btn"):
-            heads = 0
-            tails = 0
+            if st.button("Münzen werfen", key="coin_btn"):
+                heads = 0
+                tails = 0
             
-            for _ in range(num_flips):
-                if random.random() < 0.5:
-                    heads = heads + 1
-                else:
-                    tails = tails + 1
+                for _ in range(num_flips):
+                    if random.random() < 0.5:
+                        heads = heads + 1
+                    else:
+                        tails = tails + 1
             
-            heads_pct = round(heads / num_flips * 100, 1)
-            tails_pct = round(tails / num_flips * 100, 1)
+                heads_pct = round(heads / num_flips * 100, 1)
+                tails_pct = round(tails / num_flips * 100, 1)
             
-            st.code(f"""
+                st.code(f"""
 # Simulation mit {num_flips} Würfen
 heads = 0
 tails = 0
@@ -1364,9 +1414,11 @@ print(f"Kopf: {heads} ({heads_pct}%)")
 print(f"Zahl: {tails} ({tails_pct}%)")
 """, language="python")
             
-            col1, col2 = st.columns(2)
-            col1.metric("Kopf", f"{heads} ({heads_pct}%)")
-            col2.metric("Zahl", f"{tails} ({tails_pct}%)")
+                col1, col2 = st.columns(2)
+                col1.metric("Kopf", f"{heads} ({heads_pct}%)")
+                col2.metric("Zahl", f"{tails} ({tails_pct}%)")
+
+        random_simulator()
         
         # ⚠️ ERROR PREVENTION
         with st.expander("⚠️ Häufige Fehler", expanded=False):
@@ -1411,7 +1463,7 @@ print(f"Zahl: {tails} ({tails_pct}%)")
     # ═══════════════════════════════════════════════════════════════════════════
     # TAB 9: ÜBUNGEN
     # ═══════════════════════════════════════════════════════════════════════════
-    with tabs[8]:
+    def tab_exercises():
         st.subheader("💻 Praktische Programmierübungen")
         
         st.markdown("""
@@ -1420,17 +1472,8 @@ print(f"Zahl: {tails} ({tails_pct}%)")
         """)
         
 
-        ex_tabs = st.tabs([
-            "1️⃣ Variablen",
-            "2️⃣ Typen",
-            "3️⃣ Rechner",
-            "4️⃣ Ratespiel",
-            "5️⃣ Programm",
-            "6️⃣ Algorithmus-Training"
-        ])
-        
         # --- EXERCISE 1: Variable Calculator ---
-        with ex_tabs[0]:
+        def ex_variables():
             st.markdown("### Übung 1: Variablen-Steckbrief ⭐")
             
             st.success("💡 **Lernziel:** Variablen erstellen und F-Strings nutzen.")
@@ -1468,7 +1511,7 @@ print(f"Hobby: {hobby}")
                 print(f"In 10 Jahren: {profile_age + 10}")  # Berechnung: Alter + 10
         
         # --- EXERCISE 2: Type Converter ---
-        with ex_tabs[1]:
+        def ex_types():
             st.markdown("### Übung 2: Typ-Konverter ⭐⭐")
             
             st.success("💡 **Lernziel:** Typ-Konversion beherrschen.")
@@ -1507,7 +1550,7 @@ print(f"Zurück als str: '{as_str}'")
                     print("Konversion fehlgeschlagen!")  # Fehlermeldung ausgeben
         
         # --- EXERCISE 3: Calculator ---
-        with ex_tabs[2]:
+        def ex_calculator():
             st.markdown("### Übung 3: Temperatur-Umrechner ⭐⭐")
             
             st.success("💡 **Lernziel:** Arithmetik und Formeln anwenden.")
@@ -1545,7 +1588,7 @@ else:
                 print(f"{fahrenheit}F = {celsius:.1f}C") # Ausgabe mit 1 Dezimalstelle
         
         # --- EXERCISE 4: Number Guessing ---
-        with ex_tabs[3]:
+        def ex_guessing():
             st.markdown("### Übung 4: Zahlen-Ratespiel ⭐⭐⭐")
             
             st.success("💡 **Lernziel:** If-Else, Schleifen und Random kombinieren.")
@@ -1584,7 +1627,7 @@ else:
             st.caption(f"Versuche: {st.session_state.attempts}")
         
         # --- EXERCISE 5: Mini Program ---
-        with ex_tabs[4]:
+        def ex_program():
             st.markdown("### Übung 5: Einkaufslisten-Rechner ⭐⭐⭐⭐")
             
             st.success("💡 **Lernziel:** Alle Konzepte kombinieren!")
@@ -1625,7 +1668,7 @@ print(f"Mit MwSt: {total + tax:.2f} Euro")
             col2.metric("Brutto", f"{brutto_calc:.2f}€")
 
         # --- EXERCISE 6: Algorithm Training (New from Raw Logic Tasks) ---
-        with ex_tabs[5]:
+        def ex_algorithms():
             st.markdown("### 🧠 Algorithmus-Training")
             st.info("Hier trainieren wir algorithmisches Denken mit Schleifen (wie im CS-Studium).")
 
@@ -1685,9 +1728,20 @@ print(f"Mit MwSt: {total + tax:.2f} Euro")
                     
                     # Test: Die ersten 5 sind 100->1, 101->2, 102->3, 103->4, 104->5
                     # Also "12345..."
+
+        render_lazy_tabs([
+            ("1️⃣ Variablen", ex_variables),
+            ("2️⃣ Typen", ex_types),
+            ("3️⃣ Rechner", ex_calculator),
+            ("4️⃣ Ratespiel", ex_guessing),
+            ("5️⃣ Programm", ex_program),
+            ("6️⃣ Algorithmus-Training", ex_algorithms)
+        ], key="pb_ex_tabs")
+
+    # ═══════════════════════════════════════════════════════════════════════════
     # TAB 10: QUIZ & ZUSAMMENFASSUNG
     # ═══════════════════════════════════════════════════════════════════════════
-    with tabs[9]:
+    def tab_quiz():
         st.subheader("📝 Quiz & Kapitel-Zusammenfassung")
         
         quiz_questions = [
@@ -1744,8 +1798,14 @@ print(f"Mit MwSt: {total + tax:.2f} Euro")
         st.markdown("### 🎯 Teste dein Wissen!")
         
         if 'pb_quiz_score' not in st.session_state:
-            st.session_state.pb_quiz_score = 0
-            st.session_state.pb_quiz_submitted = False
+            # Last saved result, if the learner took the quiz before
+            latest = latest_attempt('pb_quiz')
+            st.session_state.pb_quiz_score = latest.correct if latest else 0
+            st.session_state.pb_quiz_submitted = latest is not None
+            # Show the saved answers in the radios of the graded view
+            for i, idx in (latest.answers.items() if latest else ()):
+                if isinstance(i, int) and i < len(quiz_questions) and 0 <= idx < len(quiz_questions[i]['opts']):
+                    st.session_state.setdefault(f"pb_quiz_q{i}", quiz_questions[i]['opts'][idx])
         
         answers = {}
         for i, q in enumerate(quiz_questions):
@@ -1766,13 +1826,18 @@ print(f"Mit MwSt: {total + tax:.2f} Euro")
             
             st.session_state.pb_quiz_score = score
             st.session_state.pb_quiz_submitted = True
+            st.session_state.pb_quiz_celebrate = score / len(quiz_questions) >= 0.75
+            record_attempt('pb_quiz', score, len(quiz_questions),
+                           {i: q['opts'].index(answers[i]) for i, q in enumerate(quiz_questions) if answers[i]})
         
         if st.session_state.pb_quiz_submitted:
             pct = (st.session_state.pb_quiz_score / len(quiz_questions)) * 100
             
             if pct >= 75:
                 st.success(f"🎉 Ausgezeichnet! {st.session_state.pb_quiz_score}/{len(quiz_questions)} ({pct:.0f}%)")
-                st.balloons()
+                # Only right after submitting, not on every later rerun
+                if st.session_state.pop('pb_quiz_celebrate', False):
+                    st.balloons()
             elif pct >= 50:
                 st.warning(f"📚 Gut! {st.session_state.pb_quiz_score}/{len(quiz_questions)} ({pct:.0f}%) – Wiederhole die schwächeren Themen.")
             else:
@@ -1815,5 +1880,15 @@ print(f"Mit MwSt: {total + tax:.2f} Euro")
         Du vertiefst Boolean-Logik, lernst Funktionen zu definieren, und arbeitest mit Listen und Tuples!
         """)
 
-
-
+    render_lazy_tabs([
+        ("🐍 Warum Python?", tab_why_python),
+        ("📦 Variablen", tab_variables),
+        ("📥 Datentypen", tab_types),
+        ("➕ Arithmetik", tab_arithmetic),
+        ("🎤 I/O", tab_io),
+        ("❓ If-Else", tab_if_else),
+        ("🔁 Schleifen", tab_loops),
+        ("🎲 Zufall", tab_random),
+        ("💻 Übungen", tab_exercises),
+        ("📝 Quiz & Zusammenfassung", tab_quiz)
+    ], key="pb_tabs")
@@ -1,34 +1,30 @@
 import streamlit as st
+from infrastructure import render_lazy_tabs
+from infrastructure.content_cache import site_content
 
 TITLE = "12. Quick Reference (Demo)"
 
+LOCKED_TABS = [
+    "🐍 Python Basics 🔒",
+    "🔁 Control & Functions 🔒",
+    "📦 Data Structures 🔒",
+    "🏗 OOP 🔒",
+    "📊 Data Science 1 🔒",
+    "📊 Data Science 2 🔒",
+    "💾 SQL & Databases 🔒",
+    "🌐 Networks & APIs 🔒",
+    "🤖 ML Fundamentals 🔒",
+    "🎯 ML Classification 🔒",
+    "📁 File I/O & Modules 🔒",
+    "⚡ Advanced Python 🔒",
+    "📐 Formeln & Konzepte 🔒",
+    "🧠 Mental Models 🔒"
+]
+
 
 def show_cta_banner():
     """Display prominent call-to-action banner for full access"""
-    st.markdown("""
-    <div style="
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 16px;
-        text-align: center;
-        margin: 2rem 0;
-        box-shadow: 0 10px 40px rgba(102, 126, 234, 0.3);
-    ">
-        <h2 style="color: white; margin-bottom: 0.5rem;">🔓 Möchtest du vollen Zugang?</h2>
-        <p style="color: rgba(255,255,255,0.9); font-size: 1.1rem; margin-bottom: 1.5rem;">
-            Schalte alle 12 Kapitel, 2 Mock Exams und interaktive Übungen frei!
-        </p>
-        <div style="
-            background: white;
-            display: inline-block;
-            padding: 1rem 2rem;
-            border-radius: 8px;
-            font-weight: bold;
-        ">
-            ✉️ Schreibe eine Mail an: <a href="mailto:luca@eatomics.com" style="color: #667eea;">luca@eatomics.com</a>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(site_content()["cta_html"], unsafe_allow_html=True)
 
 
 def show_locked_tab():
@@ -61,27 +57,8 @@ def run():
     In dieser Demo ist nur der **Computing Basics** Tab verfügbar.
     """)
     
-    # Match all tabs from the main version
-    tabs = st.tabs([
-        "💻 Computing Basics ✅", 
-        "🐍 Python Basics 🔒", 
-        "🔁 Control & Functions 🔒", 
-        "📦 Data Structures 🔒", 
-        "🏗 OOP 🔒", 
-        "📊 Data Science 1 🔒", 
-        "📊 Data Science 2 🔒", 
-        "💾 SQL & Databases 🔒", 
-        "🌐 Networks & APIs 🔒", 
-        "🤖 ML Fundamentals 🔒", 
-        "🎯 ML Classification 🔒",
-        "📁 File I/O & Modules 🔒",
-        "⚡ Advanced Python 🔒",
-        "📐 Formeln & Konzepte 🔒",
-        "🧠 Mental Models 🔒"
-    ])
-    
     # --- TAB 1: Computing Basics (Available in Demo) ---
-    with tabs[0]:
+    def tab_computing_basics():
         st.subheader("💻 Computing Basics - Quick Reference")
         
         col_ref1, col_ref2 = st.columns(2)
@@ -187,9 +164,10 @@ def run():
         st.success("✅ **Merksatz:** Dezimal für Menschen (10 Finger), Binär für Maschinen (An/Aus).")
     
     # --- LOCKED TABS (all remaining 14 tabs) ---
-    for i in range(1, 15):
-        with tabs[i]:
-            show_locked_tab()
+    locked_tabs = [(label, show_locked_tab) for label in LOCKED_TABS]
+    
+    # Match all tabs from the main version; only the active one is rendered
+    render_lazy_tabs([("💻 Computing Basics ✅", tab_computing_basics)] + locked_tabs, key="qr_tabs")
 
 
 if __name__ == "__main__":
@@ -1,43 +1,43 @@
 import streamlit as st
 
-def render_diagram(dot_code: str, height: int = 500, use_container_width: bool = False):
+from infrastructure.diagrams import (
+    HIGHLIGHT_EDGE, HIGHLIGHT_NODE, prebuilt_url, render_svg, restyle_svg, show_svg, show_svg_url, style_overrides,
+    wrap_dot,
+)
+from infrastructure.fragments import interactive_fragment
+from infrastructure.lazy_imports import lazy_import
+from infrastructure.lazy_tabs import render_lazy_tabs
+from infrastructure.timing import timed
+
+__all__ = [
+    "HIGHLIGHT_EDGE", "HIGHLIGHT_NODE", "interactive_fragment", "lazy_import", "render_diagram", "render_lazy_tabs",
+    "timed",
+]
+
+@timed("render_diagram")
+def render_diagram(dot_code: str, height: int = 500, use_container_width: bool = False, styles=None):
     """
     Renders a Graphviz diagram natively in Streamlit.
     Default styling is applied to ensure a professional look.
+    Prebuilt diagrams are referenced by their static URL; with a local ``dot``
+    binary all others are embedded as cached SVG, otherwise the browser lays
+    the diagram out.
+    ``styles`` ({"NODE": {"fillcolor": ...}, "A->B": {"color": ...}}) highlights
+    elements per widget value without laying the diagram out again.
     """
-    # Wrap in a basic digraph if not already provided
-    if not dot_code.strip().startswith(("digraph", "graph")):
-        dot_code = f'''digraph {{
-    graph [
-        rankdir=LR, 
-        center=true, 
-        bgcolor="transparent",
-        nodesep=0.4,
-        ranksep=0.4,
-        margin=0.2,
-        pad=0.2,
-        fontname="Inter, Segoe UI, Roboto, Helvetica, Arial, sans-serif"
-    ];
-    node [
-        shape=rect, 
-        style="filled,rounded", 
-        fontname="Inter, Segoe UI, Roboto, Helvetica, Arial, sans-serif", 
-        fillcolor="#FFFFFF", 
-        color="#E1E4E8", 
-        fontcolor="#24292E",
-        fontsize=12,
-        penwidth=1.5,
-        width=2.5,
-        height=0.6
-    ];
-    edge [
-        color="#8B949E", 
-        arrowsize=0.8, 
-        penwidth=1.2,
-        fontname="Inter, Segoe UI, Roboto, Helvetica, Arial, sans-serif",
-        fontsize=10
-    ];
-    {dot_code}
-}}'''
+    dot_code = wrap_dot(dot_code)
     
-    st.graphviz_chart(dot_code, use_container_width=use_container_width)
+    url = prebuilt_url(dot_code) if not styles else None
+    if url is not None:
+        show_svg_url(url, use_container_width=use_container_width)
+        return
+
+    svg = render_svg(dot_code)
+    if svg is not None:
+        if styles:
+            svg = restyle_svg(dot_code, svg, styles)
+        show_svg(svg, use_container_width=use_container_width)
+    else:
+        if styles:
+            dot_code = style_overrides(dot_code, styles)
+        st.graphviz_chart(dot_code, use_container_width=use_container_width)
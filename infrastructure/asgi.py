@@ -0,0 +1,99 @@
+"""
+ASGI Entry Point
+
+Runs the app with any ASGI server and marks the fingerprinted static assets
+(``app/static/...``, see static_assets) as immutable, so browsers never
+revalidate them:
+    uvicorn infrastructure.asgi:app --port 8501
+
+It also gives every browser a random learner id in an HttpOnly cookie, under
+which exam attempts are stored (see attempt_store.learner_id); under
+``streamlit run`` the id lives in the URL instead.
+
+Requires Streamlit with ``st.App`` (1.53+, requirements.txt asks for 1.56);
+``streamlit run app.py`` keeps working without it.
+"""
+
+import os
+import secrets
+from http.cookies import SimpleCookie
+
+import streamlit as st
+
+from infrastructure.attempt_store import LEARNER_COOKIE
+from infrastructure.static_assets import STATIC_URL
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+IMMUTABLE = b"public, max-age=31536000, immutable"
+LEARNER_COOKIE_MAX_AGE = 365 * 24 * 3600
+
+
+class ImmutableStaticMiddleware:
+    """Set long-lived cache headers on static assets (their names change with their content)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "") if scope["type"] == "http" else ""
+        if f"/{STATIC_URL}/" not in path or path.endswith(".json"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = [(k, v) for k, v in message.get("headers", []) if k.lower() != b"cache-control"]
+                message = dict(message, headers=headers + [(b"cache-control", IMMUTABLE)])
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+class LearnerCookieMiddleware:
+    """Set a random learner id cookie on the app page if the browser has none yet."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (scope["type"] != "http" or scope["method"] != "GET"
+                or scope["path"].startswith("/_stcore/") or _has_learner_cookie(scope)):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and _is_html(message):
+                cookie = (f"{LEARNER_COOKIE}={secrets.token_urlsafe(16)}; Path=/; "
+                          f"Max-Age={LEARNER_COOKIE_MAX_AGE}; HttpOnly; SameSite=Lax")
+                message = dict(message, headers=list(message.get("headers", [])) + [
+                    (b"set-cookie", cookie.encode("latin-1"))
+                ])
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+def _has_learner_cookie(scope) -> bool:
+    for name, value in scope.get("headers", []):
+        if name == b"cookie" and LEARNER_COOKIE in SimpleCookie(value.decode("latin-1")):
+            return True
+    return False
+
+
+def _is_html(message) -> bool:
+    return any(name.lower() == b"content-type" and value.startswith(b"text/html")
+               for name, value in message.get("headers", []))
+
+
+def _create_app():
+    from starlette.middleware import Middleware
+
+    if not hasattr(st, "App"):
+        raise RuntimeError("ASGI serving needs Streamlit with st.App, use `streamlit run app.py` instead")
+    return st.App(APP_PATH, middleware=[
+        Middleware(ImmutableStaticMiddleware),
+        Middleware(LearnerCookieMiddleware),
+    ])
+
+
+app = _create_app()
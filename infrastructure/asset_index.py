@@ -0,0 +1,165 @@
+"""
+Asset Index Module
+
+Resolves the image references in question texts (``![alt](mock_exam_images/x.png)``)
+through an index of the image files below ASSET_ROOTS, built once per process,
+instead of probing candidate directories with ``os.path.exists`` on every
+render. A reference matches a path relative to an asset root or, as before,
+just the file name.
+
+Question texts are compiled once into segments (compile_segments): text
+pieces and images with their reference already resolved. Rendering, the
+missing-image check and the results view all walk these segments.
+
+References without a file are reported when an exam is loaded (see
+``content_cache.exam_content``) and by the build check:
+    python -m infrastructure.asset_index [chapters/mock1.py ...]
+which exits with 1 if an exam module references a missing image.
+"""
+
+import glob
+import importlib
+import logging
+import os
+import re
+import sys
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+import streamlit as st
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Searched in this order, the first file wins for duplicate references
+ASSET_ROOTS = [
+    os.path.join(REPO_ROOT, "chapters"),
+    os.path.join(REPO_ROOT, "subjects", "CS", "assets"),
+]
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg")
+IMAGE_RE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TextSegment(NamedTuple):
+    """Markdown between images."""
+    text: str
+
+
+class ImageSegment(NamedTuple):
+    """An image reference; path is None if no indexed file matches."""
+    alt: str
+    reference: str
+    path: Optional[str]
+
+
+Segment = Union[TextSegment, ImageSegment]
+
+
+def build_index(roots: Iterable[str] = ASSET_ROOTS) -> Mapping[str, str]:
+    """
+    Map every image below the roots to its absolute path.
+
+    Returns:
+        Read-only {reference: path}, keyed by the path relative to its root
+        (``mock_exam_images/x.png``) and by the file name (``x.png``)
+    """
+    index = {}
+    for root in roots:
+        for dirpath, _, filenames in sorted(os.walk(root)):
+            for name in sorted(filenames):
+                if not name.lower().endswith(IMAGE_EXTENSIONS):
+                    continue
+                path = os.path.join(dirpath, name)
+                index.setdefault(os.path.relpath(path, root).replace(os.sep, "/"), path)
+                index.setdefault(name, path)
+    return MappingProxyType(index)
+
+
+@st.cache_resource(show_spinner=False)
+def asset_index() -> Mapping[str, str]:
+    """Return the process-wide image index (see build_index)."""
+    return build_index()
+
+
+def resolve_image(reference: str, index: Mapping[str, str] = None) -> Optional[str]:
+    """
+    Look up the file of an image reference.
+
+    Returns:
+        Absolute path, or None if no indexed file matches
+    """
+    index = asset_index() if index is None else index
+    reference = reference.strip().replace("\\", "/")
+    return index.get(reference) or index.get(os.path.basename(reference))
+
+
+def compile_segments(text: str, index: Mapping[str, str] = None) -> Tuple[Segment, ...]:
+    """
+    Split a markdown text into text and image segments, resolving the images.
+
+    Returns:
+        Tuple of TextSegment/ImageSegment in order (blank text is dropped)
+    """
+    index = asset_index() if index is None else index
+    segments = []
+    pos = 0
+    for match in IMAGE_RE.finditer(text):
+        if text[pos:match.start()].strip():
+            segments.append(TextSegment(text[pos:match.start()]))
+        alt, reference = match.group(1), match.group(2)
+        segments.append(ImageSegment(alt, reference, resolve_image(reference, index)))
+        pos = match.end()
+    if text[pos:].strip():
+        segments.append(TextSegment(text[pos:]))
+    return tuple(segments)
+
+
+def question_segments(q: Mapping, index: Mapping[str, str] = None) -> Tuple[Segment, ...]:
+    """Compiled segments of a question (precompiled by exam_content, else compiled now)."""
+    segments = q.get("segments")
+    return segments if segments is not None else compile_segments(q["question"], index)
+
+
+def unknown_references(questions: Iterable[Mapping], index: Mapping[str, str] = None) -> List[Tuple[str, str]]:
+    """
+    Find the image references without a file.
+
+    Returns:
+        List of (question id, reference)
+    """
+    return [
+        (str(q["id"]), segment.reference)
+        for q in questions
+        for segment in question_segments(q, index)
+        if isinstance(segment, ImageSegment) and segment.path is None
+    ]
+
+
+def report_unknown(source: str, questions: Iterable[Mapping], index: Mapping[str, str] = None) -> List[Tuple[str, str]]:
+    """Log the unknown image references of an exam; returns them as well."""
+    unknown = unknown_references(questions, index)
+    for question_id, reference in unknown:
+        _LOGGER.warning("%s: question %s references missing image %s", source, question_id, reference)
+    return unknown
+
+
+def main():
+    paths = sys.argv[1:] or sorted(glob.glob(os.path.join(REPO_ROOT, "chapters", "*.py")))
+    index = build_index()
+    print(f"{len(index)} image references indexed below {len(ASSET_ROOTS)} roots")
+
+    missing = 0
+    for path in paths:
+        module_name = os.path.splitext(os.path.relpath(path, REPO_ROOT))[0].replace(os.sep, ".")
+        module = importlib.import_module(module_name)
+        questions = getattr(module, "QUESTIONS", None)
+        if questions is None:
+            continue
+        for question_id, reference in unknown_references(questions, index):
+            print(f"  missing: {module_name} question {question_id}: {reference}")
+            missing += 1
+    sys.exit(1 if missing else 0)
+
+
+if __name__ == "__main__":
+    main()
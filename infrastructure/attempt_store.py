@@ -0,0 +1,280 @@
+"""
+Attempt Store Module
+
+Persists submitted exam attempts and quiz scores in a local SQLite database
+(``LERNAPP_ATTEMPT_DB``, default: ``.data/attempts.sqlite3``), so they survive
+a page refresh or a server restart instead of living only in session state.
+
+The database runs in WAL mode: readers never wait for the writer. Submitting
+only queues the attempt; one background thread writes queued attempts in
+batches (one transaction per batch), so a submission never blocks a rerun on
+disk. Reads share one connection behind a lock (script threads are
+short-lived, one per rerun). The latest attempt per learner and exam is
+answered from the ``attempts_latest`` index.
+
+Learners are identified by their login (``st.user``), else by the random
+HttpOnly cookie the ASGI entry point sets (see infrastructure.asgi). Under
+``streamlit run`` neither may exist; the learner then gets a random id in the
+``learner`` query parameter (see learner_id), so a refreshed or bookmarked
+page finds its attempts again. Anyone given such a link shares its attempts.
+Benchmark: ``python -m benchmarks.attempt_store``.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import re
+import secrets
+import time
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional
+
+import streamlit as st
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DB_PATH = os.environ.get("LERNAPP_ATTEMPT_DB", os.path.join(REPO_ROOT, ".data", "attempts.sqlite3"))
+BATCH_SIZE = 500
+LEARNER_COOKIE = "lernapp_learner"
+LEARNER_PARAM = "learner"
+_LEARNER_TOKEN = re.compile(r"[A-Za-z0-9_-]{16,64}")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    learner TEXT NOT NULL,
+    exam TEXT NOT NULL,
+    exam_version TEXT,
+    submitted_at REAL NOT NULL,
+    correct INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    answers TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS attempts_latest ON attempts (exam, learner, submitted_at);
+"""
+
+_STOP = object()  # queued by close, ends the writer after its batch
+_COLUMNS = "learner, exam, exam_version, submitted_at, correct, total, answers"
+_LOGGER = logging.getLogger(__name__)
+
+
+class Attempt(NamedTuple):
+    """One submitted exam or quiz."""
+    learner: str
+    exam: str
+    correct: int
+    total: int
+    answers: Mapping[Any, Any] = MappingProxyType({})  # {question_id: compact answer}
+    exam_version: Optional[str] = None
+    submitted_at: float = 0.0
+
+
+def pack_answers(answers: Mapping[Any, Any]) -> str:
+    """Serialise compact answers (bitmasks, outcome id tuples) as a short JSON list of pairs."""
+    return json.dumps(sorted(answers.items(), key=lambda item: repr(item[0])), separators=(",", ":"))
+
+
+def unpack_answers(packed: str) -> Dict[Any, Any]:
+    """Inverse of pack_answers (outcome id tuples come back as tuples)."""
+    return {qid: tuple(answer) if isinstance(answer, list) else answer for qid, answer in json.loads(packed)}
+
+
+class AttemptStore:
+    """
+    SQLite attempt store with a batching background writer.
+
+    Usage:
+        store = AttemptStore(path)
+        store.submit(Attempt("learner", "mock1", 4, 5, answers))
+        store.latest("learner", "mock1")
+        store.close()  # writes what is still queued
+    """
+
+    def __init__(self, path: str = DB_PATH, batch_size: int = BATCH_SIZE):
+        """
+        Raises:
+            OSError, sqlite3.Error: If the database cannot be created
+        """
+        self.path = path
+        self.batch_size = batch_size
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._reader = self._connect(check_same_thread=False)
+        self._read_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._stats = {"submitted": 0, "written": 0, "failed": 0, "batches": 0}
+        self._writer = threading.Thread(target=self._write_loop, name="attempt-store-writer", daemon=True)
+        self._writer.start()
+
+    def submit(self, attempt: Attempt):
+        """Queue an attempt for writing (stamped with the current time if unset); returns at once."""
+        if not attempt.submitted_at:
+            attempt = attempt._replace(submitted_at=time.time())
+        with self._lock:
+            self._stats["submitted"] += 1
+        self._queue.put(attempt)
+
+    def flush(self, timeout: float = None) -> bool:
+        """Wait until everything submitted so far is written; False on timeout."""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float = None) -> bool:
+        """Write everything submitted so far, stop the writer and close the database; False on timeout."""
+        self._queue.put(_STOP)
+        self._writer.join(timeout)
+        if self._writer.is_alive():
+            return False
+        with self._read_lock:
+            self._reader.close()
+        return True
+
+    def latest(self, learner: str, exam: str) -> Optional[Attempt]:
+        """The learner's most recent written attempt at an exam, or None."""
+        rows = self._read(
+            f"SELECT {_COLUMNS} FROM attempts WHERE exam = ? AND learner = ? "
+            "ORDER BY submitted_at DESC LIMIT 1",
+            (exam, learner),
+        )
+        return _attempt(rows[0]) if rows else None
+
+    def latest_per_learner(self, exam: str) -> List[Attempt]:
+        """The most recent written attempt of every learner at an exam."""
+        # SQLite takes the bare columns of a MAX() aggregate from the row holding the maximum
+        rows = self._read(
+            "SELECT learner, exam, exam_version, MAX(submitted_at), correct, total, answers "
+            "FROM attempts WHERE exam = ? GROUP BY learner",
+            (exam,),
+        )
+        return [_attempt(row) for row in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        """Submitted, written and failed attempts, batches and queue depth."""
+        with self._lock:
+            stats = dict(self._stats, queue_depth=self._queue.qsize())
+        if stats["batches"]:
+            stats["avg_batch"] = (stats["written"] + stats["failed"]) / stats["batches"]
+        return stats
+
+    def _connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=check_same_thread)
+        # Durable at every WAL checkpoint; a crash loses at most the last batches
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _read(self, sql: str, params: tuple) -> List[tuple]:
+        # Lookups take microseconds on the index, so one shared connection
+        # serves all sessions without opening a connection per rerun thread
+        with self._read_lock:
+            return self._reader.execute(sql, params).fetchall()
+
+    def _write_loop(self):
+        conn = self._connect()
+        stopped = False
+        while not stopped:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            attempts = [item for item in batch if isinstance(item, Attempt)]
+            if attempts:
+                self._write(conn, attempts)
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+            stopped = _STOP in batch
+        conn.close()
+
+    def _write(self, conn: sqlite3.Connection, attempts: List[Attempt]):
+        rows = [
+            (a.learner, a.exam, a.exam_version, a.submitted_at, a.correct, a.total, pack_answers(a.answers))
+            for a in attempts
+        ]
+        try:
+            with conn:
+                conn.executemany(f"INSERT INTO attempts ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        except sqlite3.Error:
+            _LOGGER.exception("Could not write %d attempts to %s", len(rows), self.path)
+            outcome = "failed"
+        else:
+            outcome = "written"
+        with self._lock:
+            self._stats[outcome] += len(rows)
+            self._stats["batches"] += 1
+
+
+def _attempt(row) -> Attempt:
+    learner, exam, exam_version, submitted_at, correct, total, answers = row
+    return Attempt(learner, exam, correct, total, MappingProxyType(unpack_answers(answers)),
+                   exam_version, submitted_at)
+
+
+@st.cache_resource(show_spinner=False)
+def get_attempt_store() -> Optional[AttemptStore]:
+    """Return the process-wide attempt store, or None if the database cannot be opened."""
+    try:
+        store = AttemptStore()
+    except (OSError, sqlite3.Error):
+        _LOGGER.exception("Attempt store %s unavailable, attempts are kept in the session only", DB_PATH)
+        return None
+    # The writer is a daemon thread; write the queued attempts before the server exits
+    atexit.register(store.close, timeout=10)
+    return store
+
+
+def learner_id() -> str:
+    """
+    The current learner's id.
+
+    Logged-in users (``st.user``) are identified by their account, everyone
+    else by the server-set ``LEARNER_COOKIE`` (see infrastructure.asgi). Without
+    the cookie (``streamlit run``) a random id is kept in the ``learner`` query
+    parameter and in session state, which puts it back after page switches;
+    app.py calls this on every rerun for that.
+    """
+    user = st.user
+    if user.get("is_logged_in") is True:
+        account = user.get("sub") or user.get("email")
+        if isinstance(account, str) and account:
+            return f"user:{account}"
+    token = st.context.cookies.get(LEARNER_COOKIE)
+    if isinstance(token, str) and _LEARNER_TOKEN.fullmatch(token):
+        return f"cookie:{token}"
+
+    token = st.query_params.get(LEARNER_PARAM)
+    if not (isinstance(token, str) and _LEARNER_TOKEN.fullmatch(token)):
+        token = st.session_state.get("_learner") or secrets.token_urlsafe(16)
+        st.query_params[LEARNER_PARAM] = token
+    st.session_state["_learner"] = token
+    return f"link:{token}"
+
+
+def record_attempt(exam: str, correct: int, total: int, answers: Mapping[Any, Any] = None,
+                   exam_version: str = None):
+    """Queue an attempt of the current learner (no-op without a store)."""
+    store = get_attempt_store()
+    if store is not None:
+        store.submit(Attempt(learner_id(), exam, correct, total, dict(answers or {}), exam_version))
+
+
+def latest_attempt(exam: str) -> Optional[Attempt]:
+    """The current learner's latest attempt at an exam, or None."""
+    store = get_attempt_store()
+    if store is None:
+        return None
+    try:
+        return store.latest(learner_id(), exam)
+    except sqlite3.Error:
+        _LOGGER.exception("Could not read attempts from %s", store.path)
+        return None
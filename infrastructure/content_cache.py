@@ -0,0 +1,130 @@
+"""
+Content Cache Module
+
+Process-wide, read-only cache of the static page content: the chapter and
+exam catalog, the home page and call-to-action markup and the mock exam
+questions. Everything is loaded once per server process with
+``st.cache_resource`` (so all sessions share one copy and memory stays flat as
+sessions grow) and frozen into mapping proxies and tuples, so no session can
+modify the shared objects.
+
+Derived data (menu titles, status icons, rendered locked-chapter previews,
+question lookups by id, compiled questions with their answer keys) is
+precomputed at load time instead of on every rerun. Loading an exam also
+logs its image references that have no file (see report_unknown).
+"""
+
+import hashlib
+import importlib
+import textwrap
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import streamlit as st
+
+from infrastructure.asset_index import report_unknown
+from infrastructure.questions import Question
+
+
+def freeze(obj: Any) -> Any:
+    """
+    Return a read-only deep copy: dicts become mapping proxies, lists tuples.
+
+    Args:
+        obj: Nested dicts/lists/tuples of plain values (named tuples are
+            immutable already and kept)
+
+    Returns:
+        Frozen structure with the same item access (``q['options'][0]``)
+    """
+    if isinstance(obj, MappingProxyType):
+        return obj  # already frozen, keep shared references shared
+    if isinstance(obj, Mapping):
+        return MappingProxyType({key: freeze(value) for key, value in obj.items()})
+    if isinstance(obj, (list, tuple)) and not hasattr(obj, "_fields"):
+        return tuple(freeze(item) for item in obj)
+    return obj
+
+
+def _markup(text: str) -> str:
+    # st.markdown dedents on every call, do it once here
+    return textwrap.dedent(text).strip()
+
+
+@st.cache_resource(show_spinner=False)
+def site_content() -> Mapping[str, Any]:
+    """
+    Load the demo catalog and static markup once per process.
+
+    Returns:
+        Frozen mapping with
+        - chapters, mock_exams: the catalog entries
+        - pages: {page_id: {title, icon, section, meta, locked_html,
+          tabs_preview_html, tab_count}} for every chapter and exam page
+        - cta_html, hero_html, feature_cards_html, demo_contents_md,
+          chapter_overview_md, demo_badge_html: dedented static markup
+    """
+    from chapters import catalog
+
+    pages = {}
+    for section, entries in (("Kapitel", catalog.CHAPTERS), ("Mock Exams", catalog.MOCK_EXAMS)):
+        for entry in entries:
+            page_id = f"chapter-{entry['id']}" if section == "Kapitel" else entry["id"]
+            # Exam titles carry their own 📝, the icon slot shows the status
+            title = entry["title"].replace("📝 ", "")
+            icon = catalog.STATUS_ICONS[entry["available"]]
+            # Locked exams show no section preview, only chapters list their tabs
+            tabs = catalog.CHAPTER_TABS.get(entry["id"], []) if section == "Kapitel" else []
+            pages[page_id] = {
+                "title": title,
+                "icon": icon,
+                "section": section,
+                "meta": entry,
+                "locked_html": _markup(catalog.LOCKED_CHAPTER_HTML.format(
+                    emoji=entry.get("emoji", "📝"),
+                    title=entry["title"],
+                    description=entry["description"],
+                )),
+                "tabs_preview_html": _markup(catalog.TAB_PREVIEW_HTML.format(tabs=" | ".join(tabs))) if tabs else "",
+                "tab_count": len(tabs),
+            }
+
+    return freeze({
+        "contact_email": catalog.CONTACT_EMAIL,
+        "chapters": catalog.CHAPTERS,
+        "mock_exams": catalog.MOCK_EXAMS,
+        "pages": pages,
+        "cta_html": _markup(catalog.CTA_BANNER_HTML),
+        "hero_html": _markup(catalog.HERO_HTML),
+        "feature_cards_html": [_markup(card) for card in catalog.FEATURE_CARDS_HTML],
+        "demo_contents_md": _markup(catalog.DEMO_CONTENTS_MD),
+        "chapter_overview_md": _markup(catalog.CHAPTER_OVERVIEW_MD),
+        "demo_badge_html": _markup(catalog.DEMO_BADGE_HTML),
+    })
+
+
+@st.cache_resource(show_spinner=False)
+def exam_content(module_name: str) -> Mapping[str, Any]:
+    """
+    Load a mock exam module's questions once per process.
+
+    Args:
+        module_name: Dotted module defining TITLE, SECTIONS and QUESTIONS
+
+    Returns:
+        Frozen mapping with title, version (content hash), sections,
+        questions (tuple of compiled questions, see questions.Question) and
+        by_id {question_id: question}
+    """
+    module = importlib.import_module(module_name)
+    questions = tuple(Question.compile(q) for q in module.QUESTIONS)
+    report_unknown(module_name, questions)
+
+    return freeze({
+        "title": module.TITLE,
+        # Changes with any question, keys memoised grading results
+        "version": hashlib.sha256(repr((module.TITLE, module.SECTIONS, module.QUESTIONS)).encode("utf-8")).hexdigest()[:16],
+        "sections": module.SECTIONS,
+        "questions": questions,
+        "by_id": {q.id: q for q in questions},
+    })
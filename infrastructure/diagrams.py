@@ -0,0 +1,367 @@
+"""
+Diagrams Module
+
+Server-side Graphviz rendering. ``st.graphviz_chart`` lays out every diagram
+in the browser with a WebAssembly Graphviz on each render, which is slow on
+low-end laptops and tablets. When the ``dot`` binary is installed, diagrams are
+instead rendered once per unique DOT source to SVG on the server and embedded
+directly. The SVG is cached in memory and on disk (``LERNAPP_DIAGRAM_CACHE``,
+default: ``.diagram_cache/``), keyed by the SHA-256 of the DOT source, so a
+restarted server does not lay out known diagrams again.
+
+Diagrams with literal DOT sources are prebuilt at build time into
+``static/diagrams`` (see ``python -m infrastructure.precompile_diagrams``);
+they are served from that manifest without running Graphviz, even on servers
+without ``dot``, and referenced by their static URL (see static_assets) so
+browsers cache them.
+
+Set ``LERNAPP_DIAGRAMS=client`` to always use the browser path; it is also the
+fallback when a diagram is not prebuilt and ``dot`` is missing or fails on it.
+
+Diagrams that highlight a node or edge depending on a widget pass ``styles``
+(see restyle_svg): the graph structure is laid out once and every widget value
+only patches colours and labels in the cached SVG.
+"""
+
+import hashlib
+import html
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+import streamlit as st
+
+from infrastructure.static_assets import STATIC_DIR, static_url
+
+DOT_BINARY = shutil.which("dot")
+CLIENT_ONLY = os.environ.get("LERNAPP_DIAGRAMS", "server") == "client"
+SERVER_RENDERING = DOT_BINARY is not None and not CLIENT_ONLY
+CACHE_DIR = os.environ.get("LERNAPP_DIAGRAM_CACHE", ".diagram_cache")
+ASSETS_DIR = os.path.join(STATIC_DIR, "diagrams")
+MANIFEST_NAME = "manifest.json"
+DOT_TIMEOUT = 10
+
+_LOGGER = logging.getLogger(__name__)
+
+_svg_cache: Dict[str, str] = {}
+# Graphs dot rejected, they go to the browser path without retrying
+_failed: Set[str] = set()
+_manifest: Optional[Dict[str, Dict]] = None
+# Restyle templates by source hash: (SVG split around the node/edge groups,
+# {element id: indices of its groups in that list})
+_templates: Dict[str, Tuple[List[str], Dict[str, List[int]]]] = {}
+_cache_lock = threading.Lock()
+
+DEFAULT_STYLE = '''
+    graph [
+        rankdir=LR,
+        center=true,
+        bgcolor="transparent",
+        nodesep=0.4,
+        ranksep=0.4,
+        margin=0.2,
+        pad=0.2,
+        fontname="Inter, Segoe UI, Roboto, Helvetica, Arial, sans-serif"
+    ];
+    node [
+        shape=rect,
+        style="filled,rounded",
+        fontname="Inter, Segoe UI, Roboto, Helvetica, Arial, sans-serif",
+        fillcolor="#FFFFFF",
+        color="#E1E4E8",
+        fontcolor="#24292E",
+        fontsize=12,
+        penwidth=1.5,
+        width=2.5,
+        height=0.6
+    ];
+    edge [
+        color="#8B949E",
+        arrowsize=0.8,
+        penwidth=1.2,
+        fontname="Inter, Segoe UI, Roboto, Helvetica, Arial, sans-serif",
+        fontsize=10
+    ];'''
+
+# Styles for render_diagram(..., styles=...) highlighting the active path
+HIGHLIGHT_NODE = {"fillcolor": "#fff59d", "color": "#f9a825", "penwidth": 2.5}
+HIGHLIGHT_EDGE = {"color": "#f9a825", "penwidth": 2.5, "fontcolor": "#e65100"}
+
+
+def wrap_dot(dot_code: str) -> str:
+    """Wrap a DOT body in a digraph with the default styling (full graphs pass through)."""
+    if dot_code.strip().startswith(("digraph", "graph")):
+        return dot_code
+    return f'''digraph {{{DEFAULT_STYLE}
+    {dot_code}
+}}'''
+
+
+class DotRejected(RuntimeError):
+    """``dot`` exited with an error on the graph itself (e.g. a syntax error); retrying fails again."""
+
+
+def dot_hash(dot_source: str) -> str:
+    """Content hash used as cache key and file name of a diagram."""
+    return hashlib.sha256(dot_source.encode("utf-8")).hexdigest()
+
+
+def render_svg(dot_source: str) -> Optional[str]:
+    """
+    Return the SVG of a complete DOT graph, laying it out at most once.
+
+    Looks up the memory cache, the prebuilt manifest, the disk cache and only
+    then runs ``dot`` (if server rendering is enabled).
+
+    Args:
+        dot_source: Complete DOT graph (see wrap_dot)
+
+    Returns:
+        SVG markup (without XML prolog), or None if the graph has to be laid
+        out in the browser
+    """
+    if CLIENT_ONLY:
+        return None
+    key = dot_hash(dot_source)
+    svg = _svg_cache.get(key)
+    if svg is not None or key in _failed:
+        return svg
+
+    svg = _read_prebuilt(key)
+    if svg is None and SERVER_RENDERING:
+        path = os.path.join(CACHE_DIR, f"{key}.svg")
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                svg = f.read()
+        else:
+            # Imported here, the pool module depends on this one
+            from infrastructure.dot_pool import get_pool
+            try:
+                svg = get_pool().render(dot_source)
+            except DotRejected as exc:
+                _LOGGER.warning("%s", exc)
+            except RuntimeError as exc:
+                # Timeout or backlog: the browser lays it out this time, the next rerun retries
+                _LOGGER.warning("%s", exc)
+                return None
+            else:
+                _write_atomic(path, svg)
+    if svg is None:
+        with _cache_lock:
+            _failed.add(key)
+        return None
+
+    with _cache_lock:
+        _svg_cache[key] = svg
+    return svg
+
+
+def load_manifest() -> Dict[str, Dict]:
+    """Prebuilt diagrams {source hash: {"file": ..., "sources": [...]}}, read once."""
+    global _manifest
+    if _manifest is None:
+        path = os.path.join(ASSETS_DIR, MANIFEST_NAME)
+        try:
+            with open(path, encoding="utf-8") as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def prebuilt_url(dot_source: str) -> Optional[str]:
+    """Static URL of a prebuilt diagram, or None (not prebuilt, static serving off)."""
+    if CLIENT_ONLY:
+        return None
+    entry = load_manifest().get(dot_hash(dot_source))
+    return static_url(os.path.join(ASSETS_DIR, entry["file"])) if entry is not None else None
+
+
+def _read_prebuilt(key: str) -> Optional[str]:
+    entry = load_manifest().get(key)
+    if entry is None:
+        return None
+    try:
+        with open(os.path.join(ASSETS_DIR, entry["file"]), encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def run_dot(dot_source: str, binary: str = None, timeout: float = DOT_TIMEOUT) -> str:
+    """
+    Lay out a DOT graph with a one-shot ``dot`` process (the worker pool in
+    ``infrastructure.dot_pool`` batches graphs through long-lived ones).
+
+    Args:
+        dot_source: DOT graph
+        binary: ``dot`` executable (default: DOT_BINARY)
+        timeout: Seconds before the process is killed
+
+    Returns:
+        SVG markup without XML prolog
+
+    Raises:
+        DotRejected: If ``dot`` exits with an error on the graph
+        RuntimeError: If ``dot`` is missing, times out or writes unreadable output
+    """
+    binary = binary or DOT_BINARY
+    if binary is None:
+        raise RuntimeError("dot failed: Graphviz 'dot' binary not found")
+    try:
+        result = subprocess.run(
+            [binary, "-Tsvg"], input=dot_source.encode("utf-8"),
+            capture_output=True, timeout=timeout, check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        raise RuntimeError(f"dot failed: {exc}") from exc
+    if result.returncode != 0:
+        raise DotRejected(f"dot failed: {result.stderr.decode('utf-8', 'replace').strip()}")
+    try:
+        svg = result.stdout.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise RuntimeError(f"dot failed: unreadable output ({exc})") from exc
+    # Drop the XML prolog and doctype, they are not valid inside HTML
+    return svg[svg.find("<svg"):]
+
+
+def _write_atomic(path: str, content: str):
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        # A read-only checkout still works, just without the disk cache
+        _LOGGER.warning("Could not write diagram cache %s: %s", path, exc)
+
+
+_GROUP_RE = re.compile(r'(<g id="[^"]*" class="(node|edge)">\s*<title>(.*?)</title>)(.*?)(</g>)', re.DOTALL)
+_SHAPE_RE = re.compile(r'<(path|polygon|ellipse|polyline)\b[^>]*>')
+_TEXT_RE = re.compile(r'(<text\b[^>]*>)(.*?)(</text>)', re.DOTALL)
+
+
+def restyle_svg(dot_source: str, svg: str, styles: Mapping[str, Mapping[str, str]]) -> str:
+    """
+    Apply colour and label changes to a laid-out diagram without running dot.
+
+    Args:
+        dot_source: Complete DOT graph the SVG was rendered from (cache key)
+        svg: SVG markup of dot_source
+        styles: {element id: {attribute: value}}; element ids are node names
+            (``"CHECK1"``) or edges (``"CHECK1->ADULT"``), attributes are
+            ``fillcolor``, ``color``, ``fontcolor``, ``penwidth`` and ``label``
+            (same length or shorter, the geometry does not change)
+
+    Returns:
+        Patched SVG markup
+    """
+    key = dot_hash(dot_source)
+    template = _templates.get(key)
+    if template is None:
+        template = _split_groups(svg)
+        with _cache_lock:
+            _templates[key] = template
+
+    parts, index = template
+    parts = list(parts)
+    for element, attrs in styles.items():
+        for i in index.get(element, ()):
+            parts[i] = _patch_group(parts[i], is_edge="->" in element or "--" in element, attrs=attrs)
+    return "".join(parts)
+
+
+def _split_groups(svg: str) -> Tuple[List[str], Dict[str, List[int]]]:
+    parts: List[str] = []
+    index: Dict[str, List[int]] = {}
+    pos = 0
+    for match in _GROUP_RE.finditer(svg):
+        parts.append(svg[pos:match.start()])
+        index.setdefault(html.unescape(match.group(3)), []).append(len(parts))
+        parts.append(match.group(0))
+        pos = match.end()
+    parts.append(svg[pos:])
+    return parts, index
+
+
+def _set_attribute(tag: str, name: str, value: str) -> str:
+    pattern = re.compile(rf'\s{name}="[^"]*"')
+    if pattern.search(tag):
+        return pattern.sub(f' {name}="{value}"', tag, count=1)
+    end = -2 if tag.endswith("/>") else -1
+    return f'{tag[:end]} {name}="{value}"{tag[end:]}'
+
+
+def _patch_group(group: str, is_edge: bool, attrs: Mapping[str, str]) -> str:
+    def patch_shape(match):
+        tag = match.group(0)
+        filled = 'fill="none"' not in tag
+        if "fillcolor" in attrs and filled and not is_edge:
+            tag = _set_attribute(tag, "fill", attrs["fillcolor"])
+        if "color" in attrs:
+            tag = _set_attribute(tag, "stroke", attrs["color"])
+            if is_edge and filled:
+                # Arrowheads are filled with the edge colour
+                tag = _set_attribute(tag, "fill", attrs["color"])
+        if "penwidth" in attrs:
+            tag = _set_attribute(tag, "stroke-width", str(attrs["penwidth"]))
+        return tag
+
+    group = _SHAPE_RE.sub(patch_shape, group)
+    if "fontcolor" in attrs:
+        group = _TEXT_RE.sub(lambda m: _set_attribute(m.group(1), "fill", attrs["fontcolor"]) + m.group(2) + m.group(3), group)
+    if "label" in attrs:
+        group = _TEXT_RE.sub(lambda m: m.group(1) + html.escape(attrs["label"]) + m.group(3), group, count=1)
+    return group
+
+
+_DOT_ID = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _dot_string(value: Any) -> str:
+    # A double-quoted DOT string; only " and \ need escaping
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def style_overrides(dot_source: str, styles: Mapping[str, Mapping[str, str]]) -> str:
+    """
+    Append the node styles as DOT attribute statements, for the browser path.
+
+    Edges cannot be re-declared without adding a second edge, so edge styles
+    only apply to server-rendered SVGs. Names and values are quoted, attributes
+    that are not plain DOT identifiers are dropped.
+    """
+    statements = []
+    for element, attrs in styles.items():
+        if "->" in element or "--" in element:
+            continue
+        attr_list = ", ".join(
+            f"{name}={_dot_string(value)}" for name, value in attrs.items() if _DOT_ID.fullmatch(name)
+        )
+        statements.append(f"    {_dot_string(element)} [{attr_list}];")
+    if not statements:
+        return dot_source
+    head, tail = dot_source.rsplit("}", 1)
+    return head + "\n".join(statements) + "\n}" + tail
+
+
+def show_svg_url(url: str, use_container_width: bool = False):
+    """Show a static SVG diagram by URL, the browser caches it."""
+    size = "width: 100%; height: auto;" if use_container_width else "max-width: 100%;"
+    st.html(f'<div style="display: flex; justify-content: center;"><img src="{url}" style="{size}"></div>')
+
+
+def show_svg(svg: str, use_container_width: bool = False):
+    """Embed a server-rendered SVG diagram."""
+    if use_container_width:
+        # Let the viewBox scale the drawing to the column width
+        head, rest = svg.split(">", 1)
+        head = re.sub(r'\s(width|height)="[^"]*"', "", head)
+        svg = f'{head} style="width: 100%; height: auto;">{rest}'
+    st.html(f'<div style="display: flex; justify-content: center; overflow-x: auto;">{svg}</div>')
@@ -0,0 +1,305 @@
+"""
+Dot Pool Module
+
+Pooled Graphviz backend for server-side diagram rendering. Spawning one
+``dot`` process per diagram costs more than laying out our small graphs, so
+a bounded set of worker threads (``LERNAPP_DOT_WORKERS``, default: 2) each
+keep one long-lived ``dot -Tsvg`` process and feed it several pending
+diagrams per round-trip (``dot`` reads graph after graph from stdin and writes
+one SVG per graph).
+
+A batch gets ``DOT_TIMEOUT`` seconds as a whole. If it stalls, ``dot`` dies
+(e.g. on a syntax error) or its output is unreadable, the worker kills the
+process and renders the batch one diagram at a time, within ``RETRY_BUDGET``
+seconds in total, so only the broken diagram fails. A worker never dies: any
+other error fails its batch. Callers give up after ``wait_timeout`` seconds
+without a result. Only graphs ``dot`` exits on with an error raise
+DotRejected; timeouts and backlog raise a plain RuntimeError and may succeed
+on a later call. ``metrics()`` exposes queue depth, in-flight batches and
+render latency.
+"""
+
+import os
+import queue
+import statistics
+import subprocess
+import threading
+import logging
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from infrastructure.diagrams import DOT_BINARY, DOT_TIMEOUT, DotRejected, run_dot
+
+WORKERS = int(os.environ.get("LERNAPP_DOT_WORKERS", "2"))
+BATCH_SIZE = 16
+# Seconds for re-rendering the graphs of a failed batch one by one
+RETRY_BUDGET = 2 * DOT_TIMEOUT
+
+_pool = None
+_pool_lock = threading.Lock()
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Job:
+    """One diagram waiting for its SVG."""
+
+    __slots__ = ("source", "submitted", "done", "svg", "error", "rejected", "cancelled")
+
+    def __init__(self, source: str):
+        self.source = source
+        self.submitted = time.perf_counter()
+        self.done = threading.Event()
+        self.svg: Optional[str] = None
+        self.error: Optional[str] = None
+        # dot exited with an error on this graph (see DotRejected)
+        self.rejected = False
+        # Set when the caller stopped waiting, workers skip the job
+        self.cancelled = False
+
+
+class _DotProcess:
+    """A long-lived ``dot -Tsvg`` process with non-blocking output readers."""
+
+    def __init__(self, binary: str):
+        self.process = subprocess.Popen(
+            [binary, "-Tsvg"], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        )
+        self._chunks: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._stderr: deque = deque(maxlen=20)
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+        self._stderr_reader = threading.Thread(target=self._read_stderr, daemon=True)
+        self._stderr_reader.start()
+
+    def _read_stdout(self):
+        for chunk in iter(lambda: self.process.stdout.read1(65536), b""):
+            self._chunks.put(chunk)
+        self._chunks.put(None)
+
+    def _read_stderr(self):
+        for line in self.process.stderr:
+            self._stderr.append(line.decode("utf-8", "replace").strip())
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def render(self, sources: List[str], timeout: float) -> List[str]:
+        """
+        Lay out all sources in one round-trip; raises DotRejected if dot exits
+        with an error, RuntimeError on other failures or timeout.
+        """
+        self.process.stdin.write("\n".join(sources).encode("utf-8") + b"\n")
+        self.process.stdin.flush()
+
+        deadline = time.monotonic() + timeout
+        output = b""
+        while output.count(b"</svg>") < len(sources):
+            remaining = deadline - time.monotonic()
+            try:
+                chunk = self._chunks.get(timeout=max(remaining, 0))
+            except queue.Empty:
+                raise RuntimeError(f"dot failed: timed out after {timeout:.0f} s")
+            if chunk is None:
+                if self._exit_code() and self._stderr:
+                    raise DotRejected(f"dot failed: {' '.join(self._stderr)}")
+                raise RuntimeError("dot failed: process exited")
+            output += chunk
+
+        svgs = output.decode("utf-8").split("</svg>")[:len(sources)]
+        # Each part starts with the XML prolog of its graph
+        return [part[part.find("<svg"):] + "</svg>" for part in svgs]
+
+    def _exit_code(self) -> Optional[int]:
+        # stdout closes just before dot exits and its last error line is read
+        try:
+            code = self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            return None
+        self._stderr_reader.join(timeout=1)
+        return code
+
+    def kill(self):
+        self.process.kill()
+        self.process.wait()
+
+
+class DotWorkerPool:
+    """
+    Bounded pool of long-lived ``dot`` workers with batching.
+
+    Usage:
+        svg = get_pool().render(dot_source)
+        results = get_pool().render_many(sources)  # warm a cold cache
+    """
+
+    def __init__(self, workers: int = WORKERS, batch_size: int = BATCH_SIZE,
+                 timeout: float = DOT_TIMEOUT, binary: str = DOT_BINARY, retry_budget: float = RETRY_BUDGET):
+        self.workers = max(1, workers)
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.binary = binary
+        self.retry_budget = retry_budget
+        # A batch ahead in the queue, this job's batch and its retries
+        self.wait_timeout = 2 * timeout + self.retry_budget
+        self._queue: "queue.Queue[_Job]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._latencies: deque = deque(maxlen=1000)
+        self._in_flight = 0
+        self._stats = {"completed": 0, "failed": 0, "batches": 0, "restarts": 0}
+
+    def submit(self, source: str) -> _Job:
+        """Queue a DOT graph; wait on ``job.done`` for the result."""
+        with self._lock:
+            if not self._threads:
+                for i in range(self.workers):
+                    thread = threading.Thread(target=self._work, name=f"dot-worker-{i}", daemon=True)
+                    thread.start()
+                    self._threads.append(thread)
+        job = _Job(source)
+        self._queue.put(job)
+        return job
+
+    def render(self, source: str) -> str:
+        """
+        Lay out one DOT graph.
+
+        Returns:
+            SVG markup without XML prolog
+
+        Raises:
+            DotRejected: If dot rejects the graph
+            RuntimeError: If dot times out or no worker delivers within
+                wait_timeout
+        """
+        job = self.submit(source)
+        self._wait(job)
+        if job.error is not None:
+            raise _job_error(job)
+        return job.svg
+
+    def render_many(self, sources: List[str]) -> Dict[str, Any]:
+        """
+        Lay out many graphs concurrently; returns {source: svg or RuntimeError / DotRejected}.
+        Gives up on the remaining graphs once no graph finished for wait_timeout.
+        """
+        jobs = [self.submit(source) for source in dict.fromkeys(sources)]
+        results = {}
+        for job in jobs:
+            self._wait(job)
+            results[job.source] = job.svg if job.error is None else _job_error(job)
+        return results
+
+    def _wait(self, job: _Job):
+        if not job.done.wait(self.wait_timeout):
+            job.cancelled = True
+            job.error = f"dot failed: no result after {self.wait_timeout:.0f} s"
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, in-flight batches, counters and latency (submit to result) in ms."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            metrics = dict(self._stats, queue_depth=self._queue.qsize(),
+                           in_flight=self._in_flight, workers=len(self._threads))
+        if latencies:
+            metrics["p50_ms"] = statistics.median(latencies) * 1000
+            metrics["p95_ms"] = latencies[int(0.95 * (len(latencies) - 1))] * 1000
+        if metrics["batches"]:
+            metrics["avg_batch"] = (metrics["completed"] + metrics["failed"]) / metrics["batches"]
+        return metrics
+
+    def _work(self):
+        process: Optional[_DotProcess] = None
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            batch = [job for job in batch if not job.cancelled]
+            if not batch:
+                continue
+            with self._lock:
+                self._in_flight += 1
+            try:
+                process = self._run_batch(process, batch)
+            except Exception as exc:
+                # Fail the batch, keep the worker; the next batch starts a fresh dot
+                _LOGGER.exception("dot worker failed on a batch of %d graphs", len(batch))
+                _kill(process)
+                process = None
+                for job in batch:
+                    if not job.done.is_set():
+                        self._finish(job, error=f"dot failed: {exc}")
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                    self._stats["batches"] += 1
+
+    def _run_batch(self, process: Optional[_DotProcess], batch: List[_Job]) -> Optional[_DotProcess]:
+        try:
+            if process is None or not process.alive():
+                process = _DotProcess(self.binary)
+            svgs = process.render([job.source for job in batch], self.timeout)
+        except Exception as exc:
+            _kill(process)
+            with self._lock:
+                self._stats["restarts"] += 1
+            if len(batch) == 1:
+                # A fresh process failed on this graph alone, retrying would fail again
+                message = str(exc) if isinstance(exc, RuntimeError) else f"dot failed: {exc}"
+                self._finish(batch[0], error=message, rejected=isinstance(exc, DotRejected))
+                return None
+            # Isolate the broken diagram: render one by one, bounded by the retry budget
+            deadline = time.monotonic() + self.retry_budget
+            for job in batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._finish(job, error="dot failed: retry budget of the batch exhausted")
+                    continue
+                try:
+                    self._finish(job, svg=run_dot(job.source, self.binary, min(self.timeout, remaining)))
+                except RuntimeError as exc:
+                    self._finish(job, error=str(exc), rejected=isinstance(exc, DotRejected))
+            return None
+
+        for job, svg in zip(batch, svgs):
+            self._finish(job, svg=svg)
+        return process
+
+    def _finish(self, job: _Job, svg: Optional[str] = None, error: Optional[str] = None, rejected: bool = False):
+        job.svg, job.error, job.rejected = svg, error, rejected
+        with self._lock:
+            self._latencies.append(time.perf_counter() - job.submitted)
+            self._stats["completed" if error is None else "failed"] += 1
+        job.done.set()
+
+
+def _job_error(job: _Job) -> RuntimeError:
+    return DotRejected(job.error) if job.rejected else RuntimeError(job.error)
+
+
+def _kill(process: Optional[_DotProcess]):
+    if process is None:
+        return
+    try:
+        process.kill()
+    except OSError:
+        pass
+
+
+def get_pool() -> DotWorkerPool:
+    """Return the process-wide worker pool (created on first use)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DotWorkerPool()
+        return _pool
+
+
+def pool_metrics() -> Optional[Dict[str, Any]]:
+    """Metrics of the worker pool, or None if no diagram was laid out yet."""
+    with _pool_lock:
+        pool = _pool
+    return pool.metrics() if pool is not None else None
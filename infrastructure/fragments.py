@@ -0,0 +1,34 @@
+"""
+Fragment Helper Module
+
+Wraps interactive blocks as Streamlit fragments, so a widget interaction inside
+the block reruns only that block instead of app.py and the whole chapter.
+"""
+
+from typing import Callable
+
+import streamlit as st
+
+from infrastructure.timing import timed_fragment
+
+# st.fragment is stable since Streamlit 1.37 (st.experimental_fragment since 1.33)
+_FRAGMENT = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+
+def interactive_fragment(func: Callable[[], None]) -> Callable[[], None]:
+    """
+    Decorator for an interactive exploration block.
+
+    Widgets created inside the decorated function only rerun the function itself.
+    The block must only write into its own area of the page. On Streamlit versions
+    without fragments the function is returned unchanged (full-script reruns).
+
+    Args:
+        func: Block rendering the widgets and the output that depends on them
+
+    Returns:
+        The fragment-wrapped block
+    """
+    if _FRAGMENT is None:
+        return func
+    return _FRAGMENT(timed_fragment(func))
@@ -0,0 +1,231 @@
+"""
+Image Derivatives
+
+Build step that turns the full-size exam images into display-sized copies.
+Every image below ``chapters/mock_exam_images`` is trimmed of its scanner
+border and written as WebP and optimised PNG at 1x and 2x of the display width
+(DISPLAY_WIDTH, never upscaled) to ``static/images``; PNGs that would not be
+smaller than the source are skipped. File names carry a hash of their content,
+and ``manifest.json`` maps the SHA-256 of each source image to its variants,
+so a changed source never picks up stale derivatives.
+
+At runtime pick_variant returns the smallest variant covering the display
+width at ``LERNAPP_IMAGE_SCALE`` (default: 1, use 2 for sharper images on
+high-DPI screens); images without derivatives are shown as before.
+
+Usage (from the repo root):
+    python -m infrastructure.image_derivatives [images ...] [--check]
+
+With --check nothing is written; the exit code is 1 if an image has no
+up-to-date derivatives.
+"""
+
+import argparse
+import glob
+import hashlib
+import io
+import json
+import os
+import sys
+import threading
+from typing import Dict, List, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_GLOB = os.path.join(REPO_ROOT, "chapters", "mock_exam_images", "*.png")
+ASSETS_DIR = os.path.join(REPO_ROOT, "static", "images")
+MANIFEST_NAME = "manifest.json"
+DISPLAY_WIDTH = 500
+SCALES = (1, 2)
+IMAGE_SCALE = int(os.environ.get("LERNAPP_IMAGE_SCALE", "1"))
+WEBP_QUALITY = 82
+# Pixels closer than this to the border colour count as background
+TRIM_TOLERANCE = 12
+TRIM_PADDING = 8
+
+_manifest: Optional[Dict[str, Dict]] = None
+_source_hashes: Dict[str, str] = {}
+# Chosen derivative per (source path, pixels needed)
+_picked: Dict[Tuple[str, int], str] = {}
+_lock = threading.Lock()
+
+
+def file_hash(path: str) -> str:
+    """SHA-256 of a file's content."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def trim(image):
+    """Crop a uniform border (the colour of the top-left pixel), keeping a little padding."""
+    from PIL import Image, ImageChops
+
+    rgb = image.convert("RGB")
+    background = Image.new("RGB", rgb.size, rgb.getpixel((0, 0)))
+    diff = ImageChops.difference(rgb, background).convert("L").point(lambda v: 255 if v > TRIM_TOLERANCE else 0)
+    bbox = diff.getbbox()
+    if bbox is None:
+        return image
+    left, top, right, bottom = bbox
+    return image.crop((
+        max(left - TRIM_PADDING, 0), max(top - TRIM_PADDING, 0),
+        min(right + TRIM_PADDING, image.width), min(bottom + TRIM_PADDING, image.height),
+    ))
+
+
+def build_variants(path: str, out_dir: str) -> List[Dict]:
+    """
+    Write the derivatives of one image.
+
+    Returns:
+        Variant entries {"file", "format", "scale", "width", "height", "bytes"}
+    """
+    from PIL import Image
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    source_bytes = os.path.getsize(path)
+    with Image.open(path) as source:
+        image = trim(source)
+        image.load()
+
+    variants = []
+    widths = set()
+    for scale in SCALES:
+        width = min(DISPLAY_WIDTH * scale, image.width)
+        if width in widths:
+            continue  # source too small for this scale, the smaller variant already covers it
+        widths.add(width)
+        height = round(image.height * width / image.width)
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for fmt, ext, options in (
+            ("WEBP", "webp", {"quality": WEBP_QUALITY, "method": 6}),
+            ("PNG", "png", {"optimize": True}),
+        ):
+            buffer = io.BytesIO()
+            resized.save(buffer, fmt, **options)
+            data = buffer.getvalue()
+            if fmt == "PNG" and len(data) >= source_bytes:
+                continue  # photos resample badly for PNG, the source is the better fallback
+            name = f"{stem}-{scale}x.{hashlib.sha256(data).hexdigest()[:12]}.{ext}"
+            with open(os.path.join(out_dir, name), "wb") as f:
+                f.write(data)
+            variants.append({
+                "file": name, "format": ext, "scale": scale,
+                "width": width, "height": height, "bytes": len(data),
+            })
+    return variants
+
+
+def build(paths: List[str], out_dir: str) -> Dict[str, Dict]:
+    """
+    Write the derivatives of all images and the manifest.
+
+    Returns:
+        Manifest {source hash: {"source", "bytes", "variants"}}
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = {}
+    for path in paths:
+        manifest[file_hash(path)] = {
+            "source": os.path.relpath(path, REPO_ROOT).replace(os.sep, "/"),
+            "bytes": os.path.getsize(path),
+            "variants": build_variants(path, out_dir),
+        }
+
+    # Remove derivatives of images that changed or no longer exist
+    current = {variant["file"] for entry in manifest.values() for variant in entry["variants"]}
+    for path in glob.glob(os.path.join(out_dir, "*")):
+        name = os.path.basename(path)
+        if name != MANIFEST_NAME and name not in current:
+            os.remove(path)
+    with open(os.path.join(out_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return manifest
+
+
+def load_manifest() -> Dict[str, Dict]:
+    """Derivatives {source hash: {...}}, read once."""
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(os.path.join(ASSETS_DIR, MANIFEST_NAME), encoding="utf-8") as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def pick_variant(path: str, width: int = DISPLAY_WIDTH, scale: int = None) -> str:
+    """
+    Return the smallest derivative of an image that covers width * scale
+    pixels (or is the largest available), falling back to the image itself.
+    The choice is made once per image and size.
+
+    Args:
+        path: Source image file
+        width: Display width in CSS pixels
+        scale: Device pixel ratio to cover (default: IMAGE_SCALE)
+    """
+    needed = width * (IMAGE_SCALE if scale is None else scale)
+    picked = _picked.get((path, needed))
+    if picked is None:
+        picked = _pick(path, needed)
+        with _lock:
+            _picked[(path, needed)] = picked
+    return picked
+
+
+def _pick(path: str, needed: int) -> str:
+    manifest = load_manifest()
+    if not manifest:
+        return path
+    key = _source_hashes.get(path)
+    if key is None:
+        try:
+            key = file_hash(path)
+        except OSError:
+            return path
+        with _lock:
+            _source_hashes[path] = key
+    entry = manifest.get(key)
+    if entry is None:
+        return path
+
+    variants = entry["variants"]
+    largest = max(variant["width"] for variant in variants)
+    suitable = [v for v in variants if v["width"] >= min(needed, largest)]
+    best = min(suitable, key=lambda variant: variant["bytes"])
+    candidate = os.path.join(ASSETS_DIR, best["file"])
+    return candidate if os.path.exists(candidate) else path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", help="source images (default: chapters/mock_exam_images/*.png)")
+    parser.add_argument("--out", default=ASSETS_DIR, help="output directory for derivatives and manifest")
+    parser.add_argument("--check", action="store_true", help="only verify that all derivatives are up to date")
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(glob.glob(SOURCE_GLOB))
+    if args.check:
+        try:
+            with open(os.path.join(args.out, MANIFEST_NAME), encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        stale = [path for path in paths if file_hash(path) not in manifest]
+        for path in stale:
+            print(f"  no derivatives: {os.path.relpath(path, REPO_ROOT)}")
+        sys.exit(1 if stale else 0)
+
+    manifest = build(paths, args.out)
+    source_bytes = sum(entry["bytes"] for entry in manifest.values())
+    for entry in manifest.values():
+        sizes = ", ".join(f"{v['scale']}x {v['format']} {v['bytes'] / 1024:.0f} KB" for v in entry["variants"])
+        print(f"  {entry['source']} ({entry['bytes'] / 1024:.0f} KB): {sizes}")
+    smallest = sum(min(v["bytes"] for v in entry["variants"] if v["scale"] == 1) for entry in manifest.values())
+    print(f"{len(manifest)} images, {source_bytes / 1024:.0f} KB sources -> {smallest / 1024:.0f} KB at 1x")
+
+
+if __name__ == "__main__":
+    main()
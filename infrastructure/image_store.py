@@ -0,0 +1,169 @@
+"""
+Image Store Module
+
+Process-wide store for the exam images. ``st.image(path)`` reads the file on
+every call, decodes it with PIL and re-encodes anything that is not JPEG or
+PNG (our WebP derivatives become JPEG on every rerun of every session). The
+store reads each file once, keeps the bytes keyed by their SHA-256 and
+registers that same bytes object with Streamlit's media file manager, so all
+sessions are served one media entry in its original format.
+
+The store is bounded by ``LERNAPP_IMAGE_STORE_MB`` (default: 64), least
+recently used images are dropped first. ``stats()`` reports hits, misses and
+resident bytes (shown in the admin view). Images below ``static/`` skip the
+store and are referenced by their static URL (see static_assets).
+"""
+
+import hashlib
+import html
+import mimetypes
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+import streamlit as st
+from streamlit import runtime
+
+from infrastructure.static_assets import static_url
+
+MAX_BYTES = int(float(os.environ.get("LERNAPP_IMAGE_STORE_MB", "64")) * 1024 * 1024)
+
+
+class StoredImage:
+    """Bytes of one image, shared by every path with the same content."""
+
+    __slots__ = ("key", "data", "mimetype")
+
+    def __init__(self, key: str, data: bytes, mimetype: str):
+        self.key = key
+        self.data = data
+        self.mimetype = mimetype
+
+
+class ImageStore:
+    """
+    Content-addressed, size-bounded image cache.
+
+    Usage:
+        image = get_store().get(path)
+    """
+
+    def __init__(self, max_bytes: int = MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._images: "OrderedDict[str, StoredImage]" = OrderedDict()
+        self._keys_by_path: Dict[str, str] = {}
+        self._resident = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, path: str) -> StoredImage:
+        """
+        Return the image at path, reading the file only on a miss.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        with self._lock:
+            key = self._keys_by_path.get(path)
+            image = self._images.get(key) if key is not None else None
+            if image is not None:
+                self._images.move_to_end(key)
+                self._stats["hits"] += 1
+                return image
+
+        with open(path, "rb") as f:
+            data = f.read()
+        key = hashlib.sha256(data).hexdigest()
+        mimetype = mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+        with self._lock:
+            self._stats["misses"] += 1
+            self._keys_by_path[path] = key
+            image = self._images.get(key)
+            if image is None:
+                # Another path with the same content keeps its entry
+                image = self._images[key] = StoredImage(key, data, mimetype)
+                self._resident += len(data)
+                self._evict(keep=key)
+            self._images.move_to_end(key)
+            return image
+
+    def stats(self) -> Dict[str, Any]:
+        """Hits, misses, evictions, stored images and resident bytes."""
+        with self._lock:
+            return dict(self._stats, images=len(self._images), resident_bytes=self._resident,
+                        max_bytes=self.max_bytes)
+
+    def _evict(self, keep: str):
+        while self._resident > self.max_bytes and len(self._images) > 1:
+            key, image = next(iter(self._images.items()))
+            if key == keep:
+                break
+            del self._images[key]
+            self._resident -= len(image.data)
+            self._stats["evictions"] += 1
+
+
+@st.cache_resource(show_spinner=False)
+def get_store() -> ImageStore:
+    """Return the process-wide image store."""
+    return ImageStore()
+
+
+def media_url(image: StoredImage) -> Optional[str]:
+    """Register the image for the current session; None outside a Streamlit server."""
+    if not runtime.exists():
+        return None
+    # Stable coordinates per image: the manager keeps one reference per session
+    return runtime.get_instance().media_file_mgr.add(image.data, image.mimetype, f"image_store.{image.key}")
+
+
+def image_url(path: str) -> Optional[str]:
+    """
+    URL of an image file: its static URL, else a media URL from the store.
+
+    Returns:
+        URL, or None outside a Streamlit server
+    """
+    # Static assets are cached by the browser, everything else goes through the store
+    return static_url(path) or media_url(get_store().get(path))
+
+
+def prefetch_images(paths: Iterable[str]):
+    """
+    Let the browser fetch images the learner is about to see (e.g. on the next
+    exam page) as hidden, zero-sized ``<img>`` tags. Best effort: unreadable
+    files and bare mode are skipped.
+    """
+    urls = []
+    for path in paths:
+        try:
+            url = image_url(path)
+        except OSError:
+            continue
+        if url:
+            urls.append(url)
+    if urls:
+        st.html("".join(f'<img src="{url}" alt="" width="0" height="0" style="display: none;">' for url in urls))
+
+
+def show_image(path: str, caption: str = "", width: int = 500):
+    """
+    Show an image file through the shared store (falls back to st.image).
+
+    Args:
+        path: Image file
+        caption: Caption below the image (also used as alt text)
+        width: Display width in CSS pixels
+    """
+    url = image_url(path)
+    if url is None:
+        st.image(path, caption=caption, width=width)
+        return
+    st.html(
+        f'<img src="{url}" alt="{html.escape(caption)}" '
+        f'style="width: {width}px; max-width: 100%; height: auto;">'
+    )
+    if caption:
+        st.caption(caption)
@@ -0,0 +1,51 @@
+"""
+Lazy Imports Module
+
+Defers heavy optional dependencies (plotly, numpy, ...) until a widget actually
+uses them, so they are not paid for on module import, worker restart or on
+pages that never draw a chart.
+"""
+
+import importlib
+from types import ModuleType
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    After the first access the real module is cached, so later lookups cost a
+    single attribute read.
+    """
+
+    def __init__(self, module_name: str):
+        self._module_name = module_name
+        self._module = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self._module_name)
+        return self._module
+
+    def __getattr__(self, name: str):
+        return getattr(self._load(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._module_name!r} ({state})>"
+
+
+def lazy_import(module_name: str) -> LazyModule:
+    """
+    Return a lazily imported module.
+
+    Usage (at module top, instead of ``import plotly.graph_objects as go``):
+        go = lazy_import("plotly.graph_objects")
+
+    Args:
+        module_name: Dotted module name as passed to ``import``
+
+    Returns:
+        A LazyModule that imports ``module_name`` on first attribute access
+    """
+    return LazyModule(module_name)
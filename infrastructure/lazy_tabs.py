@@ -0,0 +1,69 @@
+"""
+Lazy Tabs Module
+
+Tab container that only executes the body of the active tab. Plain ``st.tabs``
+runs every tab body on every rerun even though the learner only sees one,
+so chapters with many tabs pay for the whole chapter on each widget change.
+"""
+
+import inspect
+from typing import Callable, List, Tuple
+
+import streamlit as st
+
+from infrastructure.timing import timed
+
+# Newer Streamlit versions track the active tab server-side (``key`` +
+# ``on_change``) and expose ``TabContainer.open``. Older versions only switch
+# tabs in the browser, so we fall back to a horizontal radio selector there.
+_TABS_PARAMS = inspect.signature(st.tabs).parameters
+_NATIVE_LAZY_TABS = "on_change" in _TABS_PARAMS
+# Versions with ``bind="query-params"`` sync the active tab with the URL themselves
+_NATIVE_TAB_BINDING = "bind" in _TABS_PARAMS
+
+
+def render_lazy_tabs(tabs: List[Tuple[str, Callable[[], None]]], key: str):
+    """
+    Render a tab bar and execute only the body of the active tab.
+
+    The active tab is persisted in ``st.session_state[key]`` (as its label), so
+    the selection survives reruns and can be preset before the call. It is also
+    mirrored to the URL query parameter ``key``, so ``?<key>=<label>`` deep-links
+    straight to a tab on the first run.
+
+    Args:
+        tabs: List of (label, body) pairs; body is called inside the active tab
+        key: Unique session state key (and query parameter) for the tab selection
+    """
+    labels = [label for label, _ in tabs]
+    bodies = [body for _, body in tabs]
+
+    # Drop a stale selection (e.g. a tab label that was renamed)
+    if st.session_state.get(key) not in labels:
+        st.session_state.pop(key, None)
+
+    # Seed the selection from a deep-link before the widget is created
+    if not _NATIVE_TAB_BINDING and key not in st.session_state and st.query_params.get(key) in labels:
+        st.session_state[key] = st.query_params[key]
+
+    if _NATIVE_LAZY_TABS:
+        binding = {"bind": "query-params"} if _NATIVE_TAB_BINDING else {}
+        containers = st.tabs(labels, key=key, on_change="rerun", **binding)
+        for label, container, body in zip(labels, containers, bodies):
+            if container.open:
+                with container, timed(f"tab:{key}:{label}"):
+                    body()
+        if not _NATIVE_TAB_BINDING:
+            st.query_params[key] = st.session_state[key]
+        return
+
+    selected = st.radio(
+        "Tab",
+        labels,
+        key=key,
+        horizontal=True,
+        label_visibility="collapsed"
+    )
+    st.query_params[key] = selected
+    with st.container(), timed(f"tab:{key}:{selected}"):
+        bodies[labels.index(selected)]()
@@ -4,66 +4,57 @@ Mock Exam Helper Module
 Provides consistent UI components for all mock exams using Streamlit native features.
 """
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple
+
 import streamlit as st
-from typing import Dict, List, Tuple, Any
-import re
-import os
 
-def render_question_with_images(question_text: str, base_path: str = None):
+from infrastructure.asset_index import ImageSegment, Segment, TextSegment, compile_segments, question_segments
+from infrastructure.image_derivatives import DISPLAY_WIDTH, pick_variant
+from infrastructure.image_store import prefetch_images, show_image
+from infrastructure.questions import Question
+from infrastructure.timing import timed
+
+def render_question_with_images(question_text: str):
     """
-    Render question text that may contain image references using st.image().
-    Supports both markdown image syntax and direct image paths.
+    Render question text that may contain image references.
 
     Args:
         question_text: The question text that may contain image references
-        base_path: Base path to resolve relative image paths (optional)
     """
-    # Split text by image references
-    parts = re.split(r'(!\[([^\]]*)\]\(([^)]+)\))', question_text)
-
-    for i, part in enumerate(parts):
-        if i % 4 == 0:  # Text parts
-            if part.strip():
-                st.markdown(part)
-        elif i % 4 == 1:  # Full image markdown
-            alt_text = parts[i + 1]
-            image_path = parts[i + 2]
-
-            # Try multiple path resolutions in order of preference
-            possible_paths = []
-
-            # 1. If base_path provided, use it with image_path
-            if base_path:
-                possible_paths.append(os.path.join(base_path, image_path))
-
-            # 2. Try various absolute/relative paths
-            possible_paths.extend([
-                os.path.join("subjects", "CS", "assets", image_path),  # Full relative path
-                os.path.join("subjects", "CS", "assets", "mock_exam_images", os.path.basename(image_path)),  # Just filename in mock_exam_images
-                os.path.join(os.getcwd(), "subjects", "CS", "assets", image_path),  # Absolute path
-                image_path  # Original path as fallback
-            ])
-
-            # Find first existing path
-            final_path = None
-            for path in possible_paths:
-                if os.path.exists(path):
-                    final_path = path
-                    break
-
-            if final_path:
-                try:
-                    st.image(final_path, caption=alt_text, width=500)
-                except Exception as e:
-                    st.error(f"Fehler beim Laden des Bildes {final_path}: {e}")
-            else:
-                st.warning(f"❌ Bild nicht gefunden: {image_path}")
-                st.markdown(f"*[Bild: {alt_text}]*")
+    render_segments(compile_segments(question_text))
+
+
+def render_segments(segments: Tuple[Segment, ...]):
+    """
+    Render compiled question text (see asset_index.compile_segments).
+    Images are shown from their display-sized derivative (see image_derivatives)
+    through the shared image store or as static assets (see image_store).
+    """
+    for segment in segments:
+        if isinstance(segment, TextSegment):
+            st.markdown(segment.text)
+        elif segment.path:
+            final_path = pick_variant(segment.path, width=DISPLAY_WIDTH)
+            try:
+                show_image(final_path, caption=segment.alt, width=DISPLAY_WIDTH)
+            except Exception as e:
+                st.error(f"Fehler beim Laden des Bildes {final_path}: {e}")
+        else:
+            st.warning(f"❌ Bild nicht gefunden: {segment.reference}")
+            st.markdown(f"*[Bild: {segment.alt}]*")
 
 # ============================================================================
 # QUESTION RENDERING (During Exam)
 # ============================================================================
 
+NO_MATCH = "-- Select --"
+
+@timed("render_question")
 def render_question(q: Dict, key_prefix: str) -> Tuple[Any, bool]:
     """
     Render a question during the exam and return user's answer + validity.
@@ -73,42 +64,19 @@ def render_question(q: Dict, key_prefix: str) -> Tuple[Any, bool]:
         key_prefix: Unique prefix for Streamlit widget keys
         
     Returns:
-        Tuple of (user_answer, is_valid)
+        Tuple of (user_answer, is_valid); compiled questions return the compact
+        answer (bitmask, or outcome id tuple for matching, see Question.encode)
     """
     st.markdown(f"### Question {q['id']}: {q['title']}")
-    # Get the base path for image resolution - try multiple possible locations
-    possible_paths = [
-        os.path.join(os.path.dirname(__file__), "..", "chapters"),  # Demo app: chapters directory
-        os.path.join(os.getcwd(), "chapters"),  # Demo app: chapters from cwd
-        os.path.join(os.path.dirname(__file__), "..", "subjects", "CS", "assets"),  # Development path
-        "subjects/CS/assets",  # Relative to app root
-        "./subjects/CS/assets",  # Explicit relative
-        os.path.join(os.getcwd(), "subjects", "CS", "assets")  # Absolute from cwd
-    ]
-
-    base_path = None
-    for path in possible_paths:
-        test_path = os.path.join(path, "mock_exam_images")
-        if os.path.exists(test_path):
-            base_path = path
-            break
-
-    if base_path is None:
-        # Try current working directory as fallback
-        cwd_base = os.path.join(os.getcwd(), "subjects", "CS", "assets")
-        if os.path.exists(os.path.join(cwd_base, "mock_exam_images")):
-            base_path = cwd_base
-        # Fallback silently, images will show error individually
-    render_question_with_images(q['question'], base_path)
+    render_segments(question_segments(q))
     
-    # Hint expander (always available)
-    hint_text = q.get('hint', "**💡 Hint:** Read the question carefully.")
-    with st.expander("💡 Hint", expanded=False):
-        st.markdown(hint_text)
-
     key = f"{key_prefix}_{q['id']}"
     q_type = q.get('type', 'single')
 
+    # Hint (always available)
+    hint_text = q.get('hint', "**💡 Hint:** Read the question carefully.")
+    render_on_demand("💡 Hint", f"{key}_hint", hint_text)
+
     if q_type == 'multi':
         st.caption("**Select all that apply:**")
         selected = []
@@ -116,19 +84,18 @@ def render_question(q: Dict, key_prefix: str) -> Tuple[Any, bool]:
             if st.checkbox(option, key=f"{key}_{idx}"):
                 selected.append(idx)
 
-        # Solution expander (beneath answer options)
+        # Solution (beneath answer options)
         explanation_text = q.get('explanation', "**📝 Solution:** No explanation available.")
-        with st.expander("📝 Solution", expanded=False):
-            st.markdown(explanation_text)
+        render_on_demand("📝 Solution", f"{key}_solution", explanation_text)
 
-        return selected, True
+        return _encoded(q, selected), True
 
     elif q_type == 'matching':
         st.caption("**Match the following items:**")
         selected = []
-        # Get all unique possible outcomes from all matching options
-        possible_outcomes = sorted(list(set([opt[1] for opt in q['options']])))
-        options_text = ["-- Select --"] + possible_outcomes
+        # Get all unique possible outcomes from all matching options (sorted once when compiled)
+        possible_outcomes = q.outcomes if isinstance(q, Question) else sorted(set(opt[1] for opt in q['options']))
+        options_text = [NO_MATCH] + list(possible_outcomes)
 
         for idx, (label, _) in enumerate(q['options']):
             col1, col2 = st.columns([2, 1])
@@ -141,18 +108,17 @@ def render_question(q: Dict, key_prefix: str) -> Tuple[Any, bool]:
                     key=f"{key}_match_{idx}",
                     label_visibility="collapsed"
                 )
-                if selected_text != "-- Select --":
+                if selected_text != NO_MATCH:
                     selected.append(selected_text)
                 else:
                     selected.append(None)
 
-        # Solution expander (beneath answer options)
+        # Solution (beneath answer options)
         explanation_text = q.get('explanation', "**📝 Solution:** No explanation available.")
-        with st.expander("📝 Solution", expanded=False):
-            st.markdown(explanation_text)
+        render_on_demand("📝 Solution", f"{key}_solution", explanation_text)
 
         # Valid only if all items have a selection
-        return selected, all(s is not None for s in selected)
+        return _encoded(q, selected), all(s is not None for s in selected)
 
     else:  # single
         st.caption("**Select one:**")
@@ -162,15 +128,149 @@ def render_question(q: Dict, key_prefix: str) -> Tuple[Any, bool]:
             range(len(options_text)),
             format_func=lambda x: options_text[x],
             key=key,
+            index=None,  # No preselection, a visited question stays unanswered
             label_visibility="collapsed"
         )
 
-        # Solution expander (beneath answer options)
+        # Solution (beneath answer options)
         explanation_text = q.get('explanation', "**📝 Solution:** No explanation available.")
-        with st.expander("📝 Solution", expanded=False):
-            st.markdown(explanation_text)
+        render_on_demand("📝 Solution", f"{key}_solution", explanation_text)
+
+        return _encoded(q, [selected_idx]), selected_idx is not None
+
+
+def _encoded(q: Dict, selected: list) -> Any:
+    return q.encode(selected) if isinstance(q, Question) else selected
+
+
+def render_on_demand(label: str, key: str, text: str):
+    """
+    Show a text (hint, solution, explanation) only once the learner switches
+    it on. Unlike a collapsed expander, the text is not sent to the browser
+    on every rerun; it comes from the cached question when asked for.
+    """
+    if st.toggle(label, key=key):
+        st.markdown(text)
+
+
+# ============================================================================
+# PAGINATED EXAM (One Question per Page)
+# ============================================================================
+
+class ExamClock:
+    """
+    Time spent on each question of an exam attempt (keep one per attempt in
+    session state). Every rerun books the time since the previous rerun to the
+    question that was shown in between; pauses count for at most MAX_PAUSE.
+
+    Usage:
+        clock.show(q.id)
+        clock.spent  # {question_id: seconds}
+    """
+
+    MAX_PAUSE = 600.0
+
+    def __init__(self):
+        self.spent: Dict[Any, float] = {}
+        self._shown: Optional[Tuple[Any, float]] = None
+
+    def show(self, question_id: Any, now: float = None):
+        """Book the time since the last call, then start timing question_id."""
+        now = time.monotonic() if now is None else now
+        if self._shown is not None:
+            shown_id, since = self._shown
+            self.spent[shown_id] = self.spent.get(shown_id, 0.0) + min(now - since, self.MAX_PAUSE)
+        self._shown = (question_id, now)
+
+
+def render_paginated_exam(questions: Sequence[Question], key_prefix: str, answers: Dict[Any, Any],
+                          clock: ExamClock = None) -> int:
+    """
+    Render one question of an exam with a navigator, instead of all questions
+    in one form. The answer of the shown question is written to answers on
+    every run, so answers must live in session state; the images of the next
+    question are prefetched.
+
+    Args:
+        questions: Compiled questions (see content_cache.exam_content)
+        key_prefix: Unique prefix for Streamlit widget keys
+        answers: {question_id: user_answer}, updated in place
+        clock: Records the time spent per question, if given
+
+    Returns:
+        Index of the shown question
+    """
+    page_key = f"{key_prefix}_page"
+    page = min(st.session_state.get(page_key, 0), len(questions) - 1)
+    q = questions[page]
+    if clock is not None:
+        clock.show(q.id)
+
+    # The navigator is filled in after the question, so it shows the answer just given
+    navigator = st.container()
+
+    key = f"{key_prefix}_{q.id}"
+    _restore_widgets(q, key, answers.get(q.id))
+    selected, valid = render_question(q, key_prefix)
+    if valid and q.is_answered(selected):
+        answers[q.id] = selected
+    else:
+        answers.pop(q.id, None)
+
+    col_prev, col_next = st.columns(2)
+    with col_prev:
+        st.button("⬅️ Previous", key=f"{key_prefix}_prev", disabled=page == 0,
+                  on_click=_go_to_page, args=(page_key, page - 1), use_container_width=True)
+    with col_next:
+        st.button("Next ➡️", key=f"{key_prefix}_next", disabled=page == len(questions) - 1,
+                  on_click=_go_to_page, args=(page_key, page + 1), use_container_width=True)
+
+    with navigator:
+        answered = sum(1 for question in questions if question.id in answers)
+        st.caption(f"**{answered} / {len(questions)} answered** (● answered, ○ open)")
+        # Option labels stay fixed (the widget value is its label), the status is a caption
+        st.radio(
+            "Question",
+            range(len(questions)),
+            format_func=lambda i: f"Q{questions[i].id}",
+            captions=["●" if question.id in answers else "○" for question in questions],
+            key=page_key,
+            horizontal=True,
+            label_visibility="collapsed",
+        )
+        st.markdown("---")
+
+    if page + 1 < len(questions):
+        _prefetch_segments(question_segments(questions[page + 1]))
+    return page
+
+
+def _go_to_page(page_key: str, page: int):
+    st.session_state[page_key] = page
 
-        return [selected_idx], True
+
+def _restore_widgets(q: Question, key: str, answer: Any):
+    # Streamlit drops the state of widgets that were not rendered, so a
+    # question shown again gets its stored answer back
+    if answer is None:
+        return
+    selection = q.decode(answer)
+    if q.type == 'multi':
+        for idx in range(len(q.options)):
+            st.session_state.setdefault(f"{key}_{idx}", idx in selection)
+    elif q.type == 'matching':
+        for idx, match in enumerate(selection):
+            st.session_state.setdefault(f"{key}_match_{idx}", NO_MATCH if match is None else match)
+    elif selection:
+        st.session_state.setdefault(key, selection[0])
+
+
+def _prefetch_segments(segments: Tuple[Segment, ...]):
+    prefetch_images(
+        pick_variant(segment.path, width=DISPLAY_WIDTH)
+        for segment in segments
+        if isinstance(segment, ImageSegment) and segment.path
+    )
 
 
 # ============================================================================
@@ -190,6 +290,8 @@ def check_answer(q: Dict, user_answer: Any) -> bool:
     """
     if user_answer is None:
         return False
+    if isinstance(q, Question):
+        return q.is_correct(user_answer)
     
     q_type = q.get('type', 'single')
     
@@ -213,56 +315,137 @@ def check_answer(q: Dict, user_answer: Any) -> bool:
     return False
 
 
+# ============================================================================
+# GRADING
+# ============================================================================
+
+# Memoised results: {(exam version, answers hash): GradingResult}
+GRADING_CACHE_SIZE = 256
+_grading_cache: "OrderedDict[Tuple[str, str], GradingResult]" = OrderedDict()
+_grading_lock = threading.Lock()
+
+
+class QuestionGrade(NamedTuple):
+    """Grade of one question."""
+    question_id: Any
+    answered: bool
+    correct: bool
+    correct_answer: Tuple  # correct option indices, or target matches for matching questions
+    section: Optional[str] = None
+
+
+class SectionScore(NamedTuple):
+    """Correct and total questions of one exam section."""
+    name: str
+    correct: int
+    total: int
+
+    @property
+    def ratio(self) -> float:
+        return self.correct / self.total if self.total else 0.0
+
+
+class GradingResult(NamedTuple):
+    """An answer sheet graded once; all results views render from it."""
+    questions: Mapping[Any, QuestionGrade]  # {question_id: grade}
+    sections: Tuple[SectionScore, ...]
+    correct_count: int
+    total_count: int
+    percentage: int
+
+
+def grade_exam(exam: Mapping[str, Any], answers: Mapping[Any, Any]) -> GradingResult:
+    """
+    Grade an answer sheet in one pass, memoised by exam version and answers.
+
+    Args:
+        exam: Exam content with compiled questions (see content_cache.exam_content)
+        answers: {question_id: user_answer} as returned by render_question
+            (compact answers; legacy lists are graded the same)
+
+    Returns:
+        Immutable GradingResult
+    """
+    cache_key = (exam["version"], _answers_hash(answers))
+    with _grading_lock:
+        result = _grading_cache.get(cache_key)
+        if result is not None:
+            _grading_cache.move_to_end(cache_key)
+            return result
+
+    grades = {}
+    section_totals = {name: [0, 0] for name in exam["sections"]}
+    for q in exam["questions"]:
+        user_answer = answers.get(q.id)
+        answered = user_answer is not None and q.is_answered(user_answer)
+        correct = answered and q.is_correct(user_answer)
+        section = _section_of(q, exam["sections"])
+        grades[q.id] = QuestionGrade(q.id, answered, correct, q.correct_answer, section)
+
+        if section is not None:
+            section_totals[section][0] += correct
+            section_totals[section][1] += 1
+
+    correct_count = sum(grade.correct for grade in grades.values())
+    total_count = len(grades)
+    result = GradingResult(
+        questions=MappingProxyType(grades),
+        sections=tuple(SectionScore(name, c, t) for name, (c, t) in section_totals.items()),
+        correct_count=correct_count,
+        total_count=total_count,
+        percentage=int(correct_count / total_count * 100) if total_count > 0 else 0,
+    )
+    with _grading_lock:
+        _grading_cache[cache_key] = result
+        while len(_grading_cache) > GRADING_CACHE_SIZE:
+            _grading_cache.popitem(last=False)
+    return result
+
+
+def _answers_hash(answers: Mapping[Any, Any]) -> str:
+    canonical = repr(sorted((repr(qid), repr(answer)) for qid, answer in answers.items()))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _section_of(q: Mapping, sections: Mapping[str, Tuple[int, int]]):
+    # Only questions naming one of the exam's SECTIONS count towards its score
+    name = q.get('section')
+    return name if name in sections else None
+
+
 # ============================================================================
 # RESULTS RENDERING (After Submission)
 # ============================================================================
 
-def render_results_header(correct_count: int, total_count: int, sections: Dict[str, Tuple[int, int]], questions: List[Dict], answers: Dict):
+@timed("render_results_header")
+def render_results_header(result: GradingResult):
     """
     Render the exam results header with score overview and section breakdown.
     
     Args:
-        correct_count: Number of correct answers
-        total_count: Total number of questions
-        sections: Section mapping {section_name: (start_id, end_id)}
-        questions: List of question dictionaries
-        answers: Dictionary of {question_id: user_answer}
+        result: Graded answer sheet (see grade_exam)
     """
-    # Calculate section scores
-    section_scores = {}
-    for sec_name in sections.keys():
-        section_scores[sec_name] = {"correct": 0, "total": 0}
-    
-    for q in questions:
-        q_section = q.get('section', 'Other')
-        if q_section in section_scores:
-            section_scores[q_section]["total"] += 1
-            if check_answer(q, answers.get(q['id'])):
-                section_scores[q_section]["correct"] += 1
-    
-    # Score Overview
-    percentage = int(correct_count / total_count * 100) if total_count > 0 else 0
-    
     # Display using native Streamlit components
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("✅ Correct", f"{correct_count}")
+        st.metric("✅ Correct", f"{result.correct_count}")
     with col2:
-        st.metric("📝 Total", f"{total_count}")
+        st.metric("📝 Total", f"{result.total_count}")
     with col3:
-        st.metric("📊 Score", f"{percentage}%")
+        st.metric("📊 Score", f"{result.percentage}%")
     
     # Section Breakdown
     st.subheader("📈 Section Breakdown")
     
-    for sec_name, scores in section_scores.items():
-        if scores["total"] > 0:
-            pct = scores["correct"] / scores["total"]
-            st.write(f"**{sec_name}:** {scores['correct']} / {scores['total']}")
-            st.progress(pct)
+    for section in result.sections:
+        if section.total > 0:
+            st.write(f"**{section.name}:** {section.correct} / {section.total}")
+            st.progress(section.ratio)
 
 
-def render_question_result(q: Dict, user_answer: Any) -> bool:
+@timed("render_question_result")
+def render_question_result(q: Dict, user_answer: Any, grade: QuestionGrade = None,
+                           key_prefix: str = "result", expanded: bool = None) -> bool:
     """
     Render a single question result with correct/incorrect highlighting.
     Uses native Streamlit components for best practice.
@@ -270,41 +453,38 @@ def render_question_result(q: Dict, user_answer: Any) -> bool:
     Args:
         q: Question dictionary
         user_answer: User's submitted answer
+        grade: The question's grade from grade_exam (checked here if omitted)
+        key_prefix: Unique prefix for Streamlit widget keys
+        expanded: Open the card (default: only if the answer was not correct)
         
     Returns:
         True if answer was correct
     """
-    is_correct = check_answer(q, user_answer)
-    user_answer = user_answer or []
-    
-    # Get correct answers
+    # Compact answers are rendered in their list form
+    user_answer = q.decode(user_answer) if isinstance(q, Question) else user_answer or []
     q_type = q.get('type', 'single')
-    if q_type == 'matching':
-        correct_answers = [opt[1] for opt in q['options']]
+    if grade is not None:
+        is_correct = grade.correct
+        correct_answers = grade.correct_answer
     else:
-        correct_answers = [i for i, opt in enumerate(q['options']) if opt[1]]
+        is_correct = check_answer(q, user_answer)
+        if q_type == 'matching':
+            correct_answers = [opt[1] for opt in q['options']]
+        else:
+            correct_answers = [i for i, opt in enumerate(q['options']) if opt[1]]
     
     # Status indicator
-    if not user_answer or (q_type == 'matching' and None in user_answer):
-        status_icon = "⚠️"
-        status_text = "Not Answered"
-        status_type = "warning"
-    elif is_correct:
-        status_icon = "✅"
-        status_text = "Correct"
-        status_type = "success"
-    else:
-        status_icon = "❌"
-        status_text = "Incorrect"
-        status_type = "error"
+    answered = bool(user_answer) and not (q_type == 'matching' and None in user_answer)
+    status_icon, status_text = _result_status(answered, is_correct)
     
     # Question Card using native expander
-    with st.expander(f"{status_icon} Q{q['id']}: {q['title']} — {status_text}", expanded=not is_correct):
+    expanded = not is_correct if expanded is None else expanded
+    with st.expander(f"{status_icon} Q{q['id']}: {q['title']} — {status_text}", expanded=expanded):
         # Question text
-        st.markdown(q['question'])
+        render_segments(question_segments(q))
         
         # Tabs for organized content
-        tab_answer, tab_correct, tab_explain = st.tabs(["🎯 Your Answer", "✅ Correct Answer", "📚 Explanation"])
+        tab_answer, tab_correct = st.tabs(["🎯 Your Answer", "✅ Correct Answer"])
         
         with tab_answer:
             _render_user_answer(q, user_answer)
@@ -312,12 +492,64 @@ def render_question_result(q: Dict, user_answer: Any) -> bool:
         with tab_correct:
             _render_correct_answer(q, correct_answers)
         
-        with tab_explain:
-            st.markdown(q.get('explanation', "*Explanation not available.*"))
+        # Explanation only when asked for
+        render_on_demand("📚 Explanation", f"{key_prefix}_{q['id']}_explanation",
+                         q.get('explanation', "*Explanation not available.*"))
     
     return is_correct
 
 
+def _result_status(answered: bool, correct: bool) -> Tuple[str, str]:
+    if not answered:
+        return "⚠️", "Not Answered"
+    if correct:
+        return "✅", "Correct"
+    return "❌", "Incorrect"
+
+
+@timed("render_results_review")
+def render_results_review(exam: Mapping[str, Any], result: GradingResult, answers: Mapping[Any, Any],
+                          spent: Mapping[Any, float] = None, key_prefix: str = "result"):
+    """
+    Render the question review of a graded exam: a sortable summary table of
+    all questions, and the full result card only for the question selected in
+    it, so the cost does not grow with the number of questions.
+
+    Args:
+        exam: Exam content with compiled questions (see content_cache.exam_content)
+        result: Graded answer sheet (see grade_exam)
+        answers: {question_id: user_answer}
+        spent: Seconds spent per question (see ExamClock), if recorded
+        key_prefix: Unique prefix for Streamlit widget keys
+    """
+    questions = exam["questions"]
+    rows = []
+    for q in questions:
+        grade = result.questions[q.id]
+        icon, text = _result_status(grade.answered, grade.correct)
+        row = {"Q": q.id, "Question": q.title, "Section": q.get("section", ""), "Status": f"{icon} {text}"}
+        if spent is not None:
+            row["Time"] = round(spent.get(q.id, 0.0))
+        rows.append(row)
+
+    selection = st.dataframe(
+        rows,
+        hide_index=True,
+        use_container_width=True,
+        column_config={"Time": st.column_config.NumberColumn("Time", format="%d s")},
+        on_select="rerun",
+        selection_mode="single-row",
+        key=f"{key_prefix}_review",
+    )
+
+    selected = selection.selection.rows
+    if not selected:
+        st.caption("Select a question in the table to review it.")
+        return
+    q = questions[selected[0]]
+    render_question_result(q, answers.get(q.id), result.questions[q.id], key_prefix=key_prefix, expanded=True)
+
+
 def _render_user_answer(q: Dict, user_answer: Any):
     """Render what the user selected."""
     q_type = q.get('type', 'single')
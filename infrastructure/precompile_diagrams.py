@@ -0,0 +1,154 @@
+"""
+Diagram Precompiler
+
+Build step that renders every diagram with a literal DOT source ahead of time,
+so serving them never runs Graphviz. It parses the chapter modules, finds the
+``render_diagram(...)`` calls whose DOT argument is a string literal, applies
+the same default-graph wrapping as at runtime and writes one SVG per unique
+source plus ``manifest.json`` (keyed by source hash) to ``static/diagrams``.
+SVG file names are hashes of their content, so their static URLs can be
+cached forever.
+
+Calls with computed sources (f-strings, variables) are reported as dynamic;
+they are rendered on demand at runtime. Requires the Graphviz ``dot`` binary.
+
+Usage (from the repo root):
+    python -m infrastructure.precompile_diagrams [chapters/*.py] [--check]
+
+With --check nothing is written; the exit code is 1 if the manifest is
+missing a static diagram (e.g. in CI after a chapter changed).
+"""
+
+import argparse
+import ast
+import glob
+import json
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from infrastructure.diagrams import ASSETS_DIR, DOT_BINARY, MANIFEST_NAME, dot_hash, wrap_dot
+from infrastructure.dot_pool import get_pool
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _dot_argument(call: ast.Call) -> Optional[ast.expr]:
+    if call.args:
+        return call.args[0]
+    for keyword in call.keywords:
+        if keyword.arg == "dot_code":
+            return keyword.value
+    return None
+
+
+def _is_render_diagram(call: ast.Call) -> bool:
+    func = call.func
+    return (isinstance(func, ast.Name) and func.id == "render_diagram") or \
+        (isinstance(func, ast.Attribute) and func.attr == "render_diagram")
+
+
+def scan(paths: List[str]) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """
+    Find the render_diagram calls in the given modules.
+
+    Returns:
+        (static, dynamic): static is a list of (location, dot_code) for literal
+        sources, dynamic a list of (location, reason)
+    """
+    static, dynamic = [], []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+        rel_path = os.path.relpath(path, REPO_ROOT)
+        for node in ast.walk(tree):
+            if not (isinstance(node, ast.Call) and _is_render_diagram(node)):
+                continue
+            location = f"{rel_path}:{node.lineno}"
+            arg = _dot_argument(node)
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                static.append((location, arg.value))
+            elif isinstance(arg, ast.JoinedStr):
+                dynamic.append((location, "f-string"))
+            elif isinstance(arg, ast.Name):
+                dynamic.append((location, f"variable '{arg.id}'"))
+            else:
+                dynamic.append((location, "computed expression" if arg is not None else "no DOT argument"))
+    return static, dynamic
+
+
+def build(static: List[Tuple[str, str]], out_dir: str) -> Tuple[Dict[str, Dict], List[Tuple[str, str]]]:
+    """
+    Render the static diagrams into out_dir.
+
+    Returns:
+        (manifest, failures): manifest {hash: {"file", "sources"}} and a list
+        of (location, error) for sources dot rejected
+    """
+    manifest: Dict[str, Dict] = {}
+    failures = []
+    os.makedirs(out_dir, exist_ok=True)
+    svgs = get_pool().render_many([wrap_dot(dot_code) for _, dot_code in static])
+    for location, dot_code in static:
+        dot_source = wrap_dot(dot_code)
+        key = dot_hash(dot_source)
+        if key in manifest:
+            manifest[key]["sources"].append(location)
+            continue
+        svg = svgs[dot_source]
+        if isinstance(svg, RuntimeError):
+            failures.append((location, str(svg)))
+            continue
+        name = f"{dot_hash(svg)[:16]}.svg"
+        with open(os.path.join(out_dir, name), "w", encoding="utf-8") as f:
+            f.write(svg)
+        manifest[key] = {"file": name, "sources": [location]}
+
+    # Remove SVGs of diagrams that changed or no longer exist
+    current = {entry["file"] for entry in manifest.values()}
+    for path in glob.glob(os.path.join(out_dir, "*.svg")):
+        if os.path.basename(path) not in current:
+            os.remove(path)
+    with open(os.path.join(out_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False, sort_keys=True)
+        f.write("\n")
+    return manifest, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", help="modules to scan (default: chapters/*.py)")
+    parser.add_argument("--out", default=ASSETS_DIR, help="output directory for SVGs and manifest")
+    parser.add_argument("--check", action="store_true", help="only verify that the manifest is up to date")
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(glob.glob(os.path.join(REPO_ROOT, "chapters", "*.py")))
+    static, dynamic = scan(paths)
+    print(f"{len(static)} static and {len(dynamic)} dynamic render_diagram calls")
+    for location, reason in dynamic:
+        print(f"  dynamic: {location} ({reason})")
+
+    if args.check:
+        try:
+            with open(os.path.join(args.out, MANIFEST_NAME), encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        missing = [loc for loc, dot_code in static if dot_hash(wrap_dot(dot_code)) not in manifest]
+        for location in missing:
+            print(f"  not prebuilt: {location}")
+        sys.exit(1 if missing else 0)
+
+    if DOT_BINARY is None:
+        print("Graphviz 'dot' binary not found, install graphviz to prebuild diagrams")
+        sys.exit(2)
+
+    manifest, failures = build(static, args.out)
+    print(f"{len(manifest)} unique diagrams written to {os.path.relpath(args.out, REPO_ROOT)}")
+    for location, error in failures:
+        print(f"  failed: {location}: {error}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Questions Module
+
+Compiled form of the mock exam questions. exam_content turns every question
+dict of an exam module into a frozen, ``__slots__``-based Question once per
+process, with everything grading and rendering need precomputed:
+
+- correct options as an integer bitmask (bit i set = option i correct)
+- the target of each matching item as a tuple
+- the sorted outcome list offered for matching items
+- the text and image segments of the question (see asset_index)
+
+Answers are stored compactly as well (see Question.encode): a bitmask of the
+selected options for single and multi choice questions, a tuple of outcome ids
+(index into ``outcomes``, None = no match yet) for matching questions. Lists
+(selected indices or outcome labels) are the legacy form and still accepted.
+
+Grading an answer is then a single integer or tuple comparison. Questions keep
+the item access of the dicts (``q['id']``, ``q.get('hint', default)``).
+"""
+
+from types import MappingProxyType
+from typing import Any, Iterable, List, Mapping, Optional, Tuple, Union
+
+from infrastructure.asset_index import compile_segments
+
+QUESTION_TYPES = ("single", "multi", "matching")
+
+# Bitmask (single/multi) or tuple of outcome ids (matching)
+Answer = Union[int, Tuple[Optional[int], ...]]
+
+
+def answer_mask(indices: Iterable[int]) -> int:
+    """Encode selected option indices as a bitmask."""
+    mask = 0
+    for index in indices:
+        mask |= 1 << index
+    return mask
+
+
+def mask_indices(mask: int) -> Tuple[int, ...]:
+    """Decode a bitmask into the selected option indices, ascending."""
+    indices = []
+    index = 0
+    while mask:
+        if mask & 1:
+            indices.append(index)
+        mask >>= 1
+        index += 1
+    return tuple(indices)
+
+
+class Question:
+    """
+    A compiled, read-only exam question.
+
+    Usage:
+        q = Question.compile(raw_question_dict)
+        q.is_correct(0b101)  # options 0 and 2 selected
+    """
+
+    __slots__ = (
+        "id", "title", "section", "type", "question", "options", "hint", "explanation",
+        "segments", "labels", "correct_mask", "correct_indices", "targets", "outcomes",
+        "outcome_ids", "target_ids",
+    )
+
+    def __init__(self, **fields: Any):
+        for name in self.__slots__:
+            object.__setattr__(self, name, fields.get(name))
+
+    @classmethod
+    def compile(cls, raw: Mapping[str, Any], index: Mapping[str, str] = None) -> "Question":
+        """
+        Compile a question dict (keys id, title, question, options and optional
+        type, section, hint, explanation).
+
+        Raises:
+            ValueError: If the question type is unknown
+        """
+        q_type = raw.get("type", "single")
+        if q_type not in QUESTION_TYPES:
+            raise ValueError(f"Question {raw['id']}: unknown type {q_type!r}")
+        options = tuple((label, value) for label, value in raw["options"])
+
+        if q_type == "matching":
+            targets = tuple(target for _, target in options)
+            correct_mask, correct_indices = 0, ()
+            outcomes = tuple(sorted(set(targets)))
+            outcome_ids = {outcome: i for i, outcome in enumerate(outcomes)}
+            target_ids = tuple(outcome_ids[target] for target in targets)
+        else:
+            correct_indices = tuple(i for i, (_, correct) in enumerate(options) if correct)
+            correct_mask = answer_mask(correct_indices)
+            targets, outcomes, outcome_ids, target_ids = (), (), {}, ()
+
+        return cls(
+            id=raw["id"],
+            title=raw["title"],
+            section=raw.get("section"),
+            type=q_type,
+            question=raw["question"],
+            options=options,
+            hint=raw.get("hint"),
+            explanation=raw.get("explanation"),
+            segments=compile_segments(raw["question"], index),
+            labels=tuple(label for label, _ in options),
+            correct_mask=correct_mask,
+            correct_indices=correct_indices,
+            targets=targets,
+            outcomes=outcomes,
+            outcome_ids=MappingProxyType(outcome_ids),
+            target_ids=target_ids,
+        )
+
+    @property
+    def correct_answer(self) -> Tuple:
+        """Correct option indices, or the target matches for matching questions."""
+        return self.targets if self.type == "matching" else self.correct_indices
+
+    def encode(self, user_answer: Any) -> Answer:
+        """
+        Return the compact form of an answer (encoded answers pass through).
+
+        Args:
+            user_answer: Bitmask or outcome id tuple, or the legacy list of
+                selected indices / outcome labels (None entries = nothing
+                selected / no match)
+        """
+        if self.type == "matching":
+            if not isinstance(user_answer, list):
+                return user_answer or ()
+            return tuple(None if label is None else self.outcome_ids[label] for label in user_answer)
+        if not isinstance(user_answer, list):
+            return user_answer or 0
+        return answer_mask(index for index in user_answer if index is not None)
+
+    def decode(self, user_answer: Any) -> List:
+        """Return the legacy list form: selected option indices, or outcome labels (None = no match)."""
+        answer = self.encode(user_answer)
+        if self.type == "matching":
+            return [None if i is None else self.outcomes[i] for i in answer]
+        return list(mask_indices(answer))
+
+    def is_answered(self, user_answer: Any) -> bool:
+        """True if an option is selected (every item matched for matching questions)."""
+        answer = self.encode(user_answer)
+        if self.type == "matching":
+            return bool(answer) and None not in answer
+        return answer != 0
+
+    def is_correct(self, user_answer: Any) -> bool:
+        """Grade an answer (compact or legacy form) with one comparison."""
+        answer = self.encode(user_answer)
+        if self.type == "matching":
+            return answer == self.target_ids
+        if self.type == "single":
+            # A radio selects exactly one option
+            return answer & self.correct_mask != 0
+        return answer == self.correct_mask
+
+    # Dict-style access, so code written against question dicts keeps working
+    def __getitem__(self, name: str) -> Any:
+        if name not in self.__slots__:
+            raise KeyError(name)
+        value = getattr(self, name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__slots__ and getattr(self, name) is not None
+
+    def get(self, name: str, default: Optional[Any] = None) -> Any:
+        value = getattr(self, name, None) if name in self.__slots__ else None
+        return default if value is None else value
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"Question is read-only (tried to set {name!r})")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"Question is read-only (tried to delete {name!r})")
+
+    def __repr__(self) -> str:
+        return f"Question(id={self.id!r}, type={self.type!r}, title={self.title!r})"
@@ -0,0 +1,208 @@
+"""
+Session State Module
+
+Per-page namespaces for ``st.session_state``. Every key a page creates (quiz
+scores, game state, exam answers, widget values) is attributed to that page,
+and the state of pages a learner has not visited for ``LERNAPP_STATE_TTL``
+seconds (default: 30 minutes) is released on the next rerun, so long-lived
+browser tabs do not grow server memory without bound.
+
+With the admin page enabled (``LERNAPP_ADMIN=1``), each rerun also publishes
+a memory estimate of the session to a process-wide table, shown in the admin
+view; without it the estimate (a walk over all of session state) is skipped.
+Keys starting with ``_`` belong to the infrastructure and are never evicted.
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+IDLE_TTL = float(os.environ.get("LERNAPP_STATE_TTL", "1800"))
+ADMIN_ENABLED = os.environ.get("LERNAPP_ADMIN") == "1"
+
+# Session state key holding {page: {"keys": set, "last_seen": timestamp}}
+STATE_PAGES = "_state_pages"
+
+# Process-wide memory estimates: {session_id: stats}
+_sessions: Dict[str, Dict[str, Any]] = {}
+_sessions_lock = threading.Lock()
+
+
+def estimate_size(obj: Any, _seen: set = None) -> int:
+    """
+    Estimate the memory held by an object, following containers and instance
+    attributes (shared objects are counted once).
+
+    Args:
+        obj: Object to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _seen) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += estimate_size(vars(obj), _seen)
+    return size
+
+
+@contextmanager
+def page_namespace(page: str):
+    """
+    Attribute the session state created while running ``page`` to its
+    namespace and release the state of idle pages first.
+
+    Usage:
+        with page_namespace(selected.url_path or "home"):
+            selected.run()
+
+    Args:
+        page: Page id (url path) of the page being run
+    """
+    evict_idle_pages(current=page)
+    try:
+        yield
+    finally:
+        pages = st.session_state.setdefault(STATE_PAGES, {})
+        namespace = pages.setdefault(page, {"keys": set(), "last_seen": 0.0})
+        owned = set().union(*(ns["keys"] for ns in pages.values()))
+        namespace["keys"] |= {key for key in st.session_state.keys() if key not in owned and not key.startswith("_")}
+        namespace["last_seen"] = time.time()
+        _publish_stats(pages)
+
+
+def evict_idle_pages(current: str, ttl: float = None) -> List[str]:
+    """
+    Drop the state of pages that have not been visited for ``ttl`` seconds.
+
+    Args:
+        current: Page about to run (never evicted)
+        ttl: Idle time in seconds (default: IDLE_TTL)
+
+    Returns:
+        List of evicted page ids
+    """
+    ttl = IDLE_TTL if ttl is None else ttl
+    pages = st.session_state.get(STATE_PAGES, {})
+    cutoff = time.time() - ttl
+    evicted = [page for page, ns in pages.items() if page != current and ns["last_seen"] < cutoff]
+    for page in evicted:
+        for key in pages.pop(page)["keys"]:
+            st.session_state.pop(key, None)
+    return evicted
+
+
+def _publish_stats(pages: Dict[str, Dict]):
+    # Only the admin view reads the estimates
+    if not ADMIN_ENABLED:
+        return
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return
+
+    sizes = {key: estimate_size(st.session_state[key]) for key in st.session_state.keys()}
+    now = time.time()
+    stats = {
+        "bytes": sum(sizes.values()),
+        "keys": len(sizes),
+        "pages": {page: sum(sizes.get(key, 0) for key in ns["keys"]) for page, ns in pages.items()},
+        "updated": now,
+    }
+    with _sessions_lock:
+        _sessions[ctx.session_id] = stats
+        # Sessions that stopped rerunning are most likely gone
+        for session_id in [sid for sid, s in _sessions.items() if s["updated"] < now - IDLE_TTL]:
+            del _sessions[session_id]
+
+
+def biggest_sessions(limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    Return the sessions with the largest estimated session state.
+
+    Returns:
+        List of stats dicts (session_id, bytes, keys, pages, updated), largest first
+    """
+    with _sessions_lock:
+        rows = [dict(stats, session_id=sid) for sid, stats in _sessions.items()]
+    return sorted(rows, key=lambda row: row["bytes"], reverse=True)[:limit]
+
+
+def render_admin_view(limit: int = 20):
+    """Admin page: process-wide session memory and the biggest sessions."""
+    st.title("🧠 Session-Speicher")
+    rows = biggest_sessions(limit=len(_sessions))
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Aktive Sessions", len(rows))
+    col2.metric("Geschätzter Speicher", f"{sum(r['bytes'] for r in rows) / 1024:.1f} KB")
+    col3.metric("Idle-Eviction nach", f"{IDLE_TTL / 60:.0f} min")
+
+    st.subheader(f"Top {limit} Sessions")
+    now = time.time()
+    st.dataframe([
+        {
+            "Session": row["session_id"][:8],
+            "KB": round(row["bytes"] / 1024, 1),
+            "Keys": row["keys"],
+            "Seiten (KB)": ", ".join(
+                f"{page} {size / 1024:.1f}"
+                for page, size in sorted(row["pages"].items(), key=lambda item: item[1], reverse=True)
+            ),
+            "Letzter Rerun vor (s)": round(now - row["updated"]),
+        }
+        for row in rows[:limit]
+    ], use_container_width=True, hide_index=True)
+
+    # Imported here, it pulls in the diagram module only for admins
+    from infrastructure.attempt_store import get_attempt_store
+    from infrastructure.dot_pool import pool_metrics
+    from infrastructure.image_store import get_store
+    metrics = pool_metrics()
+    if metrics is not None:
+        st.subheader("Diagramm-Renderer")
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Warteschlange", metrics["queue_depth"])
+        col2.metric("Batches in Arbeit", f"{metrics['in_flight']} / {metrics['workers']}")
+        col3.metric("Latenz p50 / p95", f"{metrics.get('p50_ms', 0):.0f} / {metrics.get('p95_ms', 0):.0f} ms")
+        col4.metric("Ø Diagramme pro Batch", f"{metrics.get('avg_batch', 0):.1f}")
+        st.caption(
+            f"{metrics['completed']} gerendert, {metrics['failed']} fehlgeschlagen, "
+            f"{metrics['restarts']} Neustarts von dot"
+        )
+
+    image_stats = get_store().stats()
+    st.subheader("Bild-Speicher")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Bilder", image_stats["images"])
+    col2.metric("Belegt", f"{image_stats['resident_bytes'] / 1024:.0f} KB",
+                help=f"Obergrenze {image_stats['max_bytes'] / 1024 / 1024:.0f} MB (LERNAPP_IMAGE_STORE_MB)")
+    lookups = image_stats["hits"] + image_stats["misses"]
+    col3.metric("Trefferquote", f"{image_stats['hits'] / lookups:.0%}" if lookups else "–")
+    st.caption(f"{image_stats['hits']} Treffer, {image_stats['misses']} Fehlgriffe, "
+               f"{image_stats['evictions']} verdrängt")
+
+    store = get_attempt_store()
+    if store is not None:
+        attempt_stats = store.stats()
+        st.subheader("Versuchs-Speicher")
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Gespeichert", attempt_stats["written"], help=store.path)
+        col2.metric("Warteschlange", attempt_stats["queue_depth"])
+        col3.metric("Ø Versuche pro Batch", f"{attempt_stats.get('avg_batch', 0):.1f}")
+        st.caption(f"{attempt_stats['submitted']} abgegeben, {attempt_stats['failed']} fehlgeschlagen, "
+                   f"{attempt_stats['batches']} Batches")
@@ -0,0 +1,44 @@
+"""
+Static Assets Module
+
+Build outputs (exam image derivatives, prebuilt diagram SVGs) live below
+``static/`` with content-hashed file names and are served by Streamlit's
+static file route (``server.enableStaticServing``, see .streamlit/config.toml)
+at ``app/static/...``. Pages reference them by URL, so browsers cache them
+across reruns and visits instead of receiving them through the per-session
+media endpoint or inline in every rerun.
+
+Streamlit 1.56+ serves static files with their real content type; older
+versions send everything but a few image types (no ``.svg``) as text/plain
+with nosniff, which is why requirements.txt asks for 1.56.
+
+``streamlit run`` answers static files with ETag/Last-Modified, so a returning
+browser revalidates without downloading. For immutable cache headers serve the
+app through the ASGI entry point:
+    uvicorn infrastructure.asgi:app --port 8501
+"""
+
+import os
+from typing import Optional
+
+from streamlit import config
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+STATIC_URL = "app/static"
+
+
+def static_url(path: str) -> Optional[str]:
+    """
+    Return the URL of a file below STATIC_DIR (the caller knows it exists,
+    e.g. from a build manifest).
+
+    Returns:
+        Relative URL (``app/static/images/x.webp``), or None if static serving
+        is disabled or the file is not a static asset
+    """
+    if not config.get_option("server.enableStaticServing"):
+        return None
+    relative = os.path.relpath(os.path.abspath(path), STATIC_DIR)
+    if relative.startswith(os.pardir):
+        return None
+    return f"{STATIC_URL}/{relative.replace(os.sep, '/')}"
@@ -0,0 +1,175 @@
+"""
+Timing Module
+
+Lightweight per-rerun timing of named blocks (chapter tabs, diagrams, exam
+rendering). Enable it with the environment variable ``LERNAPP_TIMING=1``; each
+rerun then records wall time and call count per block, shows them in a sidebar
+debug panel and appends them as one JSON line to ``LERNAPP_TIMING_LOG``
+(default: ``timing_log.jsonl``). A fragment rerun (see timed_fragment) gets a
+line of its own, marked with the fragment name.
+
+When disabled, ``timed()`` returns a shared no-op object and decorated
+functions are returned unchanged, so instrumentation costs nearly nothing.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import ContextDecorator
+from typing import Callable, Dict, List, Optional
+
+import streamlit as st
+
+ENABLED = os.environ.get("LERNAPP_TIMING") == "1"
+LOG_PATH = os.environ.get("LERNAPP_TIMING_LOG", "timing_log.jsonl")
+
+# Session state key holding the records of the current rerun
+STATE_TIMING = "_timing"
+
+_log_lock = threading.Lock()
+
+
+class _NullTimer:
+    """No-op timer used while timing is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __call__(self, func):
+        return func
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer(ContextDecorator):
+    """Records the wall time of a block under its name."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._start = 0.0
+
+    def _recreate_cm(self):
+        # Decorated functions may run concurrently in several sessions
+        return _Timer(self.name)
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        _record(self.name, time.perf_counter() - self._start)
+        return False
+
+
+def timed(name: str):
+    """
+    Time a named block, as context manager or decorator.
+
+    Usage:
+        with timed("tab:pb_tabs:🔁 Schleifen"):  # tab:<tabs key>:<label>
+            ...
+
+        @timed("render_diagram")
+        def render_diagram(...):
+            ...
+
+    Args:
+        name: Block name; repeated calls in one rerun are summed and counted
+    """
+    if not ENABLED:
+        return _NULL_TIMER
+    return _Timer(name)
+
+
+def timed_fragment(func: Callable) -> Callable:
+    """
+    Time a fragment body. Inside a full rerun it counts as a block of that
+    rerun; a rerun of the fragment alone is recorded and logged on its own
+    (without the sidebar panel, fragments cannot write to the sidebar).
+
+    Args:
+        func: Fragment body, wrapped before it is passed to st.fragment
+    """
+    if not ENABLED:
+        return func
+    name = f"fragment:{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        run = st.session_state.get(STATE_TIMING)
+        if run is not None and run["open"]:
+            with _Timer(name):
+                return func(*args, **kwargs)
+        begin_rerun(run["page"] if run else "", fragment=name)
+        try:
+            with _Timer(name):
+                return func(*args, **kwargs)
+        finally:
+            finish_rerun(panel=False)
+
+    return wrapper
+
+
+def _record(name: str, seconds: float):
+    run = st.session_state.get(STATE_TIMING)
+    if run is None or not run["open"]:
+        return
+    block = run["blocks"].setdefault(name, {"ms": 0.0, "calls": 0})
+    block["ms"] += seconds * 1000
+    block["calls"] += 1
+
+
+def begin_rerun(page: str, fragment: Optional[str] = None):
+    """Start collecting timings for a new rerun of ``page`` (or of one fragment on it)."""
+    if not ENABLED:
+        return
+    st.session_state[STATE_TIMING] = {
+        "page": page, "fragment": fragment, "start": time.perf_counter(), "blocks": {}, "open": True,
+    }
+
+
+def finish_rerun(panel: bool = True):
+    """Close the current rerun: append it to the JSONL log and show the sidebar panel."""
+    if not ENABLED:
+        return
+    run = st.session_state.get(STATE_TIMING)
+    if run is None or not run["open"]:
+        return
+    # Closed records take no further timings (see timed_fragment)
+    run["open"] = False
+
+    total_ms = (time.perf_counter() - run["start"]) * 1000
+    blocks = sorted(run["blocks"].items(), key=lambda item: item[1]["ms"], reverse=True)
+    entry = {
+        "ts": time.time(),
+        "page": run["page"],
+        "total_ms": round(total_ms, 3),
+        "blocks": {name: {"ms": round(b["ms"], 3), "calls": b["calls"]} for name, b in blocks},
+    }
+    if run["fragment"]:
+        entry["fragment"] = run["fragment"]
+    _append_log(entry)
+    if panel:
+        _render_panel(total_ms, blocks)
+
+
+def _append_log(entry: Dict):
+    line = json.dumps(entry, ensure_ascii=False)
+    with _log_lock:
+        with open(LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def _render_panel(total_ms: float, blocks: List):
+    with st.sidebar.expander("⏱️ Rerun-Timing", expanded=False):
+        st.caption(f"Gesamter Rerun: **{total_ms:.1f} ms**")
+        rows = ["| Block | ms | Aufrufe |", "|---|---:|---:|"]
+        for name, b in blocks:
+            rows.append(f"| {name} | {b['ms']:.1f} | {b['calls']} |")
+        st.markdown("\n".join(rows))
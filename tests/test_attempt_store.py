@@ -0,0 +1,113 @@
+"""
+AttemptStore against a database in tmp_path: the background writer and its
+batches, flush and close, the answer packing and the latest-attempt queries.
+"""
+
+import threading
+
+import pytest
+
+from infrastructure.attempt_store import Attempt, AttemptStore, pack_answers, unpack_answers
+
+TIMEOUT = 10
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AttemptStore(str(tmp_path / "attempts.sqlite3"))
+    yield store
+    store.close(TIMEOUT)
+
+
+def attempt(learner="alice", exam="mock1", correct=1, submitted_at=0.0, answers=None):
+    return Attempt(learner, exam, correct, 5, answers or {}, "v1", submitted_at)
+
+
+def test_pack_answers_round_trip():
+    answers = {1: 0b101, 2: 0, 3: (1, None, 0), "q4": 0b1}
+    packed = pack_answers(answers)
+    assert unpack_answers(packed) == answers
+    # Independent of the dict order
+    assert pack_answers(dict(reversed(answers.items()))) == packed
+
+
+def test_submit_writes_in_the_background(store):
+    store.submit(attempt(answers={1: 0b10, 2: (0, 1)}))
+    assert store.flush(TIMEOUT)
+
+    latest = store.latest("alice", "mock1")
+    assert (latest.learner, latest.exam, latest.correct, latest.total) == ("alice", "mock1", 1, 5)
+    assert dict(latest.answers) == {1: 0b10, 2: (0, 1)}
+    assert latest.exam_version == "v1"
+    assert latest.submitted_at > 0  # stamped on submit
+    assert store.stats()["written"] == 1
+    assert store.latest("bob", "mock1") is None
+
+
+def test_latest_is_the_most_recent_attempt(store):
+    for correct, submitted_at in ((2, 20.0), (3, 30.0), (1, 10.0)):
+        store.submit(attempt(correct=correct, submitted_at=submitted_at))
+    store.submit(attempt(exam="mock2", correct=5, submitted_at=40.0))
+    store.flush(TIMEOUT)
+
+    assert store.latest("alice", "mock1").correct == 3
+
+
+def test_latest_per_learner_takes_the_row_of_the_maximum(store):
+    # The rows of the latest attempts are neither first nor last inserted,
+    # so correct/total can only come from the row holding MAX(submitted_at)
+    for learner, correct, submitted_at in (
+        ("alice", 1, 10.0), ("alice", 4, 30.0), ("alice", 2, 20.0),
+        ("bob", 3, 50.0), ("bob", 0, 5.0),
+    ):
+        store.submit(attempt(learner, correct=correct, submitted_at=submitted_at))
+    store.submit(attempt("carol", exam="mock2", submitted_at=60.0))
+    store.flush(TIMEOUT)
+
+    latest = {a.learner: (a.correct, a.submitted_at) for a in store.latest_per_learner("mock1")}
+    assert latest == {"alice": (4, 30.0), "bob": (3, 50.0)}
+
+
+def test_close_writes_what_is_still_queued(tmp_path):
+    path = str(tmp_path / "attempts.sqlite3")
+    store = AttemptStore(path)
+    for n in range(50):
+        store.submit(attempt(f"learner{n}", submitted_at=float(n + 1)))
+    assert store.close(TIMEOUT)
+    assert store.stats()["written"] == 50
+
+    reopened = AttemptStore(path)
+    try:
+        assert len(reopened.latest_per_learner("mock1")) == 50
+    finally:
+        reopened.close(TIMEOUT)
+
+
+def test_writer_batches_up_to_batch_size(tmp_path):
+    store = AttemptStore(str(tmp_path / "attempts.sqlite3"), batch_size=3)
+    writing, release = threading.Event(), threading.Event()
+    batches = []
+    write = store._write
+
+    def held_write(conn, attempts):
+        batches.append(len(attempts))
+        writing.set()
+        release.wait(TIMEOUT)
+        write(conn, attempts)
+
+    store._write = held_write
+    try:
+        store.submit(attempt(submitted_at=1.0))
+        assert writing.wait(TIMEOUT)
+        # Queued while the writer is busy, written in batches of at most 3
+        for n in range(7):
+            store.submit(attempt(submitted_at=float(n + 2)))
+        release.set()
+        assert store.flush(TIMEOUT)
+    finally:
+        release.set()
+        store.close(TIMEOUT)
+
+    assert batches == [1, 3, 3, 1]
+    stats = store.stats()
+    assert (stats["submitted"], stats["written"], stats["batches"], stats["avg_batch"]) == (8, 8, 4, 2.0)
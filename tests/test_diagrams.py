@@ -0,0 +1,29 @@
+"""
+style_overrides: node styles appended to a DOT graph for the browser path.
+"""
+
+from infrastructure.diagrams import HIGHLIGHT_NODE, style_overrides
+
+GRAPH = 'digraph {\n    A -> B;\n}\n'
+
+
+def test_appends_node_styles_and_skips_edges():
+    dot = style_overrides(GRAPH, {"A": HIGHLIGHT_NODE, "A->B": {"color": "red"}})
+
+    assert dot == (
+        'digraph {\n    A -> B;\n'
+        '    "A" [fillcolor="#fff59d", color="#f9a825", penwidth="2.5"];\n}\n'
+    )
+    assert style_overrides(GRAPH, {"A->B": {"color": "red"}}) == GRAPH
+
+
+def test_quotes_and_backslashes_are_escaped():
+    dot = style_overrides(GRAPH, {'A" [shape=box': {"label": 'say "hi" \\'}})
+
+    assert '    "A\\" [shape=box" [label="say \\"hi\\" \\\\"];\n}' in dot
+
+
+def test_attribute_names_that_are_not_identifiers_are_dropped():
+    dot = style_overrides(GRAPH, {"A": {"color": "red", "x] B [shape": "box"}})
+
+    assert '    "A" [color="red"];\n}' in dot
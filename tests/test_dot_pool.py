@@ -0,0 +1,145 @@
+"""
+DotWorkerPool against a fake ``dot`` binary that lays out graphs like the
+real one (one SVG per graph read from stdin) but fails, hangs or writes
+unreadable output on request, so the error paths run without Graphviz.
+"""
+
+import os
+import stat
+import sys
+import time
+
+import pytest
+
+import infrastructure.diagrams as diagrams
+import infrastructure.dot_pool as dot_pool
+from infrastructure.diagrams import DotRejected
+from infrastructure.dot_pool import DotWorkerPool
+
+FAKE_DOT = """#!{python}
+import os, sys, time
+# Marks that a HANGONCE graph already hung once
+hung = os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), "hung")
+buf, depth = "", 0
+while True:
+    ch = sys.stdin.read(1)
+    if not ch:
+        break
+    buf += ch
+    if ch == "{{":
+        depth += 1
+    elif ch == "}}":
+        depth -= 1
+        if depth == 0:
+            if "SYNTAXERR" in buf:
+                sys.stderr.write("Error: syntax error in line 1\\n")
+                sys.exit(1)
+            if "HANGONCE" in buf:
+                if not os.path.exists(hung):
+                    open(hung, "w").close()
+                    time.sleep(60)
+            elif "HANG" in buf:
+                time.sleep(60)
+            if "BADBYTES" in buf:
+                sys.stdout.buffer.write(b"<svg>\\xff\\xfe</svg>\\n")
+            else:
+                sys.stdout.write('<?xml version="1.0"?>\\n<svg><text>%d</text></svg>\\n' % len(buf))
+            sys.stdout.flush()
+            buf = ""
+"""
+
+TIMEOUT = 1.0
+
+
+@pytest.fixture
+def fake_dot(tmp_path):
+    path = tmp_path / "dot"
+    path.write_text(FAKE_DOT.format(python=sys.executable))
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
+
+
+@pytest.fixture
+def pool(fake_dot):
+    return DotWorkerPool(workers=1, batch_size=8, timeout=TIMEOUT, binary=fake_dot, retry_budget=2 * TIMEOUT)
+
+
+def graph(name: str) -> str:
+    return f"digraph {{ {name} }}"
+
+
+def test_renders_batches(pool):
+    results = pool.render_many([graph(f"n{i}") for i in range(10)])
+    assert all(isinstance(svg, str) and svg.startswith("<svg") for svg in results.values())
+    assert pool.metrics()["failed"] == 0
+
+
+def test_syntax_error_fails_only_its_graph(pool):
+    results = pool.render_many([graph("a"), graph("SYNTAXERR"), graph("b")])
+    assert isinstance(results[graph("SYNTAXERR")], DotRejected)
+    assert "syntax error" in str(results[graph("SYNTAXERR")])
+    assert isinstance(results[graph("a")], str) and isinstance(results[graph("b")], str)
+
+
+def test_hanging_dot_times_out_within_bounds(pool):
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="timed out|no result") as error:
+        pool.render(graph("HANG"))
+    assert not isinstance(error.value, DotRejected)
+    assert time.monotonic() - start < pool.wait_timeout + 1
+    # The worker survived and renders again
+    assert pool.render(graph("after")).startswith("<svg")
+
+
+def test_hanging_graph_in_batch_is_bounded(pool):
+    sources = [graph(f"n{i}") for i in range(3)] + [graph("HANG")] + [graph(f"m{i}") for i in range(3)]
+    start = time.monotonic()
+    results = pool.render_many(sources)
+    # One batch timeout plus the retry budget, not a timeout per graph
+    assert time.monotonic() - start < TIMEOUT + pool.retry_budget + 1
+    assert isinstance(results[graph("HANG")], RuntimeError)
+    assert all(isinstance(results[source], (str, RuntimeError)) for source in sources)
+
+
+def test_unreadable_output_does_not_kill_worker(pool):
+    with pytest.raises(RuntimeError):
+        pool.render(graph("BADBYTES"))
+    results = pool.render_many([graph("x"), graph("BADBYTES"), graph("y")])
+    assert isinstance(results[graph("BADBYTES")], RuntimeError)
+    assert isinstance(results[graph("x")], str) and isinstance(results[graph("y")], str)
+    assert pool.render(graph("z")).startswith("<svg")
+
+
+def test_missing_binary_fails_instead_of_hanging(tmp_path):
+    pool = DotWorkerPool(workers=1, timeout=TIMEOUT, binary=os.path.join(str(tmp_path), "missing"))
+    with pytest.raises(RuntimeError):
+        pool.render(graph("a"))
+
+
+@pytest.fixture
+def server_rendering(pool, tmp_path, monkeypatch):
+    """render_svg on the fake pool with empty caches."""
+    monkeypatch.setattr(diagrams, "CLIENT_ONLY", False)
+    monkeypatch.setattr(diagrams, "SERVER_RENDERING", True)
+    monkeypatch.setattr(diagrams, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(diagrams, "_svg_cache", {})
+    monkeypatch.setattr(diagrams, "_failed", set())
+    monkeypatch.setattr(dot_pool, "_pool", pool)
+    (tmp_path / "cache").mkdir()
+    return pool
+
+
+def test_timed_out_graph_renders_on_a_later_call(server_rendering):
+    source = graph("HANGONCE")
+    assert diagrams.render_svg(source) is None
+    assert diagrams.dot_hash(source) not in diagrams._failed
+    assert diagrams.render_svg(source).startswith("<svg")
+
+
+def test_rejected_graph_is_not_retried(server_rendering):
+    source = graph("SYNTAXERR")
+    assert diagrams.render_svg(source) is None
+    assert diagrams.dot_hash(source) in diagrams._failed
+    failed = server_rendering.metrics()["failed"]
+    assert diagrams.render_svg(source) is None
+    assert server_rendering.metrics()["failed"] == failed
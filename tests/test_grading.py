@@ -0,0 +1,116 @@
+"""
+grade_exam: grading an answer sheet into a GradingResult, its section scores
+and the memo of results by exam version and answers.
+"""
+
+from collections import OrderedDict
+
+import pytest
+
+import infrastructure.mock_exam_helper as helper
+from infrastructure.content_cache import exam_content
+from infrastructure.mock_exam_helper import SectionScore, grade_exam
+from infrastructure.questions import Question
+
+
+def make_exam(questions, sections, version="v1"):
+    return {
+        "version": version,
+        "sections": sections,
+        "questions": tuple(Question.compile(q) for q in questions),
+    }
+
+
+def question(qid, section=None, correct=1):
+    raw = {
+        "id": qid,
+        "title": f"Q{qid}",
+        "question": "?",
+        "options": [(label, i == correct) for i, label in enumerate("abc")],
+    }
+    if section is not None:
+        raw["section"] = section
+    return raw
+
+
+@pytest.fixture(autouse=True)
+def grading_cache(monkeypatch):
+    cache = OrderedDict()
+    monkeypatch.setattr(helper, "_grading_cache", cache)
+    return cache
+
+
+def test_grades_answers():
+    exam = make_exam([question(1), question(2), question(3)], {})
+    result = grade_exam(exam, {1: 0b010, 2: 0b001})
+
+    assert (result.correct_count, result.total_count, result.percentage) == (1, 3, 33)
+    assert result.questions[1].correct
+    assert result.questions[2].answered and not result.questions[2].correct
+    assert not result.questions[3].answered
+
+
+def test_only_questions_naming_a_section_are_scored_in_it():
+    exam = make_exam(
+        [question(1, "Part A"), question(2, "Part B"), question(3), question(4, "Other")],
+        {"Part A": (1, 2), "Part B": (3, 4)},
+    )
+    result = grade_exam(exam, {1: 0b010, 2: 0b010, 3: 0b010, 4: 0b010})
+
+    # Questions 3 and 4 fall into Part B's id range but do not name it
+    assert result.sections == (SectionScore("Part A", 1, 1), SectionScore("Part B", 1, 1))
+    assert result.questions[3].section is None
+    assert result.questions[4].section is None
+    assert result.correct_count == 4
+
+
+def test_mock1_questions_outside_its_sections_are_not_scored():
+    exam = exam_content("chapters.mock1")
+    answers = {q.id: q.target_ids if q.type == "matching" else q.correct_mask for q in exam["questions"]}
+    result = grade_exam(exam, answers)
+
+    assert result.correct_count == result.total_count
+    for score in result.sections:
+        named = [q for q in exam["questions"] if q.get("section") == score.name]
+        assert (score.correct, score.total) == (len(named), len(named))
+
+
+def test_memo_returns_the_same_result_for_the_same_sheet(grading_cache):
+    exam = make_exam([question(1), question(2)], {})
+    first = grade_exam(exam, {1: 0b010, 2: 0b001})
+    # Same answers in another dict order: same key
+    assert grade_exam(exam, {2: 0b001, 1: 0b010}) is first
+    assert len(grading_cache) == 1
+
+
+def test_memo_key_changes_with_answers_and_content(grading_cache):
+    exam = make_exam([question(1), question(2)], {})
+    result = grade_exam(exam, {1: 0b010})
+
+    changed_answer = grade_exam(exam, {1: 0b001})
+    assert changed_answer is not result and not changed_answer.questions[1].correct
+    more_answers = grade_exam(exam, {1: 0b010, 2: 0b010})
+    assert more_answers.correct_count == 2
+
+    # New content (another correct option) comes with a new exam version
+    edited = make_exam([question(1, correct=0), question(2)], {}, version="v2")
+    regraded = grade_exam(edited, {1: 0b010})
+    assert not regraded.questions[1].correct
+    assert len(grading_cache) == 4
+    assert {version for version, _ in grading_cache} == {"v1", "v2"}
+
+
+def test_memo_is_an_lru_of_256_results(grading_cache):
+    exam = make_exam([question(1)], {})
+    first = grade_exam(exam, {1: 0b001})
+    for n in range(2, helper.GRADING_CACHE_SIZE + 1):
+        grade_exam(exam, {n: 0b001})
+    assert len(grading_cache) == helper.GRADING_CACHE_SIZE
+
+    # A hit moves the first sheet to the end, the next new sheet evicts the second
+    assert grade_exam(exam, {1: 0b001}) is first
+    grade_exam(exam, {"new": 0b001})
+    assert len(grading_cache) == helper.GRADING_CACHE_SIZE
+    assert grade_exam(exam, {1: 0b001}) is first
+    second_key = ("v1", helper._answers_hash({2: 0b001}))
+    assert second_key not in grading_cache
@@ -0,0 +1,135 @@
+"""
+Question: compiling question dicts, the compact answer forms (bitmask for
+single/multi choice, outcome id tuple for matching) and grading them.
+"""
+
+import pytest
+
+from infrastructure.questions import Question, answer_mask, mask_indices
+
+SINGLE = {
+    "id": 1,
+    "title": "Single",
+    "question": "Which one?",
+    "options": [("a", False), ("b", True), ("c", False)],
+}
+MULTI = {
+    "id": 2,
+    "title": "Multi",
+    "type": "multi",
+    "question": "Which ones?",
+    "options": [("a", True), ("b", False), ("c", True), ("d", False)],
+}
+MATCHING = {
+    "id": 3,
+    "title": "Matching",
+    "type": "matching",
+    "question": "Match them",
+    "options": [("x", "Typ B"), ("y", "Typ A"), ("z", "Typ B")],
+}
+
+
+@pytest.fixture
+def single():
+    return Question.compile(SINGLE)
+
+
+@pytest.fixture
+def multi():
+    return Question.compile(MULTI)
+
+
+@pytest.fixture
+def matching():
+    return Question.compile(MATCHING)
+
+
+def test_compile_precomputes_the_answer_keys(single, multi, matching):
+    assert (single.correct_mask, single.correct_indices) == (0b010, (1,))
+    assert (multi.correct_mask, multi.correct_indices) == (0b101, (0, 2))
+    assert matching.outcomes == ("Typ A", "Typ B")
+    assert matching.target_ids == (1, 0, 1)
+    assert matching.correct_answer == ("Typ B", "Typ A", "Typ B")
+
+
+def test_compile_rejects_unknown_types():
+    with pytest.raises(ValueError, match="unknown type"):
+        Question.compile(dict(SINGLE, type="essay"))
+
+
+def test_mask_round_trip():
+    for indices in [(), (0,), (1, 3), (0, 1, 2, 5)]:
+        assert mask_indices(answer_mask(indices)) == indices
+
+
+def test_single_answer_round_trip(single):
+    assert single.encode([1]) == 0b010
+    assert single.encode(0b010) == 0b010  # encoded answers pass through
+    assert single.decode(0b010) == [1]
+    assert single.decode(single.encode([2])) == [2]
+    assert single.is_correct([1]) and single.is_correct(0b010)
+    assert not single.is_correct([0])
+
+
+def test_multi_answers_are_bitmasks(multi):
+    assert multi.encode([2, 0]) == 0b101
+    assert multi.decode(0b101) == [0, 2]
+    assert multi.is_correct([0, 2]) and multi.is_correct(0b101)
+    # All correct options and nothing else
+    assert not multi.is_correct([0])
+    assert not multi.is_correct([0, 1, 2])
+
+
+def test_matching_answers_are_outcome_id_tuples(matching):
+    legacy = ["Typ B", "Typ A", "Typ B"]
+    assert matching.encode(legacy) == (1, 0, 1)
+    assert matching.encode((1, 0, 1)) == (1, 0, 1)
+    assert matching.decode((1, 0, 1)) == legacy
+    assert matching.is_correct(legacy) and matching.is_correct((1, 0, 1))
+    assert not matching.is_correct((0, 0, 1))
+
+
+def test_unanswered(single, multi, matching):
+    for question in (single, multi):
+        for empty in (None, 0, [], [None]):
+            assert question.encode(empty) == 0
+            assert not question.is_answered(empty)
+            assert not question.is_correct(empty)
+        assert question.decode(None) == []
+
+    assert matching.encode(None) == ()
+    assert not matching.is_answered(None)
+    assert not matching.is_correct(None)
+    # Partly matched: None marks the items without a match
+    partial = ["Typ B", None, "Typ B"]
+    assert matching.encode(partial) == (1, None, 1)
+    assert matching.decode((1, None, 1)) == partial
+    assert not matching.is_answered(partial)
+    assert not matching.is_correct(partial)
+    assert matching.is_answered((1, 0, 1))
+
+
+def test_out_of_range_answers_are_wrong(single, multi, matching):
+    # Option indices past the last option never grade as correct
+    assert single.decode([7]) == [7]
+    assert not single.is_correct([7])
+    assert not multi.is_correct([0, 2, 7])
+    # Wrong length or an outcome id that does not exist
+    assert not matching.is_correct((1, 0))
+    assert not matching.is_correct((1, 0, 1, 1))
+    assert not matching.is_correct((1, 5, 1))
+
+
+def test_unknown_matching_label_raises(matching):
+    with pytest.raises(KeyError):
+        matching.encode(["Typ C", "Typ A", "Typ B"])
+
+
+def test_questions_are_read_only_with_dict_access(single):
+    assert single["id"] == 1
+    assert single.get("hint", "none") == "none"
+    assert "hint" not in single
+    with pytest.raises(KeyError):
+        single["hint"]
+    with pytest.raises(AttributeError):
+        single.title = "changed"